@@ -0,0 +1,322 @@
+"""A tiny local stand-in for the OpenAI and Anthropic HTTP APIs.
+
+Used by the benchmarks and the offline tests, so that real SDK clients (and
+their connection pools) can be exercised without touching the network.
+"""
+
+import copy
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_events(self, events: List[Dict[str, Any]], named: bool) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        lines = []
+        for event in events:
+            if named:
+                lines.append(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n")
+            else:
+                lines.append(f"data: {json.dumps(event)}\n\n")
+        if not named:
+            lines.append("data: [DONE]\n\n")
+
+        for line in lines:
+            data = line.encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _authorized(self) -> bool:
+        api_key = self.server.stub.api_key
+        if api_key is None:
+            return True
+
+        supplied = self.headers.get("x-api-key") or self.headers.get(
+            "Authorization", ""
+        ).removeprefix("Bearer ")
+        if supplied == api_key:
+            return True
+
+        error = {"type": "authentication_error", "message": "invalid api key"}
+        self._send_json({"type": "error", "error": error}, status=401)
+        return False
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub.record(self.path, None, dict(self.headers), self.client_address)
+
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if self._authorized():
+            self._send_json(
+                {"object": "list", "data": [{"id": "stub", "object": "model"}]}
+            )
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        stub = self.server.stub
+        stub.record(self.path, body, dict(self.headers), self.client_address)
+
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if not self._authorized():
+            return
+
+        text = stub.reply(body) if callable(stub.reply) else stub.reply
+
+        if self.path.endswith("/chat/completions"):
+            self._chat_completion(body, text)
+        elif self.path.endswith("/messages"):
+            self._message(body, text)
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def _chat_completion(self, body: Dict[str, Any], text: str) -> None:
+        model = body.get("model", "stub")
+        usage = {
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "total_tokens": 15,
+            "prompt_tokens_details": {"cached_tokens": 0},
+        }
+
+        if body.get("stream"):
+            chunks = [text[i : i + 4] for i in range(0, len(text), 4)]
+            events = [
+                {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": model,
+                    "choices": [
+                        {"index": 0, "delta": {"content": chunk}, "finish_reason": None}
+                    ],
+                }
+                for chunk in chunks
+            ]
+            # Like the real APIs, end with an empty delta.
+            events.append(
+                {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                }
+            )
+            return self._send_events(events, named=False)
+
+        self._send_json(
+            {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion",
+                "created": 0,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            }
+        )
+
+    def _message(self, body: Dict[str, Any], text: str) -> None:
+        model = body.get("model", "stub")
+        input_tokens, read, written = self.server.stub.prompt_cache_usage(body)
+        usage = {
+            "input_tokens": input_tokens - read - written,
+            "output_tokens": 5,
+            "cache_creation_input_tokens": written,
+            "cache_read_input_tokens": read,
+        }
+
+        if body.get("stream"):
+            message = {
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [],
+                "stop_reason": None,
+                "usage": usage,
+            }
+            events = [
+                {"type": "message_start", "message": message},
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                },
+                *(
+                    {
+                        "type": "content_block_delta",
+                        "index": 0,
+                        "delta": {"type": "text_delta", "text": text[i : i + 4]},
+                    }
+                    for i in range(0, len(text), 4)
+                ),
+                {"type": "content_block_stop", "index": 0},
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn"},
+                    "usage": {"output_tokens": 5},
+                },
+                {"type": "message_stop"},
+            ]
+            return self._send_events(events, named=True)
+
+        content: List[Dict[str, Any]] = [{"type": "text", "text": text}]
+        tool_choice = body.get("tool_choice") or {}
+        if tool_choice.get("type") == "tool":
+            content = [
+                {
+                    "type": "tool_use",
+                    "id": "toolu_stub",
+                    "name": tool_choice["name"],
+                    "input": json.loads(text),
+                }
+            ]
+
+        self._send_json(
+            {
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": content,
+                "stop_reason": "end_turn",
+                "usage": usage,
+            }
+        )
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubServer"
+
+
+class StubServer:
+    """A local OpenAI/Anthropic compatible server, run in a background thread.
+
+    `reply` is the text every completion answers with; it may also be a
+    callable receiving the decoded request body. With `api_key` set, requests
+    carrying another key are rejected with a 401.
+
+    Anthropic requests get a simulated prompt cache: the prefix ending at each
+    `cache_control` breakpoint is written to the cache, and a later request
+    sharing it reads it back. Tokens are counted as 4 characters each.
+    """
+
+    def __init__(
+        self,
+        reply: str | Callable[[Dict[str, Any]], str] = "Hello from the stub!",
+        *,
+        latency: float = 0.0,
+        api_key: str | None = None,
+    ):
+        self.reply = reply
+        self.latency = latency
+        self.api_key = api_key
+        self.requests: List[Dict[str, Any]] = []
+        self.prompt_cache: set[str] = set()
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(
+        self,
+        path: str,
+        body: Dict[str, Any] | None,
+        headers: Dict[str, str],
+        client_address: tuple,
+    ):
+        with self._lock:
+            self.requests.append(
+                {
+                    "path": path,
+                    "body": body,
+                    "headers": headers,
+                    "client_port": client_address[1],
+                }
+            )
+
+    def prompt_cache_usage(self, body: Dict[str, Any]) -> tuple[int, int, int]:
+        """The input, cache read and cache write tokens of an Anthropic request."""
+        # The prompt in cache order (tools, system, messages), one block at a time.
+        blocks = list(body.get("tools") or [])
+        system = body.get("system") or []
+        blocks += [{"type": "text", "text": system}] if isinstance(system, str) else system
+        for message in body.get("messages", []):
+            content = message["content"]
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            blocks += [{"role": message["role"], **block} for block in content]
+
+        def tokens(prefix: str) -> int:
+            return len(prefix) // 4
+
+        prefixes = []
+        for i, block in enumerate(blocks):
+            if "cache_control" in block:
+                unmarked = copy.deepcopy(blocks[: i + 1])
+                for b in unmarked:
+                    b.pop("cache_control", None)
+                prefixes.append(json.dumps(unmarked, sort_keys=True))
+
+        total = tokens(json.dumps(blocks, sort_keys=True))
+        with self._lock:
+            read = max(
+                (tokens(p) for p in prefixes if p in self.prompt_cache), default=0
+            )
+            written = max((tokens(p) for p in prefixes), default=0) - read
+            self.prompt_cache.update(prefixes)
+
+        return total, read, max(written, 0)
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,62 @@
+"""Per-turn cost of formatting a long conversation for a provider's API.
+
+Usage:
+    python benchmarks/bench_format_messages.py [--turns=N] [--sends=N]
+
+Builds a conversation of `--turns` user/assistant turns, then times `--sends`
+more turns, each adding a user and an assistant message and formatting the
+whole history as `send_conversation` does: "rebuilt" formats every message
+(as providers used to), "incremental" uses `Conversation.format_messages`.
+"""
+
+import argparse
+import time
+
+from _context import sm  # noqa: F401
+
+from simplemind.models import Conversation
+from simplemind.providers._base import format_chat_message
+
+
+def rebuilt(conversation: Conversation) -> list:
+    return [format_chat_message(m) for m in conversation.request_messages()]
+
+
+def incremental(conversation: Conversation) -> list:
+    return conversation.format_messages(format_chat_message)
+
+
+def measure(format_history, turns: int, sends: int) -> float:
+    conversation = Conversation()
+    conversation.add_message("system", "You are a helpful assistant.")
+    for i in range(turns):
+        conversation.add_message("user", f"Question {i}")
+        conversation.add_message("assistant", f"Answer {i}")
+    format_history(conversation)
+
+    elapsed = 0.0
+    for i in range(sends):
+        conversation.add_message("user", f"Question {turns + i}")
+        t1 = time.perf_counter()
+        format_history(conversation)
+        elapsed += time.perf_counter() - t1
+        conversation.add_message("assistant", f"Answer {turns + i}")
+    return elapsed / sends
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=2_000)
+    parser.add_argument("--sends", type=int, default=200)
+    args = parser.parse_args()
+
+    before = measure(rebuilt, args.turns, args.sends)
+    after = measure(incremental, args.turns, args.sends)
+    print(
+        f"{args.turns} turns  rebuilt={before * 1e6:8.1f}us/send  "
+        f"incremental={after * 1e6:8.1f}us/send  speedup={before / after:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""CPU overhead of `generate_data`, with and without the response model cache.
+
+Usage:
+    python benchmarks/bench_generate_data.py [--calls=N]
+
+Calls `generate_data` against a local stub server, for Ollama (Instructor's
+JSON mode) and Anthropic (tool mode), and reports the CPU time per call.
+"Uncached" clears the prepared response models before every call, so that
+Instructor wraps the model and generates its schema each time, as it did
+before the cache.
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import List, Optional
+
+from _context import sm
+from _stub import StubServer
+from pydantic import BaseModel
+
+from simplemind.providers._base import clear_structured_model_cache
+
+
+class Item(BaseModel):
+    """An item of an order."""
+
+    name: str
+    quantity: int
+    price: float
+
+
+class Order(BaseModel):
+    """An order, with its items."""
+
+    id: str
+    customer: str
+    items: List[Item]
+    note: Optional[str] = None
+
+
+REPLY = json.dumps(
+    {
+        "id": "1",
+        "customer": "Ada",
+        "items": [{"name": "tea", "quantity": 2, "price": 3.5}],
+    }
+)
+
+
+def measure(provider: str, calls: int, cached: bool) -> float:
+    def call():
+        sm.generate_data(
+            "Order", llm_provider=provider, llm_model="stub", response_model=Order
+        )
+
+    call()
+    t1 = time.process_time()
+    for _ in range(calls):
+        if not cached:
+            clear_structured_model_cache()
+        call()
+    return (time.process_time() - t1) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with StubServer(REPLY) as stub:
+        os.environ["ANTHROPIC_BASE_URL"] = stub.url
+        os.environ["ANTHROPIC_API_KEY"] = "stub"
+        sm.settings.reload()
+        sm.settings.OLLAMA_HOST_URL = stub.url
+
+        for provider in ("ollama", "anthropic"):
+            before = measure(provider, args.calls, cached=False)
+            after = measure(provider, args.calls, cached=True)
+            print(
+                f"{provider:<10} uncached={before * 1e3:7.3f}ms  "
+                f"cached={after * 1e3:7.3f}ms  speedup={before / after:4.2f}x"
+            )
+
+        sm.close_providers()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Cost of building a long conversation, with and without `Message.build`.
+
+Usage:
+    python benchmarks/bench_messages.py [--messages=N] [--runs=N]
+
+"validated" adds messages the way `add_message` used to: one validated
+`Message` for the add-message hooks and another to append. "built" is
+`add_message` as it is now: one `Message.build`, shared by the hooks and the
+conversation. Both run with one plugin implementing `add_message_hook`.
+"""
+
+import argparse
+import statistics
+import time
+
+from _context import sm
+
+from simplemind.models import Conversation, Message
+
+
+class CountingPlugin(sm.BasePlugin):
+    count: int = 0
+
+    def add_message_hook(self, conversation, message):
+        self.count += 1
+
+
+def validated(conversation: Conversation, role: str, text: str) -> None:
+    for plugin in conversation.plugins:
+        plugin.add_message_hook(conversation, Message(role=role, text=text, meta={}))
+    conversation.messages.append(Message(role=role, text=text, meta={}))
+
+
+def built(conversation: Conversation, role: str, text: str) -> None:
+    conversation.add_message(role, text)
+
+
+def measure(add, messages: int, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        conversation = Conversation(plugins=[CountingPlugin()])
+        t1 = time.perf_counter()
+        for i in range(messages):
+            add(conversation, "user" if i % 2 == 0 else "assistant", f"Message {i}")
+        samples.append(time.perf_counter() - t1)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    before = measure(validated, args.messages, args.runs)
+    after = measure(built, args.messages, args.runs)
+    print(
+        f"{args.messages} messages  validated={before * 1e3:7.1f}ms  "
+        f"built={after * 1e3:7.1f}ms  speedup={before / after:4.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Per-call overhead of building a fresh provider vs. reusing a registered one.
+
+Usage:
+    python benchmarks/bench_provider_registry.py [--calls=N]
+
+Both variants talk to a local stub server through the Ollama provider (an
+OpenAI-compatible client), so the difference is client construction,
+instructor patching and connection setup -- not model latency.
+"""
+
+import argparse
+import statistics
+import time
+
+from _context import sm
+from _stub import StubServer
+
+from simplemind.providers import Ollama
+
+
+def measure(call, calls: int) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        t1 = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - t1)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(
+        f"{label:<12} mean={statistics.mean(timings) * 1e3:7.3f}ms "
+        f"p50={statistics.median(timings) * 1e3:7.3f}ms "
+        f"max={max(timings) * 1e3:7.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with StubServer() as stub:
+
+        def fresh_provider():
+            # The pre-registry behaviour: a new provider (and SDK client) per call.
+            Ollama(host_url=stub.url).generate_text("Hello", llm_model="stub")
+
+        def registered_provider():
+            sm.find_provider("ollama", host_url=stub.url).generate_text(
+                "Hello", llm_model="stub"
+            )
+
+        # Warm up imports and the registry.
+        fresh_provider()
+        registered_provider()
+
+        report("fresh", measure(fresh_provider, args.calls))
+        report("registered", measure(registered_provider, args.calls))
+
+    sm.close_providers()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Startup cost of simplemind: import time, RSS and first-call latency.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs=N] [--check] [--update]
+
+Every run happens in a fresh interpreter. It reports:
+
+- the wall time of `import simplemind`, and the RSS right after it;
+- the latency of the first `generate_text` (Ollama provider, against a
+  local stub server), which includes the deferred provider/SDK imports;
+- the slowest modules pulled in by `import simplemind`, from `-X importtime`.
+
+`--update` stores the medians in `startup_baseline.json`; `--check` compares
+against it and exits non-zero when a metric exceeds its baseline by more
+than `--tolerance`, or when a module that must stay lazy is imported.
+Baselines are machine specific: update them on the machine you check on.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from _stub import StubServer
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BASELINE = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+
+# Modules `import simplemind` must not import; they load on first use.
+LAZY_MODULES = [
+    "anthropic",
+    "groq",
+    "google.generativeai",
+    "instructor",
+    "logfire",
+    "openai",
+]
+
+CHILD = """
+import json, resource, sys, time
+
+t1 = time.perf_counter()
+import simplemind as sm
+t2 = time.perf_counter()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+loaded = sorted(m for m in {lazy!r} if m in sys.modules)
+
+sm.settings.OLLAMA_HOST_URL = {url!r}
+t3 = time.perf_counter()
+sm.generate_text("Hello", llm_provider="ollama", llm_model="stub")
+t4 = time.perf_counter()
+
+print(json.dumps({{
+    "import_ms": (t2 - t1) * 1e3,
+    "rss_mb": rss / 1024,
+    "first_call_ms": (t4 - t3) * 1e3,
+    "loaded": loaded,
+}}))
+"""
+
+
+def child_env() -> dict:
+    # Measure simplemind itself, not the pydantic plugins other packages
+    # (e.g. logfire) happen to register in this environment.
+    return {
+        **os.environ,
+        "PYTHONPATH": ROOT,
+        "PYDANTIC_DISABLE_PLUGINS": "__all__",
+    }
+
+
+def run_child(url: str) -> dict:
+    code = CHILD.format(lazy=LAZY_MODULES, url=url)
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=child_env(),
+    ).stdout
+    return json.loads(output)
+
+
+def import_times(top: int) -> list[tuple[str, float]]:
+    """The `top` slowest modules under `import simplemind`, by cumulative time."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import simplemind"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=child_env(),
+    ).stderr
+
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times.append((name.strip(), int(cumulative) / 1e3))
+
+    return sorted(times, key=lambda item: item[1], reverse=True)[:top]
+
+
+def measure(runs: int) -> dict:
+    samples = []
+    with StubServer() as stub:
+        for _ in range(runs):
+            samples.append(run_child(stub.url))
+
+    return {
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "rss_mb": statistics.median(s["rss_mb"] for s in samples),
+        "first_call_ms": statistics.median(s["first_call_ms"] for s in samples),
+        "loaded": sorted({m for s in samples for m in s["loaded"]}),
+    }
+
+
+def check(result: dict, baseline: dict, tolerance: float) -> list[str]:
+    problems = []
+    for metric in ("import_ms", "rss_mb", "first_call_ms"):
+        limit = baseline[metric] * tolerance
+        if result[metric] > limit:
+            problems.append(
+                f"{metric} {result[metric]:.1f} exceeds {limit:.1f} "
+                f"(baseline {baseline[metric]:.1f} x {tolerance})"
+            )
+
+    for module in result["loaded"]:
+        problems.append(f"`import simplemind` imports {module!r}, which must stay lazy")
+
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--tolerance", type=float, default=1.3)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--update", action="store_true")
+    args = parser.parse_args()
+
+    result = measure(args.runs)
+
+    print(f"import        {result['import_ms']:8.1f}ms")
+    print(f"rss           {result['rss_mb']:8.1f}MB")
+    print(f"first call    {result['first_call_ms']:8.1f}ms")
+    print("\nslowest imports (cumulative):")
+    for name, ms in import_times(args.top):
+        print(f"  {ms:8.1f}ms  {name}")
+
+    if args.update:
+        baseline = {k: round(result[k], 1) for k in ("import_ms", "rss_mb", "first_call_ms")}
+        with open(BASELINE, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"\nbaseline written to {BASELINE}")
+
+    if args.check:
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+
+        problems = check(result, baseline, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            sys.exit(1)
+        print("\nwithin baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Per-send cost of converting tools, with and without the tool cache.
+
+Usage:
+    python benchmarks/bench_tool_conversion.py [--tools=N] [--sends=N]
+
+Each "send" converts every tool and builds its input schema, as
+`send_conversation` does, for the OpenAI and Anthropic tool classes.
+"""
+
+import argparse
+import time
+from typing import Annotated, Literal
+
+from _context import sm  # noqa: F401
+from pydantic import Field
+
+from simplemind.providers._base_tools import clear_tool_cache, convert_tool
+from simplemind.providers.anthropic import AnthropicTool
+from simplemind.providers.openai import OpenAITool
+
+
+def make_tool(n: int):
+    def tool(
+        location: Annotated[str, Field(description="The city and state")],
+        unit: Annotated[
+            Literal["celsius", "fahrenheit"], Field(description="The unit")
+        ] = "celsius",
+        days: Annotated[int, Field(description="Days ahead")] = 0,
+    ):
+        """Get the weather forecast for a location."""
+        return "sunny"
+
+    tool.__name__ = f"tool_{n}"
+    return tool
+
+
+def uncached(tool_class, tools):
+    return [tool_class.from_function(t).get_input_schema() for t in tools]
+
+
+def cached(tool_class, tools):
+    return [convert_tool(tool_class, t).input_schema() for t in tools]
+
+
+def measure(send, tool_class, tools, sends: int) -> float:
+    t1 = time.perf_counter()
+    for _ in range(sends):
+        send(tool_class, tools)
+    return (time.perf_counter() - t1) / sends
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, default=30)
+    parser.add_argument("--sends", type=int, default=500)
+    args = parser.parse_args()
+
+    tools = [make_tool(n) for n in range(args.tools)]
+
+    for tool_class in (OpenAITool, AnthropicTool):
+        clear_tool_cache()
+        before = measure(uncached, tool_class, tools, args.sends)
+        after = measure(cached, tool_class, tools, args.sends)
+        print(
+            f"{tool_class.__name__:<14} {args.tools} tools/send  "
+            f"uncached={before * 1e3:7.3f}ms  cached={after * 1e3:7.3f}ms  "
+            f"speedup={before / after:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -68,7 +68,7 @@ class ContextualMemoryPlugin(sm.BasePlugin):
             last_user_message = conversation.messages[-1].text
             relevant_memories = self.retrieve_memories(last_user_message)
             for memory in relevant_memories:
-                conversation.add_message(role="system", text=memory)
+                conversation.add_context(memory)
 
     def on_response(self, conversation: sm.Conversation, response: str):
         # Optionally, add the AI's response to memories
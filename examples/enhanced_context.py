@@ -441,7 +441,7 @@ class EnhancedContextPlugin(sm.BasePlugin):
         recent_entities = self.retrieve_recent_entities(days=30)
         context_message = self.format_context_message(recent_entities)
         if context_message:
-            conversation.add_message(role="user", text=context_message)
+            conversation.add_context(context_message)
             self.logger.info(f"Added context message: {context_message}")
 
     def store_entity(self, entity: str, source: str = "user") -> None:
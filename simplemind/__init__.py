@@ -1,9 +1,63 @@
+import importlib
 import inspect
-from typing import Callable, List, Type
+from functools import cached_property, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Type,
+)
 
-from .models import BaseModel, BasePlugin, Conversation
+from .cache import (
+    BaseCache,
+    MemoryCache,
+    StreamReplay,
+    arecord_stream,
+    disable_cache,
+    enable_cache,
+    get_enrich_cache,
+    make_key,
+    record_stream,
+    resolve_cache,
+)
+from .context import ContextPolicy, ContextReport, estimate_tokens
+from .logging import LoggingBackend, StandardLoggingBackend
+from .models import BaseModel, BasePlugin, Conversation, Usage
+from .providers import BaseProvider, BaseTool
 from .settings import settings
-from .utils import find_provider
+from .utils import close_providers, find_provider, find_provider_class
+
+if TYPE_CHECKING:
+    from .batch import Batch, LocalBatchBackend
+    from .bulk import BulkResult
+    from .cache import TOOL_CACHE_PATH, DiskCache, SemanticCache
+    from .coalesce import Coalescer, disable_coalescing, enable_coalescing
+
+# Public names imported on first use, like the providers, so that
+# `import simplemind` does not load them (or `sqlite3`, or NumPy): name -> module.
+_LAZY_NAMES: Dict[str, str] = {
+    "Batch": ".batch",
+    "LocalBatchBackend": ".batch",
+    "BulkResult": ".bulk",
+    "DiskCache": ".cache",
+    "SemanticCache": ".cache",
+    "TOOL_CACHE_PATH": ".cache",
+    "Coalescer": ".coalesce",
+    "disable_coalescing": ".coalesce",
+    "enable_coalescing": ".coalesce",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        return getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Session:
@@ -11,25 +65,80 @@ class Session:
 
     Similar to `requests.Session`, this allows you to specify default settings
     that will be used for all operations within the session.
+
+    The session owns its provider instance (built on first use, with
+    `provider_kwargs` such as `api_key` or `host_url`), so its clients are
+    reused across calls and released by `close()`, or by using the session
+    as a (sync or async) context manager.
     """
 
     def __init__(
         self,
         *,
-        llm_provider: str = settings.DEFAULT_LLM_PROVIDER,
+        llm_provider: str | None = None,
         llm_model: str | None = None,
+        provider_kwargs: Dict[str, Any] | None = None,
         **kwargs,
     ):
+        # `None` means `settings.DEFAULT_LLM_PROVIDER`, resolved on first use.
         self.llm_provider = llm_provider
         self.llm_model = llm_model
+        self.provider_kwargs = provider_kwargs or {}
         self.default_kwargs = kwargs
 
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Session":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    @cached_property
+    def provider(self) -> BaseProvider:
+        """The session's own provider instance (not shared with the registry)."""
+        provider_class = find_provider_class(
+            self.llm_provider or settings.DEFAULT_LLM_PROVIDER
+        )
+        return provider_class(**self.provider_kwargs)
+
+    def close(self) -> None:
+        """Close the session's provider clients.
+
+        Clients on the shared connection pool are dropped; the pool itself
+        stays open for other sessions. The session can still be used: its
+        clients are rebuilt on next use.
+        """
+        provider = self.__dict__.pop("provider", None)
+        if provider is not None:
+            provider.close()
+
+    async def aclose(self) -> None:
+        """Close the session's provider clients, including the running loop's async client."""
+        provider = self.__dict__.pop("provider", None)
+        if provider is not None:
+            await provider.aclose()
+
+    def warmup(self, connections: int = 1, *, validate: bool = False) -> None:
+        """Build the session's provider client and open `connections` pooled
+        connections to its endpoint. With `validate`, raise if the provider
+        rejects the credentials."""
+        self.provider.warmup(connections, validate=validate)
+
+    async def awarmup(self, connections: int = 1, *, validate: bool = False) -> None:
+        """Warm up the session's provider on the running event loop. See `warmup()`."""
+        await self.provider.awarmup(connections, validate=validate)
+
     def generate_text(self, prompt: str, **kwargs) -> str:
         """Generate text using the session's default provider and model."""
         merged_kwargs = {**self.default_kwargs, **kwargs}
         return generate_text(
             prompt=prompt,
-            llm_provider=self.llm_provider,
+            llm_provider=self.provider,
             llm_model=self.llm_model,
             **merged_kwargs,
         )
@@ -42,7 +151,102 @@ class Session:
         return generate_data(
             prompt=prompt,
             response_model=response_model,
-            llm_provider=self.llm_provider,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    async def agenerate_text(self, prompt: str, **kwargs) -> str:
+        """Generate text asynchronously, using the session's default provider and model."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return await agenerate_text(
+            prompt=prompt,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    async def agenerate_data(
+        self, prompt: str, response_model: Type[BaseModel], **kwargs
+    ) -> BaseModel:
+        """Generate structured data asynchronously, using the session's default provider and model."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return await agenerate_data(
+            prompt=prompt,
+            response_model=response_model,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    def generate_text_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        concurrency: int | None = None,
+        **kwargs,
+    ) -> "BulkResult":
+        """Generate text for many prompts concurrently, using the session's defaults."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return generate_text_many(
+            prompts,
+            concurrency=concurrency,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    def generate_data_many(
+        self,
+        prompts: Sequence[str],
+        response_model: Type[BaseModel],
+        *,
+        concurrency: int | None = None,
+        **kwargs,
+    ) -> "BulkResult":
+        """Generate structured data for many prompts concurrently, using the session's defaults."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return generate_data_many(
+            prompts,
+            response_model=response_model,
+            concurrency=concurrency,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    async def agenerate_text_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        concurrency: int | None = None,
+        **kwargs,
+    ) -> "BulkResult":
+        """Generate text for many prompts on the event loop, using the session's defaults."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return await agenerate_text_many(
+            prompts,
+            concurrency=concurrency,
+            llm_provider=self.provider,
+            llm_model=self.llm_model,
+            **merged_kwargs,
+        )
+
+    async def agenerate_data_many(
+        self,
+        prompts: Sequence[str],
+        response_model: Type[BaseModel],
+        *,
+        concurrency: int | None = None,
+        **kwargs,
+    ) -> "BulkResult":
+        """Generate structured data for many prompts on the event loop, using the session's defaults."""
+        merged_kwargs = {**self.default_kwargs, **kwargs}
+        return await agenerate_data_many(
+            prompts,
+            response_model=response_model,
+            concurrency=concurrency,
+            llm_provider=self.provider,
             llm_model=self.llm_model,
             **merged_kwargs,
         )
@@ -51,24 +255,36 @@ class Session:
         """Create a conversation using the session's default provider and model."""
         merged_kwargs = {**self.default_kwargs, **kwargs}
         return create_conversation(
-            llm_provider=self.llm_provider, llm_model=self.llm_model, **merged_kwargs
+            llm_provider=self.provider, llm_model=self.llm_model, **merged_kwargs
         )
 
 
 def create_conversation(
     *,
     llm_model: str | None = None,
-    llm_provider: str | None = None,
+    llm_provider: str | BaseProvider | None = None,
     plugins: List[BasePlugin] | None = None,
+    context_policy: ContextPolicy | None = None,
     **kwargs,
 ) -> Conversation:
-    """Create a new conversation."""
+    """Create a new conversation.
 
-    # Create the conversation.
-    conv = Conversation(
-        llm_model=llm_model,
-        llm_provider=llm_provider or settings.DEFAULT_LLM_PROVIDER,
-    )
+    `context_policy` chooses which messages each send includes; see
+    `ContextPolicy`.
+    """
+
+    # Create the conversation, bound to the provider instance if given one.
+    if isinstance(llm_provider, BaseProvider):
+        conv = Conversation(
+            llm_model=llm_model, llm_provider=llm_provider.NAME, provider=llm_provider
+        )
+    else:
+        conv = Conversation(
+            llm_model=llm_model,
+            llm_provider=llm_provider or settings.DEFAULT_LLM_PROVIDER,
+        )
+
+    conv.context_policy = context_policy
 
     # Add plugins to the conversation.
     for plugin in plugins or []:
@@ -77,75 +293,345 @@ def create_conversation(
     return conv
 
 
+def _resolve_coalescer(coalesce: "Coalescer | bool | None") -> "Coalescer | None":
+    """`coalesce.resolve_coalescer`, imported on first use."""
+    from .coalesce import resolve_coalescer
+
+    return resolve_coalescer(coalesce)
+
+
 def generate_data(
     prompt: str,
     *,
     llm_model: str | None = None,
-    llm_provider: str | None = None,
+    llm_provider: str | BaseProvider | None = None,
     response_model: Type[BaseModel],
+    cache: BaseCache | bool | None = None,
+    coalesce: "Coalescer | bool | None" = None,
     **kwargs,
 ) -> BaseModel:
-    """Generate structured data from a given prompt."""
+    """Generate structured data from a given prompt.
+
+    With a cache (see `enable_cache()`), identical calls are answered from
+    it; `cache=False` bypasses it. With coalescing (see
+    `enable_coalescing()`), identical concurrent calls share one provider
+    call; `coalesce=False` bypasses it.
+    """
 
     # Find the provider.
     provider = find_provider(llm_provider or settings.DEFAULT_LLM_PROVIDER)
 
+    # Look the call up in the cache.
+    cache = resolve_cache(cache)
+    coalescer = _resolve_coalescer(coalesce)
+    key = None
+    if cache is not None or coalescer is not None:
+        key = make_key("data", provider, llm_model, prompt, kwargs, response_model)
+    if key is not None and cache is not None and (hit := cache.get(key)) is not None:
+        return response_model.model_validate(hit["data"])
+
     # Generate the data.
-    return provider.structured_response(
-        prompt=prompt,
-        llm_model=llm_model,
-        response_model=response_model,
-        **kwargs,
-    )
+    def call() -> BaseModel:
+        data = provider.structured_response(
+            prompt=prompt,
+            llm_model=llm_model,
+            response_model=response_model,
+            **kwargs,
+        )
+        if key is not None and cache is not None:
+            cache.set(key, {"data": data.model_dump(mode="json")})
+        return data
+
+    if key is not None and coalescer is not None:
+        return coalescer.call(key.digest, call)
+    return call()
 
 
 def generate_text(
     prompt: str,
     *,
     llm_model: str | None = None,
-    llm_provider: str | None = None,
+    llm_provider: str | BaseProvider | None = None,
     stream: bool = False,
+    cache: BaseCache | bool | None = None,
+    coalesce: "Coalescer | bool | None" = None,
+    replay: StreamReplay | None = None,
     **kwargs,
-) -> str:
-    """Generate text from a given prompt."""
+) -> str | Iterator[str]:
+    """Generate text from a given prompt.
+
+    With a cache (see `enable_cache()`), identical calls are answered from
+    it; `cache=False` bypasses it. With coalescing (see
+    `enable_coalescing()`), identical concurrent calls share one provider
+    call; `coalesce=False` bypasses it.
+
+    Streamed calls are recorded to the cache too (once fully consumed), and
+    cached responses are replayed to them as chunks, as `replay` says.
+    Streamed calls are not coalesced.
+    """
 
     # Find the provider.
     provider = find_provider(llm_provider or settings.DEFAULT_LLM_PROVIDER)
+    cache = resolve_cache(cache)
 
     # Generate the text.
     if stream:
         if not provider.supports_streaming:
             raise ValueError(f"{provider} does not support streaming.")
 
-        return provider.generate_stream_text(
+        key = None
+        if cache is not None:
+            key = make_key("text", provider, llm_model, prompt, kwargs)
+        if key is not None and (hit := cache.get(key)) is not None:
+            return (replay or StreamReplay()).replay(hit)
+
+        chunks = provider.generate_stream_text(
             prompt=prompt, llm_model=llm_model, **kwargs
         )
-    else:
-        return provider.generate_text(prompt=prompt, llm_model=llm_model, **kwargs)
+        if key is not None:
+            return record_stream(chunks, partial(cache.set, key))
+        return chunks
+
+    # Look the call up in the cache.
+    coalescer = _resolve_coalescer(coalesce)
+    key = None
+    if cache is not None or coalescer is not None:
+        key = make_key("text", provider, llm_model, prompt, kwargs)
+    if key is not None and cache is not None and (hit := cache.get(key)) is not None:
+        return hit["text"]
+
+    def call() -> str:
+        text = provider.generate_text(prompt=prompt, llm_model=llm_model, **kwargs)
+        if key is not None and cache is not None:
+            cache.set(key, {"text": text})
+        return text
+
+    if key is not None and coalescer is not None:
+        return coalescer.call(key.digest, call)
+    return call()
+
+
+async def agenerate_data(
+    prompt: str,
+    *,
+    llm_model: str | None = None,
+    llm_provider: str | BaseProvider | None = None,
+    response_model: Type[BaseModel],
+    cache: BaseCache | bool | None = None,
+    coalesce: "Coalescer | bool | None" = None,
+    **kwargs,
+) -> BaseModel:
+    """Generate structured data from a given prompt, asynchronously."""
+
+    # Find the provider.
+    provider = find_provider(llm_provider or settings.DEFAULT_LLM_PROVIDER)
+
+    # Look the call up in the cache.
+    cache = resolve_cache(cache)
+    coalescer = _resolve_coalescer(coalesce)
+    key = None
+    if cache is not None or coalescer is not None:
+        key = make_key("data", provider, llm_model, prompt, kwargs, response_model)
+    if key is not None and cache is not None and (hit := cache.get(key)) is not None:
+        return response_model.model_validate(hit["data"])
+
+    # Generate the data.
+    async def call() -> BaseModel:
+        data = await provider.astructured_response(
+            prompt=prompt,
+            llm_model=llm_model,
+            response_model=response_model,
+            **kwargs,
+        )
+        if key is not None and cache is not None:
+            cache.set(key, {"data": data.model_dump(mode="json")})
+        return data
+
+    if key is not None and coalescer is not None:
+        return await coalescer.acall(key.digest, call)
+    return await call()
+
+
+async def agenerate_text(
+    prompt: str,
+    *,
+    llm_model: str | None = None,
+    llm_provider: str | BaseProvider | None = None,
+    stream: bool = False,
+    cache: BaseCache | bool | None = None,
+    coalesce: "Coalescer | bool | None" = None,
+    replay: StreamReplay | None = None,
+    **kwargs,
+) -> str | AsyncIterator[str]:
+    """Generate text from a given prompt, asynchronously.
+
+    With `stream=True`, returns an async iterator of text chunks.
+    """
+
+    # Find the provider.
+    provider = find_provider(llm_provider or settings.DEFAULT_LLM_PROVIDER)
+    cache = resolve_cache(cache)
+
+    # Generate the text.
+    if stream:
+        if not provider.supports_streaming:
+            raise ValueError(f"{provider} does not support streaming.")
+
+        key = None
+        if cache is not None:
+            key = make_key("text", provider, llm_model, prompt, kwargs)
+        if key is not None and (hit := cache.get(key)) is not None:
+            return (replay or StreamReplay()).areplay(hit)
+
+        chunks = provider.agenerate_stream_text(
+            prompt=prompt, llm_model=llm_model, **kwargs
+        )
+        if key is not None:
+            return arecord_stream(chunks, partial(cache.set, key))
+        return chunks
+
+    # Look the call up in the cache.
+    coalescer = _resolve_coalescer(coalesce)
+    key = None
+    if cache is not None or coalescer is not None:
+        key = make_key("text", provider, llm_model, prompt, kwargs)
+    if key is not None and cache is not None and (hit := cache.get(key)) is not None:
+        return hit["text"]
+
+    async def call() -> str:
+        text = await provider.agenerate_text(
+            prompt=prompt, llm_model=llm_model, **kwargs
+        )
+        if key is not None and cache is not None:
+            cache.set(key, {"text": text})
+        return text
+
+    if key is not None and coalescer is not None:
+        return await coalescer.acall(key.digest, call)
+    return await call()
+
+
+def generate_text_many(
+    prompts: Sequence[str],
+    *,
+    concurrency: int | None = None,
+    **kwargs,
+) -> "BulkResult":
+    """Generate text for many prompts, `concurrency` at a time (by default
+    `simplemind.bulk.DEFAULT_CONCURRENCY`).
+
+    Results keep the order of `prompts`; a failing prompt records its error
+    instead of aborting the batch.
+    """
+    from .bulk import run_many
+
+    return run_many(partial(generate_text, **kwargs), prompts, concurrency=concurrency)
+
+
+def generate_data_many(
+    prompts: Sequence[str],
+    *,
+    response_model: Type[BaseModel],
+    concurrency: int | None = None,
+    **kwargs,
+) -> "BulkResult":
+    """Generate structured data for many prompts, `concurrency` at a time."""
+    from .bulk import run_many
+
+    return run_many(
+        partial(generate_data, response_model=response_model, **kwargs),
+        prompts,
+        concurrency=concurrency,
+    )
+
+
+async def agenerate_text_many(
+    prompts: Sequence[str],
+    *,
+    concurrency: int | None = None,
+    **kwargs,
+) -> "BulkResult":
+    """Generate text for many prompts on the event loop, `concurrency` at a time."""
+    from .bulk import arun_many
+
+    return await arun_many(
+        partial(agenerate_text, **kwargs), prompts, concurrency=concurrency
+    )
+
+
+async def agenerate_data_many(
+    prompts: Sequence[str],
+    *,
+    response_model: Type[BaseModel],
+    concurrency: int | None = None,
+    **kwargs,
+) -> "BulkResult":
+    """Generate structured data for many prompts on the event loop, `concurrency` at a time."""
+    from .bulk import arun_many
+
+    return await arun_many(
+        partial(agenerate_data, response_model=response_model, **kwargs),
+        prompts,
+        concurrency=concurrency,
+    )
 
 
 def enable_logfire() -> None:
     """Enable logfire logging."""
     settings.logging.enable_logfire()
 
+
+def enable_logging(backend: LoggingBackend | None = None) -> None:
+    """Enable logging to `backend` (the standard library `simplemind` logger by default)."""
+    settings.logging.enable(backend or StandardLoggingBackend())
+
 def tool(
     llm_provider: str | None = None,
     llm_model: str | None = None,
+    *,
+    enrich: bool = False,
+    cache: BaseCache | bool | None = None,
 ):
+    """Turn a function into a tool for `llm_provider`.
+
+    The schema is derived locally from the function's signature, type hints
+    and docstring. With `enrich=True`, an LLM writes the descriptions the
+    docstring lacks; its answer is cached on disk (by default in
+    `DiskCache(TOOL_CACHE_PATH)`), keyed by the function's signature.
+    """
     provider = find_provider(llm_provider or settings.DEFAULT_LLM_PROVIDER)
 
-    def decorator(func: Callable):
-        sig = inspect.signature(func)
-        res = generate_data(
+    def _enrich_tool(res: BaseTool, func: Callable, sig: inspect.Signature) -> BaseTool:
+        enriched = generate_data(
             (
                 "Based on this function signature, fill up the required fieds."
                 f"\nSignature: {func.__name__}{sig}"
-                "Make sure to properly add the required field in `required` if there are no defaults"
+                f"\nDocstring: {func.__doc__ or ''}"
+                "\nMake sure to properly add the required field in `required` if there are no defaults"
             ),
-            llm_provider=llm_provider,
+            llm_provider=provider,
+            llm_model=llm_model,
             response_model=provider.tool,
+            cache=get_enrich_cache() if cache is None else cache,
         )
-        res.raw_func = func
+
+        # Types, enums and `required` stay as derived; the LLM only replaces
+        # descriptions that fell back to the parameter name.
+        for name, prop in res.properties.items():
+            if prop.description == name.replace("_", " ") and name in enriched.properties:
+                prop.description = enriched.properties[name].description
+
+        if not res.description:
+            res.description = enriched.description
+        return res
+
+    def decorator(func: Callable):
+        sig = inspect.signature(func)
+        res = provider.tool.from_function(func, strict=False)
+
+        if enrich:
+            res = _enrich_tool(res, func, sig)
+
         res.__signature__ = sig
         res.__doc__ = func.__doc__
 
@@ -153,18 +639,41 @@ def tool(
 
     return decorator
 
+
 # Syntax sugar.
 Plugin = BasePlugin
 
 __all__ = [
+    "agenerate_data",
+    "agenerate_data_many",
+    "agenerate_text",
+    "agenerate_text_many",
+    "close_providers",
+    "disable_cache",
+    "disable_coalescing",
+    "enable_cache",
+    "enable_coalescing",
     "create_conversation",
     "find_provider",
     "generate_data",
+    "generate_data_many",
     "generate_text",
+    "generate_text_many",
     "settings",
+    "Batch",
+    "DiskCache",
     "BasePlugin",
+    "BulkResult",
+    "Coalescer",
+    "LocalBatchBackend",
+    "MemoryCache",
+    "SemanticCache",
     "Session",
+    "StreamReplay",
     "Plugin",
     "enable_logfire",
-    "tool"
+    "enable_logging",
+    "LoggingBackend",
+    "tool",
+    "Usage",
 ]
@@ -0,0 +1,511 @@
+"""Run many `generate_text` / `generate_data` calls as one provider batch job.
+
+Batch endpoints (OpenAI Batch, Anthropic Message Batches) are cheaper and
+higher-throughput than per-request calls, in exchange for latency: results
+arrive once the job completes, which can take minutes to hours.
+
+    batch = sm.Batch(llm_provider="openai")
+    batch.add_text("Write a haiku about the moon")
+    batch.add_data("Write a poem about love", response_model=Poem)
+    batch.submit()
+    result = batch.wait()
+
+`LocalBatchBackend` stands in for the provider with files on disk, so batch
+jobs can be exercised offline.
+"""
+
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from .bulk import BulkItem, BulkResult
+from .settings import settings
+from .utils import find_provider, find_provider_class
+
+
+class BatchError(RuntimeError):
+    """A batch job, or one of its requests, failed."""
+
+
+class BatchRequest(BaseModel):
+    """A single call queued in a batch."""
+
+    custom_id: str
+    prompt: str
+    llm_model: str
+    response_model: Optional[Type[BaseModel]] = None
+    kwargs: Dict[str, Any] = {}
+
+
+# `generate_text` / `generate_data` options that are simplemind's own, with
+# no meaning for a batch request.
+CALL_OPTIONS = ("cache", "coalesce", "replay", "stream")
+
+
+class BatchFormat(ABC):
+    """Translates requests to, and results from, a provider's batch format."""
+
+    NAME: str
+
+    @abstractmethod
+    def request_line(self, request: BatchRequest, default_kwargs: dict) -> dict:
+        """The batch input line for a request."""
+
+    @abstractmethod
+    def parse_line(self, line: dict) -> tuple[str, Any]:
+        """The custom id and result of a batch output line.
+
+        The result is the response text, the tool input (a dict) for
+        structured requests, or a `BatchError`.
+        """
+
+    @abstractmethod
+    def output_line(self, input_line: dict, text: str) -> dict:
+        """A successful output line for an input line, as the provider would write it."""
+
+
+class OpenAIBatchFormat(BatchFormat):
+    """The OpenAI Batch API JSONL format, for `/v1/chat/completions`."""
+
+    NAME = "openai"
+    ENDPOINT = "/v1/chat/completions"
+
+    def request_line(self, request: BatchRequest, default_kwargs: dict) -> dict:
+        kwargs = dict(request.kwargs)
+        image_url = kwargs.pop("image_url", None)
+        if image_url:
+            from .providers.openai import OpenAI
+
+            messages = OpenAI._prompt_messages(request.prompt, image_url)
+        else:
+            messages = [{"role": "user", "content": request.prompt}]
+
+        body = {
+            **default_kwargs,
+            **kwargs,
+            "model": request.llm_model,
+            "messages": messages,
+        }
+
+        if request.response_model is not None:
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": request.response_model.__name__,
+                    "schema": request.response_model.model_json_schema(),
+                },
+            }
+
+        return {
+            "custom_id": request.custom_id,
+            "method": "POST",
+            "url": self.ENDPOINT,
+            "body": body,
+        }
+
+    def parse_line(self, line: dict) -> tuple[str, Any]:
+        custom_id = line["custom_id"]
+
+        if line.get("error"):
+            return custom_id, BatchError(line["error"].get("message", line["error"]))
+
+        response = line["response"]
+        if response["status_code"] != 200:
+            error = response["body"].get("error", {})
+            return custom_id, BatchError(error.get("message", response["body"]))
+
+        return custom_id, response["body"]["choices"][0]["message"]["content"]
+
+    def output_line(self, input_line: dict, text: str) -> dict:
+        return {
+            "id": f"batch_req_{uuid.uuid4().hex}",
+            "custom_id": input_line["custom_id"],
+            "response": {
+                "status_code": 200,
+                "request_id": uuid.uuid4().hex,
+                "body": {
+                    "id": f"chatcmpl-{uuid.uuid4().hex}",
+                    "object": "chat.completion",
+                    "model": input_line["body"]["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": text},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                },
+            },
+            "error": None,
+        }
+
+
+class AnthropicBatchFormat(BatchFormat):
+    """The Anthropic Message Batches format.
+
+    Structured requests are sent as a forced tool call whose input schema is
+    the response model's JSON schema.
+    """
+
+    NAME = "anthropic"
+
+    @staticmethod
+    def _image_block(image_url: str) -> dict:
+        """An image content block for an image url or a base64 data url."""
+        if image_url.startswith("data:"):
+            media_type, _, data = image_url[len("data:") :].partition(";base64,")
+            source = {"type": "base64", "media_type": media_type, "data": data}
+        else:
+            source = {"type": "url", "url": image_url}
+        return {"type": "image", "source": source}
+
+    def request_line(self, request: BatchRequest, default_kwargs: dict) -> dict:
+        kwargs = dict(request.kwargs)
+        image_url = kwargs.pop("image_url", None)
+        if image_url:
+            content = [
+                self._image_block(image_url),
+                {"type": "text", "text": request.prompt},
+            ]
+        else:
+            content = request.prompt
+
+        params = {
+            **default_kwargs,
+            **kwargs,
+            "model": request.llm_model,
+            "messages": [{"role": "user", "content": content}],
+        }
+
+        if request.response_model is not None:
+            name = request.response_model.__name__
+            params["tools"] = [
+                {
+                    "name": name,
+                    "description": f"Respond with a {name}.",
+                    "input_schema": request.response_model.model_json_schema(),
+                }
+            ]
+            params["tool_choice"] = {"type": "tool", "name": name}
+
+        return {"custom_id": request.custom_id, "params": params}
+
+    def parse_line(self, line: dict) -> tuple[str, Any]:
+        custom_id = line["custom_id"]
+        result = line["result"]
+
+        if result["type"] != "succeeded":
+            error = (result.get("error") or {}).get("error", {})
+            return custom_id, BatchError(error.get("message", result["type"]))
+
+        content = result["message"]["content"]
+        for block in content:
+            if block["type"] == "tool_use":
+                return custom_id, block["input"]
+
+        return custom_id, content[-1]["text"]
+
+    def output_line(self, input_line: dict, text: str) -> dict:
+        params = input_line["params"]
+
+        if "tool_choice" in params:
+            content = [
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{uuid.uuid4().hex}",
+                    "name": params["tool_choice"]["name"],
+                    "input": json.loads(text),
+                }
+            ]
+        else:
+            content = [{"type": "text", "text": text}]
+
+        return {
+            "custom_id": input_line["custom_id"],
+            "result": {
+                "type": "succeeded",
+                "message": {
+                    "id": f"msg_{uuid.uuid4().hex}",
+                    "type": "message",
+                    "role": "assistant",
+                    "model": params["model"],
+                    "content": content,
+                    "stop_reason": "end_turn",
+                },
+            },
+        }
+
+
+FORMATS: Dict[str, Type[BatchFormat]] = {
+    format.NAME: format for format in (OpenAIBatchFormat, AnthropicBatchFormat)
+}
+
+
+class BatchBackend(ABC):
+    """Where batch jobs are submitted to, and results fetched from."""
+
+    @abstractmethod
+    def submit(self, lines: List[dict], format: BatchFormat) -> str:
+        """Submit the input lines, returning the job id."""
+
+    @abstractmethod
+    def is_done(self, job_id: str) -> bool:
+        """Whether the job has finished (successfully or not)."""
+
+    @abstractmethod
+    def results(self, job_id: str) -> List[dict]:
+        """The output lines of a finished job."""
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """The OpenAI Batch API."""
+
+    DONE_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, llm_provider: str = "openai"):
+        self.provider = find_provider(llm_provider)
+
+    def submit(self, lines: List[dict], format: BatchFormat) -> str:
+        data = "\n".join(json.dumps(line) for line in lines).encode()
+        input_file = self.provider.client.files.create(
+            file=("batch.jsonl", data), purpose="batch"
+        )
+        job = self.provider.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=OpenAIBatchFormat.ENDPOINT,
+            completion_window="24h",
+        )
+        return job.id
+
+    def is_done(self, job_id: str) -> bool:
+        job = self.provider.client.batches.retrieve(job_id)
+        return job.status in self.DONE_STATUSES
+
+    def results(self, job_id: str) -> List[dict]:
+        job = self.provider.client.batches.retrieve(job_id)
+        if job.status != "completed":
+            raise BatchError(f"Batch {job_id} did not complete: {job.status}")
+
+        lines = []
+        for file_id in (job.output_file_id, job.error_file_id):
+            if file_id:
+                content = self.provider.client.files.content(file_id).text
+                lines.extend(json.loads(line) for line in content.splitlines() if line)
+        return lines
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """The Anthropic Message Batches API."""
+
+    def __init__(self, llm_provider: str = "anthropic"):
+        self.provider = find_provider(llm_provider)
+
+    def submit(self, lines: List[dict], format: BatchFormat) -> str:
+        job = self.provider.client.messages.batches.create(requests=lines)
+        return job.id
+
+    def is_done(self, job_id: str) -> bool:
+        job = self.provider.client.messages.batches.retrieve(job_id)
+        return job.processing_status == "ended"
+
+    def results(self, job_id: str) -> List[dict]:
+        return [
+            result.model_dump()
+            for result in self.provider.client.messages.batches.results(job_id)
+        ]
+
+
+class LocalBatchBackend(BatchBackend):
+    """A file-based stand-in for a provider's batch endpoint.
+
+    Each job is written to `<directory>/<job_id>.input.jsonl`. The job is
+    "processed" on the first poll: `responder` is called with every request
+    line, and its answers are written to `<job_id>.output.jsonl` in the
+    provider's output format. For structured requests, the responder must
+    answer with the model's JSON.
+    """
+
+    def __init__(self, directory: str | Path, responder: Callable[[dict], str]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.responder = responder
+
+    def _path(self, job_id: str, kind: str) -> Path:
+        return self.directory / f"{job_id}.{kind}.jsonl"
+
+    def submit(self, lines: List[dict], format: BatchFormat) -> str:
+        # The format name is part of the job id, so any process can poll it.
+        job_id = f"batch_{format.NAME}_{uuid.uuid4().hex}"
+        with open(self._path(job_id, "input"), "w") as f:
+            f.writelines(json.dumps(line) + "\n" for line in lines)
+        return job_id
+
+    def is_done(self, job_id: str) -> bool:
+        output = self._path(job_id, "output")
+        if not output.exists():
+            format = FORMATS[job_id.split("_")[1]]()
+            with open(self._path(job_id, "input")) as f:
+                inputs = [json.loads(line) for line in f if line.strip()]
+            with open(output, "w") as f:
+                f.writelines(
+                    json.dumps(format.output_line(line, self.responder(line))) + "\n"
+                    for line in inputs
+                )
+        return True
+
+    def results(self, job_id: str) -> List[dict]:
+        with open(self._path(job_id, "output")) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class Batch:
+    """A group of `generate_text` / `generate_data` calls, run as one batch job."""
+
+    BACKENDS: Dict[str, Type[BatchBackend]] = {
+        "openai": OpenAIBatchBackend,
+        "anthropic": AnthropicBatchBackend,
+    }
+
+    def __init__(
+        self,
+        *,
+        llm_provider: str | None = None,
+        llm_model: str | None = None,
+        backend: BatchBackend | None = None,
+    ):
+        self.llm_provider = (llm_provider or settings.DEFAULT_LLM_PROVIDER).lower()
+        self.provider_class = find_provider_class(self.llm_provider)
+        self.llm_model = llm_model or self.provider_class.DEFAULT_MODEL
+
+        if self.llm_provider not in FORMATS:
+            raise ValueError(
+                f"Provider {self.llm_provider!r} does not support batches. "
+                f"Supported providers: {', '.join(FORMATS)}"
+            )
+
+        self.format = FORMATS[self.llm_provider]()
+        self.backend = backend or self.BACKENDS[self.llm_provider](self.llm_provider)
+        self.requests: List[BatchRequest] = []
+        self.job_id: str | None = None
+        self._submitted_at: float | None = None
+
+    def _add(self, prompt: str, response_model, kwargs: dict) -> str:
+        if self.job_id is not None:
+            raise BatchError("Cannot add requests to a submitted batch")
+        if kwargs.get("stream"):
+            raise BatchError("Batch requests cannot be streamed")
+        llm_provider = kwargs.pop("llm_provider", None)
+        if llm_provider is not None and llm_provider.lower() != self.llm_provider:
+            raise BatchError(
+                f"Cannot add a {llm_provider!r} request to a {self.llm_provider!r} batch"
+            )
+        for option in CALL_OPTIONS:
+            kwargs.pop(option, None)
+
+        request = BatchRequest(
+            custom_id=f"request-{len(self.requests)}",
+            prompt=prompt,
+            llm_model=kwargs.pop("llm_model", None) or self.llm_model,
+            response_model=response_model,
+            kwargs=kwargs,
+        )
+        self.requests.append(request)
+        return request.custom_id
+
+    def add_text(self, prompt: str, **kwargs) -> str:
+        """Queue a `generate_text` call, returning its custom id.
+
+        `image_url` is sent as an image, as `generate_text` sends it; options
+        that only apply to direct calls (`cache`, `coalesce`, ...) are ignored.
+        """
+        return self._add(prompt, None, kwargs)
+
+    def add_data(self, prompt: str, response_model: Type[BaseModel], **kwargs) -> str:
+        """Queue a `generate_data` call, returning its custom id."""
+        return self._add(prompt, response_model, kwargs)
+
+    def to_lines(self) -> List[dict]:
+        """The batch input, in the provider's format."""
+        default_kwargs = getattr(self.provider_class, "DEFAULT_KWARGS", {})
+        return [
+            self.format.request_line(request, default_kwargs)
+            for request in self.requests
+        ]
+
+    def to_jsonl(self) -> str:
+        """The batch input, as JSONL."""
+        return "".join(json.dumps(line) + "\n" for line in self.to_lines())
+
+    def submit(self) -> str:
+        """Submit the batch, returning the job id."""
+        if not self.requests:
+            raise BatchError("Cannot submit an empty batch")
+
+        self.job_id = self.backend.submit(self.to_lines(), self.format)
+        self._submitted_at = time.perf_counter()
+        return self.job_id
+
+    def is_done(self) -> bool:
+        """Whether the submitted job has finished."""
+        if self.job_id is None:
+            raise BatchError("The batch has not been submitted")
+        return self.backend.is_done(self.job_id)
+
+    def results(self) -> BulkResult:
+        """The results of a finished job, in the order requests were added.
+
+        Structured requests are validated into their `response_model`.
+        """
+        if self.job_id is None:
+            raise BatchError("The batch has not been submitted")
+
+        parsed = dict(
+            self.format.parse_line(line) for line in self.backend.results(self.job_id)
+        )
+
+        items = []
+        for index, request in enumerate(self.requests):
+            result, error = parsed.get(request.custom_id), None
+
+            if result is None:
+                error = BatchError(f"No result for {request.custom_id}")
+            elif isinstance(result, BatchError):
+                result, error = None, result
+            elif request.response_model is not None:
+                try:
+                    result = (
+                        request.response_model.model_validate_json(result)
+                        if isinstance(result, str)
+                        else request.response_model.model_validate(result)
+                    )
+                except ValueError as e:
+                    result, error = None, e
+
+            items.append(
+                BulkItem(
+                    index=index,
+                    prompt=request.prompt,
+                    result=result,
+                    error=error,
+                    elapsed=0.0,
+                )
+            )
+
+        elapsed = time.perf_counter() - (self._submitted_at or time.perf_counter())
+        return BulkResult(items=items, elapsed=elapsed)
+
+    def wait(self, *, poll_interval: float = 30.0, timeout: float | None = None) -> BulkResult:
+        """Poll until the job finishes, then return its results."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self.is_done():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {self.job_id} did not finish in time")
+            time.sleep(poll_interval)
+
+        return self.results()
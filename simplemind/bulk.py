@@ -0,0 +1,155 @@
+"""Fan a list of prompts out over a bounded pool of workers."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict
+
+DEFAULT_CONCURRENCY = 8
+
+
+class BulkItem(BaseModel):
+    """The outcome of a single prompt in a bulk call."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    prompt: str
+    result: Any = None
+    error: Optional[Exception] = None
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        """Whether the prompt succeeded."""
+        return self.error is None
+
+
+class BulkResult(BaseModel):
+    """The outcome of a bulk call, in the same order as its prompts."""
+
+    items: List[BulkItem]
+    elapsed: float
+    concurrency: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> BulkItem:
+        return self.items[index]
+
+    @property
+    def results(self) -> List[Any]:
+        """The results, in prompt order (`None` where the prompt failed)."""
+        return [item.result for item in self.items]
+
+    @property
+    def errors(self) -> List[BulkItem]:
+        """The items that failed."""
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.items) - len(self.errors)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    @property
+    def throughput(self) -> float:
+        """Completed prompts per second."""
+        return len(self.items) / self.elapsed if self.elapsed else 0.0
+
+    def raise_for_errors(self) -> None:
+        """Raise the first error, if any prompt failed."""
+        for item in self.items:
+            if item.error is not None:
+                raise item.error
+
+
+def _run_one(func: Callable[[str], Any], index: int, prompt: str) -> BulkItem:
+    t1 = time.perf_counter()
+    try:
+        result, error = func(prompt), None
+    except Exception as e:
+        result, error = None, e
+
+    return BulkItem(
+        index=index,
+        prompt=prompt,
+        result=result,
+        error=error,
+        elapsed=time.perf_counter() - t1,
+    )
+
+
+def run_many(
+    func: Callable[[str], Any],
+    prompts: Sequence[str],
+    *,
+    concurrency: int | None = None,
+) -> BulkResult:
+    """Call `func` for every prompt using a pool of `concurrency` threads.
+
+    Errors are collected per prompt instead of aborting the batch.
+    """
+    if concurrency is None:
+        concurrency = DEFAULT_CONCURRENCY
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    t1 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        items = list(
+            pool.map(lambda args: _run_one(func, *args), enumerate(prompts))
+        )
+
+    return BulkResult(
+        items=items, elapsed=time.perf_counter() - t1, concurrency=concurrency
+    )
+
+
+async def arun_many(
+    func: Callable[[str], Awaitable[Any]],
+    prompts: Sequence[str],
+    *,
+    concurrency: int | None = None,
+) -> BulkResult:
+    """Await `func` for every prompt, with at most `concurrency` in flight.
+
+    Errors are collected per prompt instead of aborting the batch.
+    """
+    if concurrency is None:
+        concurrency = DEFAULT_CONCURRENCY
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run_one(index: int, prompt: str) -> BulkItem:
+        async with slots:
+            t1 = time.perf_counter()
+            try:
+                result, error = await func(prompt), None
+            except Exception as e:
+                result, error = None, e
+
+            return BulkItem(
+                index=index,
+                prompt=prompt,
+                result=result,
+                error=error,
+                elapsed=time.perf_counter() - t1,
+            )
+
+    t1 = time.perf_counter()
+    items = await asyncio.gather(
+        *(run_one(index, prompt) for index, prompt in enumerate(prompts))
+    )
+
+    return BulkResult(
+        items=list(items), elapsed=time.perf_counter() - t1, concurrency=concurrency
+    )
@@ -0,0 +1,121 @@
+"""Opt-in response caches for `generate_text` and `generate_data`.
+
+Enable a process-wide cache with `simplemind.enable_cache()`, or pass one
+per call (`cache=MemoryCache()`); `cache=False` bypasses caching for a call.
+`DiskCache` persists responses in SQLite, shared between processes; inspect
+and prune it with `python -m simplemind.cache`. `SemanticCache` also answers
+prompts similar to a cached one. Streamed calls are recorded, and cached
+responses are replayed to them as chunks (see `StreamReplay`).
+"""
+
+import importlib
+import threading
+from typing import TYPE_CHECKING, Dict
+
+from ._base import CACHE_VERSION, BaseCache, CacheKey, CacheStats, make_key
+from .memory import MemoryCache
+from .replay import StreamReplay, arecord_stream, record_stream
+
+if TYPE_CHECKING:
+    from .disk import TOOL_CACHE_PATH, DiskCache
+    from .semantic import BaseEmbedder, HashingEmbedder, SemanticCache, SemanticCacheStats
+
+# Caches imported on first use, as `disk` loads `sqlite3` and `semantic`
+# tries NumPy: name -> module.
+_LAZY_NAMES: Dict[str, str] = {
+    "DiskCache": ".disk",
+    "TOOL_CACHE_PATH": ".disk",
+    "BaseEmbedder": ".semantic",
+    "HashingEmbedder": ".semantic",
+    "SemanticCache": ".semantic",
+    "SemanticCacheStats": ".semantic",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_NAMES:
+        return getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_default_cache: BaseCache | None = None
+
+
+def enable_cache(cache: BaseCache | None = None) -> BaseCache:
+    """Cache every `generate_text` / `generate_data` call in `cache`
+    (a new `MemoryCache` by default), and return it."""
+    global _default_cache
+    _default_cache = cache if cache is not None else MemoryCache()
+    return _default_cache
+
+
+def disable_cache() -> None:
+    """Stop caching calls by default."""
+    global _default_cache
+    _default_cache = None
+
+
+def get_cache() -> BaseCache | None:
+    """The process-wide cache, if enabled."""
+    return _default_cache
+
+
+def resolve_cache(cache: BaseCache | bool | None) -> BaseCache | None:
+    """The cache a call should use: the process-wide one for `None` (or
+    `True`), none for `False`, or the one given."""
+    if cache is None or cache is True:
+        return _default_cache
+    if cache is False:
+        return None
+    return cache
+
+
+_enrich_cache: BaseCache | None = None
+_enrich_cache_lock = threading.Lock()
+
+
+def get_enrich_cache() -> BaseCache:
+    """The cache of `sm.tool(enrich=True)` schemas: a `DiskCache` at
+    `TOOL_CACHE_PATH`, opened on first use and shared by every tool."""
+    global _enrich_cache
+    with _enrich_cache_lock:
+        if _enrich_cache is None:
+            from .disk import TOOL_CACHE_PATH, DiskCache
+
+            _enrich_cache = DiskCache(TOOL_CACHE_PATH)
+        return _enrich_cache
+
+
+def close_enrich_cache() -> None:
+    """Close the enrichment cache, if it was opened; it reopens on next use."""
+    global _enrich_cache
+    with _enrich_cache_lock:
+        cache, _enrich_cache = _enrich_cache, None
+    if cache is not None:
+        cache.close()
+
+
+__all__ = [
+    "BaseCache",
+    "BaseEmbedder",
+    "CacheKey",
+    "CacheStats",
+    "CACHE_VERSION",
+    "DiskCache",
+    "HashingEmbedder",
+    "MemoryCache",
+    "SemanticCache",
+    "SemanticCacheStats",
+    "StreamReplay",
+    "TOOL_CACHE_PATH",
+    "arecord_stream",
+    "close_enrich_cache",
+    "disable_cache",
+    "enable_cache",
+    "get_cache",
+    "get_enrich_cache",
+    "make_key",
+    "record_stream",
+    "resolve_cache",
+]
@@ -0,0 +1,68 @@
+"""Inspect and prune a simplemind disk cache.
+
+Usage:
+    python -m simplemind.cache [--path=PATH] stats
+    python -m simplemind.cache [--path=PATH] list [--limit=N]
+    python -m simplemind.cache [--path=PATH] prune [--max-entries=N]
+        [--max-bytes=N] [--older-than=SECONDS] [--model=PROVIDER/MODEL]
+    python -m simplemind.cache [--path=PATH] clear
+"""
+
+import argparse
+from datetime import datetime
+
+from .disk import DEFAULT_PATH, DiskCache
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m simplemind.cache")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="Show the number and size of entries")
+
+    list_parser = commands.add_parser("list", help="List entries, most recent first")
+    list_parser.add_argument("--limit", type=int, default=20)
+
+    prune_parser = commands.add_parser("prune", help="Remove entries")
+    prune_parser.add_argument("--max-entries", type=int)
+    prune_parser.add_argument("--max-bytes", type=int)
+    prune_parser.add_argument("--older-than", type=float, metavar="SECONDS")
+    prune_parser.add_argument("--model")
+
+    commands.add_parser("clear", help="Remove every entry")
+
+    args = parser.parse_args(argv)
+    cache = DiskCache(args.path)
+
+    if args.command == "stats":
+        print(f"path     {cache.path}")
+        print(f"entries  {cache.stats().size}")
+        print(f"bytes    {cache.total_bytes()}")
+        for model, count in cache.models().items():
+            print(f"  {count:8d}  {model}")
+
+    elif args.command == "list":
+        for entry in cache.entries(limit=args.limit):
+            accessed = datetime.fromtimestamp(entry.accessed).isoformat(timespec="seconds")
+            prompt = entry.prompt.replace("\n", " ")
+            if len(prompt) > 60:
+                prompt = prompt[:57] + "..."
+            print(f"{entry.digest[:12]}  {accessed}  {entry.size:7d}B  {entry.model}  {prompt}")
+
+    elif args.command == "prune":
+        removed = cache.prune(
+            max_entries=args.max_entries,
+            max_bytes=args.max_bytes,
+            older_than=args.older_than,
+            model=args.model,
+        )
+        print(f"removed {removed} entries")
+
+    elif args.command == "clear":
+        cache.clear()
+        print("cleared")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from ..providers._base import BaseProvider
+
+# Part of every key: bump it when the cached value format changes, so
+# persistent caches ignore entries written by older versions.
+CACHE_VERSION = 1
+
+# Kinds of calls whose prompts a similar prompt may answer (see `SemanticCache`).
+_SIMILAR_KINDS = frozenset({"text", "data"})
+# Call kwargs that make a response depend on more than the prompt's meaning.
+_EXACT_KWARGS = frozenset({"tools", "tool_choice", "functions", "response_format"})
+
+
+class CacheKey(BaseModel):
+    """What a cached response is stored under.
+
+    `namespace` hashes everything but the prompt (the kind of call, provider,
+    model, generation kwargs and, for structured calls, the response model's
+    JSON schema); `digest` hashes the namespace and the prompt together.
+    `model` is kept in the clear so persistent caches can be inspected and
+    pruned per model. `exact` keys are only answered by an identical prompt,
+    never by a similar one.
+    """
+
+    namespace: str
+    prompt: str
+    model: Optional[str] = None
+    exact: bool = False
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{self.prompt}".encode()).hexdigest()
+
+
+class CacheStats(BaseModel):
+    """A snapshot of a cache's counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    maxsize: Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BaseCache(ABC):
+    """The base class for response caches.
+
+    Values are JSON-compatible dicts (e.g. `{"text": ...}`).
+    """
+
+    @abstractmethod
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """The cached value for `key`, or `None` on a miss."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        """Store `value` under `key`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry (the counters are kept)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache's counters."""
+        raise NotImplementedError
+
+
+def make_key(
+    kind: str,
+    provider: BaseProvider,
+    llm_model: str | None,
+    prompt: str,
+    kwargs: Dict[str, Any],
+    response_model: Type[BaseModel] | None = None,
+) -> CacheKey | None:
+    """The cache key for a call, or `None` if the call cannot be cached
+    (e.g. its kwargs include tools or other non-JSON values)."""
+    model = llm_model or provider.DEFAULT_MODEL
+    try:
+        namespace = json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "kind": kind,
+                "provider": provider.NAME,
+                # The credentials or host: another account or server may answer
+                # differently. Hashed, so the key is never kept in the clear.
+                "identity": hashlib.sha256(
+                    repr(provider.registry_key).encode()
+                ).hexdigest(),
+                "model": model,
+                "kwargs": kwargs,
+                "schema": response_model.model_json_schema()
+                if response_model is not None
+                else None,
+            },
+            sort_keys=True,
+        )
+    except TypeError:
+        return None
+
+    return CacheKey(
+        namespace=hashlib.sha256(namespace.encode()).hexdigest(),
+        prompt=prompt,
+        model=f"{provider.NAME}/{model}",
+        # E.g. a whole conversation: its latest turn differs from the earlier
+        # ones by a few words, so every turn looks like a near duplicate.
+        exact=kind not in _SIMILAR_KINDS or not _EXACT_KWARGS.isdisjoint(kwargs),
+    )
@@ -0,0 +1,219 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from ._base import BaseCache, CacheKey, CacheStats
+
+DEFAULT_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "simplemind",
+    "responses.db",
+)
+
+# Where `simplemind.tool(enrich=True)` caches the LLM's tool descriptions.
+TOOL_CACHE_PATH = os.path.join(os.path.dirname(DEFAULT_PATH), "tools.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    model TEXT,
+    prompt TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_model ON entries (model);
+"""
+
+
+class DiskEntry(BaseModel):
+    """A summary of one entry of a `DiskCache`."""
+
+    digest: str
+    model: Optional[str]
+    prompt: str
+    size: int
+    created: float
+    accessed: float
+
+
+class DiskCache(BaseCache):
+    """A persistent cache in a SQLite database (in WAL mode), safe to share
+    between threads and processes.
+
+    `max_entries` and `max_bytes` bound the cache; the least recently used
+    entries are evicted first. Entries older than `ttl` seconds are ignored
+    and removed. Hit and miss counters are per process.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+    ):
+        self.path = os.fspath(path or DEFAULT_PATH)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = CacheStats(maxsize=max_entries)
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as db:
+            db.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + n)
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._connection() as db:
+            row = db.execute(
+                "SELECT value, created FROM entries WHERE digest = ?", (key.digest,)
+            ).fetchone()
+
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                db.execute("DELETE FROM entries WHERE digest = ?", (key.digest,))
+                self._count("expirations")
+                row = None
+
+            if row is None:
+                self._count("misses")
+                return None
+
+            db.execute(
+                "UPDATE entries SET accessed = ? WHERE digest = ?", (now, key.digest)
+            )
+
+        self._count("hits")
+        return json.loads(row[0])
+
+    def set(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        # Values that are not JSON (e.g. in provider metadata) are stored as strings.
+        data = json.dumps(value, default=str)
+        now = time.time()
+
+        with self._connection() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key.digest,
+                    key.namespace,
+                    key.model,
+                    key.prompt,
+                    data,
+                    len(data.encode()),
+                    now,
+                    now,
+                ),
+            )
+
+        if self.max_entries is not None or self.max_bytes is not None:
+            evicted = self.prune(max_entries=self.max_entries, max_bytes=self.max_bytes)
+            self._count("evictions", evicted)
+
+    def prune(
+        self,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        older_than: float | None = None,
+        model: str | None = None,
+    ) -> int:
+        """Remove entries, least recently used first, and return how many.
+
+        Removes entries not accessed for `older_than` seconds, and all
+        entries of `model` (e.g. `"openai/gpt-4o-mini"`), then evicts until at
+        most `max_entries` entries and `max_bytes` bytes of values remain.
+        """
+        removed = 0
+        with self._connection() as db:
+            if older_than is not None:
+                removed += db.execute(
+                    "DELETE FROM entries WHERE accessed < ?", (time.time() - older_than,)
+                ).rowcount
+
+            if model is not None:
+                removed += db.execute(
+                    "DELETE FROM entries WHERE model = ?", (model,)
+                ).rowcount
+
+            if max_entries is not None:
+                removed += db.execute(
+                    "DELETE FROM entries WHERE digest IN ("
+                    "SELECT digest FROM entries ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                    (max_entries,),
+                ).rowcount
+
+            if max_bytes is not None:
+                removed += db.execute(
+                    "DELETE FROM entries WHERE digest IN ("
+                    "SELECT digest FROM ("
+                    "SELECT digest, SUM(size) OVER (ORDER BY accessed DESC, digest) AS total "
+                    "FROM entries) WHERE total > ?)",
+                    (max_bytes,),
+                ).rowcount
+
+        return removed
+
+    def clear(self) -> None:
+        with self._connection() as db:
+            db.execute("DELETE FROM entries")
+
+    def entries(self, limit: int | None = None) -> List[DiskEntry]:
+        """The entries, most recently used first."""
+        rows = self._connection().execute(
+            "SELECT digest, model, prompt, size, created, accessed FROM entries "
+            "ORDER BY accessed DESC LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        fields = ("digest", "model", "prompt", "size", "created", "accessed")
+        return [DiskEntry(**dict(zip(fields, row))) for row in rows]
+
+    def models(self) -> Dict[Optional[str], int]:
+        """The number of entries per model."""
+        rows = self._connection().execute(
+            "SELECT model, COUNT(*) FROM entries GROUP BY model ORDER BY model"
+        )
+        return dict(rows.fetchall())
+
+    def total_bytes(self) -> int:
+        """The total size of the cached values, in bytes."""
+        return self._connection().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def stats(self) -> CacheStats:
+        size = self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        with self._lock:
+            return self._stats.model_copy(update={"size": size})
+
+    def close(self) -> None:
+        """Close this thread's connection to the database."""
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
@@ -0,0 +1,100 @@
+import asyncio
+import bisect
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class StreamReplay(BaseModel):
+    """How a cached response is replayed to a `stream=True` caller.
+
+    By default the chunks are replayed as they were recorded, without delay
+    (a response cached by a non-streamed call is a single chunk).
+    `chunk_size` re-splits the text into chunks of that many characters
+    instead, and `timing=True` reproduces the recorded pace, including the
+    wait for the first chunk.
+    """
+
+    chunk_size: Optional[int] = Field(default=None, ge=1)
+    timing: bool = False
+
+    def plan(self, entry: Dict[str, Any]) -> List[Tuple[float, str]]:
+        """The chunks to replay for a cache entry, each with the delay before it."""
+        text = entry["text"]
+        recorded = entry.get("chunks") or [text]
+        offsets = entry.get("offsets") if self.timing else None
+
+        if self.chunk_size is None:
+            chunks = recorded
+        else:
+            chunks = [
+                text[i : i + self.chunk_size]
+                for i in range(0, len(text), self.chunk_size)
+            ] or [""]
+
+        if not offsets:
+            return [(0.0, chunk) for chunk in chunks]
+
+        # A chunk is due when its last character was recorded.
+        ends = []
+        total = 0
+        for chunk in recorded:
+            total += len(chunk)
+            ends.append(total)
+
+        plan = []
+        previous = position = 0
+        for chunk in chunks:
+            position += len(chunk)
+            i = min(bisect.bisect_left(ends, position), len(offsets) - 1)
+            plan.append((max(offsets[i] - previous, 0.0), chunk))
+            previous = max(offsets[i], previous)
+        return plan
+
+    def replay(self, entry: Dict[str, Any]) -> Iterator[str]:
+        """Replay a cache entry."""
+        for delay, chunk in self.plan(entry):
+            if delay:
+                time.sleep(delay)
+            yield chunk
+
+    async def areplay(self, entry: Dict[str, Any]) -> AsyncIterator[str]:
+        """Replay a cache entry, asynchronously."""
+        for delay, chunk in self.plan(entry):
+            if delay:
+                await asyncio.sleep(delay)
+            yield chunk
+
+
+def record_stream(
+    stream: Iterator[str], store: Callable[[Dict[str, Any]], None]
+) -> Iterator[str]:
+    """Pass `stream` through, then `store` its text, chunks and timing.
+
+    Nothing is stored if the stream fails or is not consumed to the end.
+    Empty and `None` chunks (e.g. a stream's final empty delta) are passed
+    through but not recorded.
+    """
+    start = time.perf_counter()
+    chunks, offsets = [], []
+    for chunk in stream:
+        if chunk:
+            chunks.append(chunk)
+            offsets.append(time.perf_counter() - start)
+        yield chunk
+    store({"text": "".join(chunks), "chunks": chunks, "offsets": offsets})
+
+
+async def arecord_stream(
+    stream: AsyncIterator[str], store: Callable[[Dict[str, Any]], None]
+) -> AsyncIterator[str]:
+    """Pass an async `stream` through, then `store` its text, chunks and timing."""
+    start = time.perf_counter()
+    chunks, offsets = [], []
+    async for chunk in stream:
+        if chunk:
+            chunks.append(chunk)
+            offsets.append(time.perf_counter() - start)
+        yield chunk
+    store({"text": "".join(chunks), "chunks": chunks, "offsets": offsets})
@@ -0,0 +1,256 @@
+import math
+import re
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from ._base import BaseCache, CacheKey, CacheStats
+
+try:
+    import numpy as np
+except ImportError:  # The index falls back to pure Python.
+    np = None
+
+
+class BaseEmbedder(ABC):
+    """Turns prompts into vectors for the semantic cache."""
+
+    @abstractmethod
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """One vector per text (normalized or not; the cache normalizes)."""
+        raise NotImplementedError
+
+
+class HashingEmbedder(BaseEmbedder):
+    """An offline embedder: hashed word and character-trigram counts.
+
+    Prompts are lowercased and stripped of punctuation first, so prompts
+    differing only in whitespace, casing or punctuation embed identically,
+    and prompts differing in a few words stay close.
+    """
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = dimensions
+
+    def features(self, text: str) -> List[str]:
+        words = re.findall(r"\w+", text.lower())
+        features = [f"w:{word}" for word in words]
+        for word in words:
+            padded = f"<{word}>"
+            features.extend(f"c:{padded[i:i + 3]}" for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimensions
+            for feature in self.features(text):
+                h = zlib.crc32(feature.encode())
+                vector[h % self.dimensions] += 1.0 if h & 0x80000000 else -1.0
+            vectors.append(vector)
+        return vectors
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+class _Index:
+    """Unit vectors of one namespace, searched by cosine similarity
+    (a matrix-vector product with NumPy, a loop without it)."""
+
+    def __init__(self, dimensions: int):
+        self.digests: List[str] = []
+        self.rows: Dict[str, int] = {}
+        if np is not None:
+            self.vectors = np.zeros((16, dimensions), dtype=np.float32)
+        else:
+            self.vectors = []
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def add(self, digest: str, vector: List[float]) -> None:
+        if digest in self.rows:
+            self.remove(digest)
+
+        row = len(self.digests)
+        if np is not None:
+            if row == len(self.vectors):
+                self.vectors = np.concatenate([self.vectors, np.zeros_like(self.vectors)])
+            self.vectors[row] = vector
+        else:
+            self.vectors.append(vector)
+
+        self.digests.append(digest)
+        self.rows[digest] = row
+
+    def remove(self, digest: str) -> None:
+        # Move the last row into the hole, to keep the rows contiguous.
+        row = self.rows.pop(digest)
+        last = len(self.digests) - 1
+        if row != last:
+            moved = self.digests[last]
+            self.digests[row] = moved
+            self.rows[moved] = row
+            self.vectors[row] = self.vectors[last]
+        self.digests.pop()
+        if np is None:
+            self.vectors.pop()
+
+    def best(self, vector: List[float]) -> Tuple[Optional[str], float]:
+        """The most similar entry and its similarity."""
+        if not self.digests:
+            return None, 0.0
+
+        if np is not None:
+            scores = self.vectors[: len(self.digests)] @ np.asarray(
+                vector, dtype=np.float32
+            )
+            row = int(scores.argmax())
+            return self.digests[row], float(scores[row])
+
+        scores = [sum(a * b for a, b in zip(row, vector)) for row in self.vectors]
+        row = max(range(len(scores)), key=scores.__getitem__)
+        return self.digests[row], scores[row]
+
+
+class SemanticHit(BaseModel):
+    """A lookup answered by a similar, not identical, prompt."""
+
+    prompt: str
+    matched_prompt: str
+    similarity: float
+
+
+class SemanticCacheStats(CacheStats):
+    """The counters of a `SemanticCache`, with hit-quality metrics."""
+
+    exact_hits: int = 0
+    semantic_hits: int = 0
+    # Misses whose best match was within 0.1 of the threshold.
+    near_misses: int = 0
+    mean_similarity: float = 0.0
+    min_similarity: Optional[float] = None
+    recent_hits: List[SemanticHit] = []
+
+
+class SemanticCache(BaseCache):
+    """An in-memory cache that also answers prompts similar to a cached one.
+
+    Lookups try an exact match first, then the most similar prompt cached
+    under the same namespace (same provider, model, kwargs and response
+    model); it is a hit if their cosine similarity is at least `threshold`.
+    Keys marked `exact` (conversations, and calls with tools or a response
+    format) are only answered by an exact match.
+    Uses NumPy for the similarity search if installed.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        *,
+        maxsize: int = 1024,
+        embedder: BaseEmbedder | None = None,
+        dimensions: int = 1024,
+        recent_hits: int = 100,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.embedder = embedder or HashingEmbedder(dimensions)
+        self._entries: OrderedDict[str, Tuple[CacheKey, Dict[str, Any]]] = OrderedDict()
+        self._indexes: Dict[str, _Index] = {}
+        self._lock = threading.Lock()
+        self._stats = SemanticCacheStats(maxsize=maxsize)
+        self._similarity_total = 0.0
+        self._recent_hits: Deque[SemanticHit] = deque(maxlen=recent_hits)
+
+    def _embed(self, prompt: str) -> List[float]:
+        return _normalize(list(self.embedder.embed([prompt])[0]))
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key.digest)
+            if entry is not None:
+                self._entries.move_to_end(key.digest)
+                self._stats.hits += 1
+                self._stats.exact_hits += 1
+                return entry[1]
+
+            searchable = not key.exact and key.namespace in self._indexes
+
+        # Embed outside the lock: embedders may be slow (or remote).
+        vector = self._embed(key.prompt) if searchable else None
+
+        with self._lock:
+            index = self._indexes.get(key.namespace)
+            digest, similarity = (None, 0.0)
+            if index is not None and vector is not None:
+                digest, similarity = index.best(vector)
+
+            if digest is None or similarity < self.threshold:
+                self._stats.misses += 1
+                if digest is not None and similarity >= self.threshold - 0.1:
+                    self._stats.near_misses += 1
+                return None
+
+            matched, value = self._entries[digest]
+            self._entries.move_to_end(digest)
+            self._stats.hits += 1
+            self._stats.semantic_hits += 1
+            self._similarity_total += similarity
+            if self._stats.min_similarity is None or similarity < self._stats.min_similarity:
+                self._stats.min_similarity = similarity
+            self._recent_hits.append(
+                SemanticHit(
+                    prompt=key.prompt, matched_prompt=matched.prompt, similarity=similarity
+                )
+            )
+            return value
+
+    def set(self, key: CacheKey, value: Dict[str, Any]) -> None:
+        # Exact keys are never searched, so they are not indexed.
+        vector = None if key.exact else self._embed(key.prompt)
+
+        with self._lock:
+            self._entries[key.digest] = (key, value)
+            self._entries.move_to_end(key.digest)
+
+            if vector is not None:
+                index = self._indexes.get(key.namespace)
+                if index is None:
+                    index = self._indexes[key.namespace] = _Index(len(vector))
+                index.add(key.digest, vector)
+
+            while len(self._entries) > self.maxsize:
+                digest, (evicted, _) = self._entries.popitem(last=False)
+                index = self._indexes.get(evicted.namespace)
+                if index is not None and digest in index.rows:
+                    index.remove(digest)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+
+    def stats(self) -> SemanticCacheStats:
+        with self._lock:
+            semantic_hits = self._stats.semantic_hits
+            return self._stats.model_copy(
+                update={
+                    "size": len(self._entries),
+                    "mean_similarity": self._similarity_total / semantic_hits
+                    if semantic_hits
+                    else 0.0,
+                    "recent_hits": list(self._recent_hits),
+                }
+            )
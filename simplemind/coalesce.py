@@ -0,0 +1,135 @@
+"""Single-flight coalescing of identical concurrent calls.
+
+With coalescing enabled (`simplemind.enable_coalescing()`), identical
+`generate_text` / `generate_data` calls in flight at the same time (same
+provider, model, prompt and arguments) share one provider call: the first
+caller makes it, and the others wait for it and get its result (the same
+object) or its exception. Works across threads and within an event loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CoalesceStats(BaseModel):
+    """The counters of a `Coalescer`."""
+
+    calls: int = 0
+    # Calls that went to the provider.
+    leaders: int = 0
+    # Calls that shared another call's result instead.
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class _Flight:
+    """A call in flight in some thread, and its outcome once done."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class Coalescer:
+    """Runs one call per key at a time, sharing its outcome with the callers
+    that ask for the same key while it runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task] = {}
+        self._stats = CoalesceStats()
+
+    def call(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Call `func`, or wait for the call already running for `key`."""
+        with self._lock:
+            self._stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.leaders += 1
+            else:
+                self._stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def acall(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Await `func()`, or the call already running for `key` on this loop.
+
+        The call runs in its own task: cancelling one caller does not cancel
+        it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats.calls += 1
+            task = self._tasks.get((loop, key))
+            if task is None:
+                task = self._tasks[(loop, key)] = loop.create_task(func())
+                task.add_done_callback(lambda task: self._forget(loop, key, task))
+                self._stats.leaders += 1
+            else:
+                self._stats.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _forget(self, loop: asyncio.AbstractEventLoop, key: Hashable, task) -> None:
+        with self._lock:
+            del self._tasks[(loop, key)]
+        # Mark the exception as retrieved, in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return self._stats.model_copy(
+                update={"in_flight": len(self._flights) + len(self._tasks)}
+            )
+
+
+_default_coalescer: Coalescer | None = None
+
+
+def enable_coalescing(coalescer: Coalescer | None = None) -> Coalescer:
+    """Coalesce identical concurrent `generate_text` / `generate_data` calls
+    through `coalescer` (a new `Coalescer` by default), and return it."""
+    global _default_coalescer
+    _default_coalescer = coalescer if coalescer is not None else Coalescer()
+    return _default_coalescer
+
+
+def disable_coalescing() -> None:
+    """Stop coalescing calls by default."""
+    global _default_coalescer
+    _default_coalescer = None
+
+
+def resolve_coalescer(coalesce: Coalescer | bool | None) -> Coalescer | None:
+    """The coalescer a call should use: the process-wide one for `None` (or
+    `True`), none for `False`, or the one given."""
+    if coalesce is None or coalesce is True:
+        return _default_coalescer
+    if coalesce is False:
+        return None
+    return coalesce
@@ -0,0 +1,125 @@
+"""Token-budgeted context windows for conversations.
+
+A `ContextPolicy` set on a conversation (`conversation.context_policy`)
+chooses which of its messages each send includes, without changing the
+stored history: the system messages, messages pinned through their meta,
+and the latest message are kept, and the oldest of the others are left out
+until the request fits `max_input_tokens`. Each send's choice is reported
+as a `ContextReport` in `conversation.context_reports`.
+"""
+
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from .models import Message
+
+
+def estimate_tokens(text: str) -> int:
+    """A rough token count for `text`: about four characters per token."""
+    return (len(text) + 3) // 4
+
+
+class ContextReport(BaseModel):
+    """The messages and tokens one send included and left out."""
+
+    messages_sent: int = 0
+    messages_dropped: int = 0
+    # Estimated with the policy's `token_counter`, including this turn's context.
+    tokens_sent: int = 0
+    tokens_dropped: int = 0
+    max_input_tokens: Optional[int] = None
+    # Whether the messages that cannot be dropped alone exceed the budget.
+    # They are sent anyway.
+    over_budget: bool = False
+
+
+class ContextPolicy(BaseModel):
+    """Which messages of a conversation to send each turn.
+
+    - `max_input_tokens`: leave out the oldest messages until the request
+      (messages and context) fits this many tokens. No limit by default.
+    - `keep_last`: send at most the last N messages of the conversation.
+    - `keep_system`: always send system messages (otherwise they are left
+      out like the others, oldest first).
+    - `pin_key`: always send messages whose `meta[pin_key]` is true.
+
+    The latest message is always sent. When older messages are left out,
+    assistant messages that would open the request are left out too, so the
+    request starts with a user turn. Tokens are counted with
+    `token_counter` (`estimate_tokens` by default; pass a tokenizer for exact
+    counts), for message text only: tools and per-message overhead are not
+    counted, so leave some headroom.
+    """
+
+    max_input_tokens: Optional[int] = Field(default=None, ge=1)
+    keep_last: Optional[int] = Field(default=None, ge=1)
+    keep_system: bool = True
+    pin_key: str = "pinned"
+    token_counter: Callable[[str], int] = estimate_tokens
+
+    def count_tokens(self, message: "Message") -> int:
+        """The tokens of a message's text."""
+        return self.token_counter(message.text)
+
+    def select(
+        self,
+        messages: Sequence["Message"],
+        tokens: Sequence[int],
+        context_tokens: int = 0,
+    ) -> Tuple[List[int], ContextReport]:
+        """The indices of the `messages` to send, oldest first, and the report.
+
+        `tokens` are the messages' token counts, and `context_tokens` those
+        of the turn's context, which is always sent.
+        """
+        last = len(messages) - 1
+        # Messages that are never left out.
+        kept = [
+            i == last
+            or (self.keep_system and m.role == "system")
+            or bool(m.meta.get(self.pin_key))
+            for i, m in enumerate(messages)
+        ]
+        sent = [True] * len(messages)
+
+        if self.keep_last is not None:
+            window = 0
+            for i in range(last, -1, -1):
+                if messages[i].role == "system" and self.keep_system:
+                    continue
+                window += 1
+                if window > self.keep_last and not kept[i]:
+                    sent[i] = False
+
+        total = context_tokens + sum(t for t, s in zip(tokens, sent) if s)
+        if self.max_input_tokens is not None:
+            for i in range(len(messages)):
+                if total <= self.max_input_tokens:
+                    break
+                if sent[i] and not kept[i]:
+                    sent[i] = False
+                    total -= tokens[i]
+
+        # Don't open the request with a reply to a message left out.
+        if not all(sent):
+            for i, message in enumerate(messages):
+                if not sent[i] or message.role == "system":
+                    continue
+                if message.role != "assistant" or kept[i]:
+                    break
+                sent[i] = False
+                total -= tokens[i]
+
+        indices = [i for i, s in enumerate(sent) if s]
+        return indices, ContextReport(
+            messages_sent=len(indices),
+            messages_dropped=len(messages) - len(indices),
+            tokens_sent=total,
+            tokens_dropped=sum(tokens) + context_tokens - total,
+            max_input_tokens=self.max_input_tokens,
+            over_budget=(
+                self.max_input_tokens is not None and total > self.max_input_tokens
+            ),
+        )
@@ -1,33 +1,125 @@
+import inspect
+import logging
 import time
+from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Callable
 
-import logfire
-
 from .settings import settings
 
 
+class LoggingBackend(ABC):
+    """Where the `logger` decorator sends its records."""
+
+    @abstractmethod
+    def info(self, message: str) -> None:
+        """Log an informational message."""
+
+    @abstractmethod
+    def error(self, message: str) -> None:
+        """Log an error message."""
+
+
+class LogfireBackend(LoggingBackend):
+    """Log to logfire, which is only imported on the first record."""
+
+    @cached_property
+    def logfire(self):
+        try:
+            import logfire
+        except ImportError as e:
+            raise ImportError(
+                "Please install the `logfire` package: `pip install logfire`"
+            ) from e
+
+        return logfire
+
+    def info(self, message: str) -> None:
+        self.logfire.info(message)
+
+    def error(self, message: str) -> None:
+        self.logfire.error(message)
+
+
+class StandardLoggingBackend(LoggingBackend):
+    """Log to a standard library logger."""
+
+    def __init__(self, name: str = "simplemind"):
+        self.logger = logging.getLogger(name)
+
+    def info(self, message: str) -> None:
+        self.logger.info(message)
+
+    def error(self, message: str) -> None:
+        self.logger.error(message)
+
+
+_backend: LoggingBackend = LogfireBackend()
+
+
+def get_backend() -> LoggingBackend:
+    """The backend the `logger` decorator currently logs to."""
+    return _backend
+
+
+def set_backend(backend: LoggingBackend) -> None:
+    """Send the `logger` decorator's records to `backend`."""
+    global _backend
+    _backend = backend
+
+
 def logger(func: Callable[..., Any]) -> Callable[..., Any]:
     """A decorator that logs the function parameters, function returns,
-    and exceptions raised if logging is enabled, using logfire.
+    and exceptions raised if logging is enabled, using the current backend.
     """
 
+    if inspect.iscoroutinefunction(func):
+        return _async_logger(func)
+
     def wrapper(*args, **kwargs) -> Any:
         if not settings.logging.is_enabled:
             return func(*args, **kwargs)
 
-        logfire.info(f"Calling {func.__name__} with args: {args}, kwargs: {kwargs}")
+        backend = get_backend()
+        backend.info(f"Calling {func.__name__} with args: {args}, kwargs: {kwargs}")
         t1 = time.perf_counter()
 
         try:
             result = func(*args, **kwargs)
             t2 = time.perf_counter()
-            logfire.info(f"{func.__name__} returned: {result} in {t2-t1} seconds")
+            backend.info(f"{func.__name__} returned: {result} in {t2-t1} seconds")
+
+            return result
+
+        except Exception as e:
+            t2 = time.perf_counter()
+            backend.error(f"Error in {func.__name__}: {e} in {t2-t1} seconds")
+            raise e
+
+    return wrapper
+
+
+def _async_logger(func: Callable[..., Any]) -> Callable[..., Any]:
+    """The `logger` decorator, for coroutine functions."""
+
+    async def wrapper(*args, **kwargs) -> Any:
+        if not settings.logging.is_enabled:
+            return await func(*args, **kwargs)
+
+        backend = get_backend()
+        backend.info(f"Calling {func.__name__} with args: {args}, kwargs: {kwargs}")
+        t1 = time.perf_counter()
+
+        try:
+            result = await func(*args, **kwargs)
+            t2 = time.perf_counter()
+            backend.info(f"{func.__name__} returned: {result} in {t2-t1} seconds")
 
             return result
 
         except Exception as e:
             t2 = time.perf_counter()
-            logfire.error(f"Error in {func.__name__}: {e} in {t2-t1} seconds")
+            backend.error(f"Error in {func.__name__}: {e} in {t2-t1} seconds")
             raise e
 
     return wrapper
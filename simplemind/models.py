@@ -1,15 +1,39 @@
+import json
 import uuid
+from collections import deque
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter, is_
 from os import PathLike
 from types import TracebackType
-from typing import Any, Callable, Dict, List, Literal, Optional
-
-from pydantic import BaseModel, Field
-
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    get_args,
+)
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .cache import BaseCache, CacheKey, make_key, resolve_cache
+from .context import ContextPolicy, ContextReport
 from .providers._base_tools import BaseTool
 from .utils import find_provider
 
+if TYPE_CHECKING:
+    from .providers import BaseProvider
+
 MESSAGE_ROLE = Literal["system", "user", "assistant"]
+MESSAGE_ROLES = frozenset(get_args(MESSAGE_ROLE))
+
+# Counts attribute assignments on messages. While it stays the same,
+# `Conversation.format_messages` can skip checking its messages for edits.
+_message_edits = 0
 
 
 class SMBaseModel(BaseModel):
@@ -59,6 +83,34 @@ class BasePlugin(SMBaseModel):
         raise NotImplementedError
 
 
+class Usage(BaseModel):
+    """The tokens a response used.
+
+    `input_tokens` counts only uncached input: input read from or written to
+    the provider's prompt cache is counted in `cache_read_tokens` and
+    `cache_write_tokens`.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+        )
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """The share of input tokens read from the provider's prompt cache."""
+        total = self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+        return self.cache_read_tokens / total if total else 0.0
+
+
 class Message(SMBaseModel):
     """A message in a conversation."""
 
@@ -68,10 +120,78 @@ class Message(SMBaseModel):
     raw: Optional[Any] = Field(default=None, exclude=True)
     llm_model: Optional[str] = None
     llm_provider: Optional[str] = None
+    # Token counts, for responses from providers that report them.
+    usage: Optional[Usage] = None
 
     def __str__(self):
         return f"<Message role={self.role} text={self.text!r}>"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _message_edits
+        _message_edits += 1
+        super().__setattr__(name, value)
+
+    @classmethod
+    def build(
+        cls,
+        role: MESSAGE_ROLE,
+        text: str,
+        *,
+        meta: Dict[str, Any] | None = None,
+        raw: Any = None,
+        llm_model: str | None = None,
+        llm_provider: str | None = None,
+        usage: Usage | None = None,
+    ) -> "Message":
+        """Create a message, skipping pydantic validation when the values are
+        already of the right types (as they are for messages simplemind
+        creates itself); otherwise validate them as usual.
+        """
+        if (
+            cls is not Message
+            or role not in MESSAGE_ROLES
+            or type(text) is not str
+            or not (meta is None or type(meta) is dict)
+            or not (llm_model is None or type(llm_model) is str)
+            or not (llm_provider is None or type(llm_provider) is str)
+            or not (usage is None or type(usage) is Usage)
+        ):
+            return cls(
+                role=role,
+                text=text,
+                meta=meta or {},
+                raw=raw,
+                llm_model=llm_model,
+                llm_provider=llm_provider,
+                usage=usage,
+            )
+
+        # What `model_construct` does, without its per-call overhead.
+        self = cls.__new__(cls)
+        object.__setattr__(
+            self,
+            "__dict__",
+            {
+                "date_created": datetime.now(),
+                "role": role,
+                "text": text,
+                # A copy, as validation would make.
+                "meta": {} if meta is None else dict(meta),
+                "raw": raw,
+                "llm_model": llm_model,
+                "llm_provider": llm_provider,
+                "usage": usage,
+            },
+        )
+        object.__setattr__(
+            self,
+            "__pydantic_fields_set__",
+            {"role", "text", "meta", "raw", "llm_model", "llm_provider", "usage"},
+        )
+        object.__setattr__(self, "__pydantic_extra__", None)
+        object.__setattr__(self, "__pydantic_private__", None)
+        return self
+
     @classmethod
     def from_raw_response(cls, *, text: str, raw: Any) -> "Message":
         """Create a Message instance from a raw response.
@@ -89,14 +209,74 @@ class Message(SMBaseModel):
         return self
 
 
+class _FormattedMessages:
+    """The payloads a formatter made from a conversation's messages so far,
+    with the message, role and text each was made from."""
+
+    __slots__ = ("sources", "roles", "texts", "aligned", "payloads", "kept", "edits")
+
+    def __init__(self):
+        # `_message_edits` when the messages were last checked.
+        self.edits = -1
+        self.sources: List[Message] = []
+        self.roles: List[str] = []
+        self.texts: List[str] = []
+        # One payload (or None) per message, for selecting messages by index.
+        self.aligned: List[Any] = []
+        # The payloads that are not None, and how many of them the first
+        # 1, 2, ... messages made.
+        self.payloads: List[Any] = []
+        self.kept: List[int] = []
+
+    def unchanged(self, history: List[Message]) -> int:
+        """How many of the first messages of `history` are formatted already."""
+        n = len(self.sources)
+        if n <= len(history) and history[:n] == self.sources:
+            if self.edits == _message_edits or (
+                all(map(is_, self.texts, map(attrgetter("text"), history)))
+                and all(map(is_, self.roles, map(attrgetter("role"), history)))
+            ):
+                return n
+
+        for i, message in enumerate(history[:n]):
+            if (
+                message is not self.sources[i]
+                or message.text is not self.texts[i]
+                or message.role is not self.roles[i]
+            ):
+                return i
+        return min(n, len(history))
+
+    def truncate(self, n: int) -> None:
+        """Forget the payloads of every message after the first `n`."""
+        del self.sources[n:], self.roles[n:], self.texts[n:], self.aligned[n:]
+        del self.payloads[self.kept[n - 1] if n else 0 :]
+        del self.kept[n:]
+
+
 class Conversation(SMBaseModel):
     """A conversation between a user and an assistant."""
 
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # System messages added by `prepend_system_message`, sent before `messages`.
+    system_messages: Deque[Message] = Field(default_factory=deque)
     messages: List[Message] = []
     llm_model: Optional[str] = None
     llm_provider: Optional[str] = None
     plugins: List[BasePlugin] = Field(default_factory=list, exclude=True)
+    # A provider instance to send with (e.g. a `Session`'s own), instead of
+    # looking `llm_provider` up in the registry.
+    provider: Optional[Any] = Field(default=None, exclude=True)
+    # Context for the next send only; see `add_context`.
+    context: List[Message] = Field(default_factory=list, exclude=True)
+    # Which messages each send includes, and what each send included.
+    context_policy: Optional[ContextPolicy] = Field(default=None, exclude=True)
+    context_reports: List[ContextReport] = Field(default_factory=list, exclude=True)
+    # Formatted payloads per formatter; see `format_messages`.
+    _formatted: Dict[Callable, _FormattedMessages] = PrivateAttr(default_factory=dict)
+    # The indices (in `system_messages` then `messages`) of the messages the
+    # context policy chose for the send in progress.
+    _selection: Optional[List[int]] = PrivateAttr(default=None)
 
     def __str__(self):
         return f"<Conversation id={self.id!r}>"
@@ -129,10 +309,106 @@ class Conversation(SMBaseModel):
     def prepend_system_message(
         self, text: str, meta: Dict[str, Any] | None = None
     ):
-        """Prepend a system message to the conversation."""
-        self.messages = [
-            Message(role="system", text=text, meta=meta or {})
-        ] + self.messages
+        """Prepend a system message to the conversation.
+
+        It is kept in `system_messages` (in constant time, rather than
+        copying `messages`), which providers send before `messages`.
+        """
+        self.system_messages.appendleft(Message.build("system", text, meta=meta))
+
+    def add_context(self, text: str, meta: Dict[str, Any] | None = None) -> None:
+        """Add context (e.g. retrieved memories) to the next send only.
+
+        Context is sent as a user message after the conversation's messages,
+        and dropped once sent. Unlike `prepend_system_message`, this leaves
+        the start of the request unchanged from turn to turn, so providers
+        can serve it from their prompt cache. Plugins should call this from
+        `pre_send_hook`.
+        """
+        self.context.append(Message.build("user", text, meta=meta))
+
+    def request_messages(self) -> List[Message]:
+        """The messages to send, in order: the prepended system messages, the
+        conversation's messages (those the context policy chose, during a
+        send), then this turn's context."""
+        history = [*self.system_messages, *self.messages]
+        if self._selection is not None:
+            history = [history[i] for i in self._selection]
+        return [*history, *self.context]
+
+    def format_messages(
+        self,
+        formatter: Callable[[Message], Any],
+        *,
+        context: bool = True,
+    ) -> List[Any]:
+        """The request messages (see `request_messages`), each formatted for a
+        provider's API by `formatter`, leaving out those it returns None for.
+
+        The payloads are cached per formatter (which must be the same function
+        each time, and only depend on a message's role and text), with the
+        message, role and text each was made from. A send only formats the
+        messages from the first one that differs: the messages appended since
+        the last send, or those after a message that was prepended, replaced,
+        removed or had its role or text changed. Context is formatted every
+        time, and left out with `context=False`. Payloads must not be
+        modified. During a send, only the messages the context policy chose
+        are included.
+        """
+        history = [*self.system_messages, *self.messages]
+        cached = self._formatted.get(formatter)
+        if cached is None:
+            cached = self._formatted[formatter] = _FormattedMessages()
+
+        start = cached.unchanged(history)
+        if start < len(cached.sources):
+            cached.truncate(start)
+        cached.edits = _message_edits
+
+        kept = cached.kept[-1] if cached.kept else 0
+        for message in history[start:]:
+            payload = formatter(message)
+            cached.sources.append(message)
+            cached.roles.append(message.role)
+            cached.texts.append(message.text)
+            cached.aligned.append(payload)
+            if payload is not None:
+                cached.payloads.append(payload)
+                kept += 1
+            cached.kept.append(kept)
+
+        if self._selection is None:
+            payloads = list(cached.payloads)
+        else:
+            aligned = cached.aligned
+            payloads = [aligned[i] for i in self._selection if aligned[i] is not None]
+        if context:
+            payloads += [p for p in map(formatter, self.context) if p is not None]
+        return payloads
+
+    def _select_messages(self) -> None:
+        """Apply the context policy: choose the messages of the next send,
+        and report the choice."""
+        if self.context_policy is None:
+            return
+        policy = self.context_policy
+        # Counted through `format_messages`, so only new messages are counted.
+        tokens = self.format_messages(policy.count_tokens, context=False)
+        selection, report = policy.select(
+            [*self.system_messages, *self.messages],
+            tokens,
+            sum(map(policy.count_tokens, self.context)),
+        )
+        self.context_reports.append(report)
+        if report.messages_dropped:
+            self._selection = selection
+
+    @property
+    def usage(self) -> Usage:
+        """The total token usage of the conversation's responses."""
+        return sum(
+            (m.usage for m in self.messages if m.usage is not None), Usage()
+        )
 
     def add_message(
         self,
@@ -140,35 +416,41 @@ class Conversation(SMBaseModel):
         text: str | None = None,
         *,
         meta: Optional[Dict[str, Any]] = None,
+        usage: Optional[Usage] = None,
     ):
         """Add a new message to the conversation."""
 
         assert text is not None
 
-        # Ensure meta is a dict.
-        if meta is None:
-            meta = {}
+        self._append(Message.build(role, text, meta=meta, usage=usage))
+
+    def _append(self, message: Message) -> None:
+        """Run the add-message hooks on a message, then add it."""
 
         # Execute all add-message hooks.
         for plugin in self.plugins:
             if hasattr(plugin, "add_message_hook"):
                 try:
-                    plugin.add_message_hook(
-                        self, Message(role=role, text=text, meta=meta)
-                    )
+                    plugin.add_message_hook(self, message)
                 except NotImplementedError:
                     pass
 
         # Add the message to the conversation.
-        self.messages.append(Message(role=role, text=text, meta=meta))
+        self.messages.append(message)
 
     def send(
         self,
         llm_model: str | None = None,
         llm_provider: str | None = None,
         tools: list[Callable | BaseTool] | None = None,
+        cache: BaseCache | bool | None = None,
     ) -> Message:
-        """Send the conversation to the LLM."""
+        """Send the conversation to the LLM.
+
+        With a cache (see `enable_cache()`), a conversation identical to one
+        sent before is answered from it; `cache=False` bypasses it.
+        Conversations sent with tools are not cached.
+        """
 
         # TODO: llm_model and llm_provider should override the conversation's.
 
@@ -180,9 +462,35 @@ class Conversation(SMBaseModel):
                 except NotImplementedError:
                     pass
 
-        # Find the provider and send the conversation.
-        provider = find_provider(llm_provider or self.llm_provider)
-        response = provider.send_conversation(self, tools=tools)
+        self._select_messages()
+
+        try:
+            # Find the provider and send the conversation.
+            provider = find_provider(
+                llm_provider or self.provider or self.llm_provider
+            )
+
+            # Answer from the cache, if possible.
+            cache = resolve_cache(cache)
+            key = self._cache_key(provider) if cache is not None and not tools else None
+            hit = cache.get(key) if key is not None else None
+
+            if hit is not None:
+                response = Message.build(
+                    role="assistant",
+                    text=hit["text"],
+                    meta=dict(hit["meta"]),
+                    llm_model=self.llm_model or provider.DEFAULT_MODEL,
+                    llm_provider=provider.NAME,
+                )
+            else:
+                response = provider.send_conversation(self, tools=tools)
+                if key is not None:
+                    cache.set(key, {"text": response.text, "meta": dict(response.meta)})
+        finally:
+            # Context and the selection are for one send only.
+            self.context.clear()
+            self._selection = None
 
         # Execute all post-send hooks.
         for plugin in self.plugins:
@@ -192,18 +500,103 @@ class Conversation(SMBaseModel):
                 except NotImplementedError:
                     pass
 
-        # Add the response to the conversation.
-        self.add_message(
-            role="assistant", text=response.text, meta=response.meta
-        )
+        # Add the response to the conversation, without its raw API response.
+        self._append(self._history_message(response))
 
         return response
 
+    async def asend(
+        self,
+        llm_model: str | None = None,
+        llm_provider: str | None = None,
+        tools: list[Callable | BaseTool] | None = None,
+        cache: BaseCache | bool | None = None,
+    ) -> Message:
+        """Send the conversation to the LLM, asynchronously.
+
+        With a cache (see `enable_cache()`), a conversation identical to one
+        sent before is answered from it; `cache=False` bypasses it.
+        Conversations sent with tools are not cached.
+        """
+
+        # Execute all pre send hooks.
+        for plugin in self.plugins:
+            if hasattr(plugin, "pre_send_hook"):
+                try:
+                    plugin.pre_send_hook(self)
+                except NotImplementedError:
+                    pass
+
+        self._select_messages()
+
+        try:
+            # Find the provider and send the conversation.
+            provider = find_provider(
+                llm_provider or self.provider or self.llm_provider
+            )
+
+            # Answer from the cache, if possible.
+            cache = resolve_cache(cache)
+            key = self._cache_key(provider) if cache is not None and not tools else None
+            hit = cache.get(key) if key is not None else None
+
+            if hit is not None:
+                response = Message.build(
+                    role="assistant",
+                    text=hit["text"],
+                    meta=dict(hit["meta"]),
+                    llm_model=self.llm_model or provider.DEFAULT_MODEL,
+                    llm_provider=provider.NAME,
+                )
+            else:
+                response = await provider.asend_conversation(self, tools=tools)
+                if key is not None:
+                    cache.set(key, {"text": response.text, "meta": dict(response.meta)})
+        finally:
+            # Context and the selection are for one send only.
+            self.context.clear()
+            self._selection = None
+
+        # Execute all post-send hooks.
+        for plugin in self.plugins:
+            if hasattr(plugin, "post_send_hook"):
+                try:
+                    plugin.post_send_hook(self, response)
+                except NotImplementedError:
+                    pass
+
+        # Add the response to the conversation, without its raw API response.
+        self._append(self._history_message(response))
+
+        return response
+
+    @staticmethod
+    def _history_message(response: Message) -> Message:
+        """The message to keep in the conversation for a response: the same,
+        without the raw API response (which would stay in memory for the life
+        of the conversation)."""
+        if response.raw is None:
+            return response
+        return Message.build(
+            response.role,
+            response.text,
+            meta=response.meta,
+            llm_model=response.llm_model,
+            llm_provider=response.llm_provider,
+            usage=response.usage,
+        )
+
+    def _cache_key(self, provider: "BaseProvider") -> CacheKey | None:
+        """The cache key for sending the conversation, as it is now."""
+        prompt = json.dumps(
+            [{"role": m.role, "text": m.text} for m in self.request_messages()]
+        )
+        return make_key("conversation", provider, self.llm_model, prompt, {})
+
     def get_last_message(self, role: MESSAGE_ROLE) -> Message | None:
         """Get the last message with the given role."""
-        return next(
-            (m for m in reversed(self.messages) if m.role == role), None
-        )
+        messages = chain(reversed(self.messages), reversed(self.system_messages))
+        return next((m for m in messages if m.role == role), None)
 
     def add_plugin(self, plugin: BasePlugin) -> None:
         """Add a plugin to the conversation."""
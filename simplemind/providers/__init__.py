@@ -1,26 +1,51 @@
-from typing import List, Type
+"""The LLM providers.
+
+Provider modules (and the SDKs they wrap) are only imported when a provider
+is first used, so `import simplemind` stays fast no matter how many
+providers are installed.
+"""
+
+import importlib
+from typing import Dict, List, Tuple, Type
 
 from ._base import BaseProvider
 from ._base_tools import BaseTool
-from .amazon import Amazon
-from .anthropic import Anthropic
-from .gemini import Gemini
-from .groq import Groq
-from .ollama import Ollama
-from .openai import OpenAI
-from .xai import XAI
-from .deepseek import Deepseek
-
-providers: List[Type[BaseProvider]] = [
-    Anthropic,
-    Gemini,
-    Groq,
-    OpenAI,
-    Ollama,
-    XAI,
-    Amazon,
-    Deepseek,
-]
+
+# Provider name -> (module, class name), in lookup order.
+PROVIDER_MODULES: Dict[str, Tuple[str, str]] = {
+    "anthropic": (".anthropic", "Anthropic"),
+    "gemini": (".gemini", "Gemini"),
+    "groq": (".groq", "Groq"),
+    "openai": (".openai", "OpenAI"),
+    "ollama": (".ollama", "Ollama"),
+    "xai": (".xai", "XAI"),
+    "amazon": (".amazon", "Amazon"),
+    "deepseek": (".deepseek", "Deepseek"),
+}
+
+_CLASS_NAMES = {class_name: name for name, (_, class_name) in PROVIDER_MODULES.items()}
+
+
+def load_provider(name: str) -> Type[BaseProvider]:
+    """Import and return the provider class registered under `name`."""
+    module_name, class_name = PROVIDER_MODULES[name.lower()]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)
+
+
+def __getattr__(name: str):
+    # `from simplemind.providers import OpenAI` imports only the OpenAI module.
+    if name in _CLASS_NAMES:
+        return load_provider(_CLASS_NAMES[name])
+
+    # The full list is kept for compatibility; it imports every provider.
+    if name == "providers":
+        return [load_provider(provider_name) for provider_name in PROVIDER_MODULES]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+providers: List[Type[BaseProvider]]
 
 __all__ = [
     "Anthropic",
@@ -33,5 +58,7 @@ __all__ = [
     "providers",
     "BaseProvider",
     "BaseTool",
-    "Deepseek"
+    "Deepseek",
+    "PROVIDER_MODULES",
+    "load_provider",
 ]
@@ -1,25 +1,139 @@
+import asyncio
+import copy
+import weakref
 from abc import ABC, abstractmethod
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Type, TypeVar
 
-from instructor import Instructor
 from pydantic import BaseModel
 
-from simplemind.providers._base_tools import BaseTool
+from simplemind.providers._base_tools import BaseTool, convert_tool
 
 if TYPE_CHECKING:
+    from instructor import Instructor
+
     from ..models import Conversation, Message
 
 T = TypeVar("T", bound=BaseModel)
 
 
+class loop_cached_property:
+    """Like `cached_property`, but cached once per running event loop.
+
+    Async SDK clients hold connections bound to the loop they were created
+    on, so a long-lived provider needs one client per loop.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.cache_name = f"_{name}_by_loop"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        loop = asyncio.get_running_loop()
+        cache = instance.__dict__.setdefault(
+            self.cache_name, weakref.WeakKeyDictionary()
+        )
+        if loop not in cache:
+            cache[loop] = self.func(instance)
+        return cache[loop]
+
+
+def format_chat_message(message: "Message") -> dict:
+    """A message as a chat completions API takes it."""
+    return {"role": message.role, "content": message.text}
+
+
+def structured_model(response_model: Any) -> Any:
+    """`response_model` as Instructor prepares it, built once per class.
+
+    Instructor wraps the response model in a new class on every call, so its
+    own schema caches (keyed by class) never hit. Passing it the same wrapped
+    class every time makes them hit, and the wrapped class also caches its
+    JSON schema (which JSON modes embed in the prompt). Anything other than a
+    pydantic model class is returned as is.
+    """
+    if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+        return _structured_model(response_model)
+    return response_model
+
+
+@lru_cache(maxsize=256)
+def _structured_model(response_model: Type[BaseModel]) -> Type[BaseModel]:
+    import instructor
+
+    wrapped = instructor.openai_schema(response_model)
+    schema = wrapped.model_json_schema()
+    generate = wrapped.model_json_schema
+
+    def model_json_schema(*args, **kwargs) -> dict:
+        if args or kwargs:
+            return generate(*args, **kwargs)
+        # A copy, as callers may modify it.
+        return copy.deepcopy(schema)
+
+    wrapped.model_json_schema = staticmethod(model_json_schema)
+    return wrapped
+
+
+def clear_structured_model_cache() -> None:
+    """Forget the prepared response models (e.g. after redefining a model class)."""
+    _structured_model.cache_clear()
+
+
 class BaseProvider(ABC):
     """The base provider class."""
 
     NAME: str
     DEFAULT_MODEL: str
+    IDENTITY_ATTRS: tuple[str, ...] = ("api_key",)
     supports_streaming: bool = False
     supports_structured_responses: bool = True
+    shares_http_pool: bool = False
+
+    @property
+    def registry_key(self) -> tuple:
+        """The key identifying this instance in the provider registry.
+
+        Two instances with the same name and credentials/host share a key,
+        and therefore share their (expensive) SDK clients.
+        """
+        return (
+            self.NAME.lower(),
+            *(getattr(self, attr, None) for attr in self.IDENTITY_ATTRS),
+        )
+
+    def close(self) -> None:
+        """Close the provider's clients, if they were ever created.
+
+        The clients are rebuilt lazily on next use. Clients built on the
+        shared connection pool are only dropped; the pool itself is closed
+        with `simplemind.transport.close_http_client()`. Async clients are
+        dropped too; use `aclose()` to close them gracefully.
+        """
+        self.__dict__.pop("structured_client", None)
+        self.__dict__.pop("_async_structured_client_by_loop", None)
+        self.__dict__.pop("_async_client_by_loop", None)
+        client = self.__dict__.pop("client", None)
+        if client is not None and not self.shares_http_pool:
+            if hasattr(client, "close"):
+                client.close()
+
+    async def aclose(self) -> None:
+        """Close the provider's clients, including the running loop's async client."""
+        clients = self.__dict__.get("_async_client_by_loop", {})
+        client = clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not self.shares_http_pool:
+            if hasattr(client, "close"):
+                await client.close()
+
+        self.close()
 
     @cached_property
     @abstractmethod
@@ -29,10 +143,20 @@ class BaseProvider(ABC):
 
     @cached_property
     @abstractmethod
-    def structured_client(self) -> Instructor:
+    def structured_client(self) -> "Instructor":
         """The structured client for the provider."""
         raise NotImplementedError
 
+    @loop_cached_property
+    def async_client(self) -> Any:
+        """The async client for the provider, if it has one."""
+        raise NotImplementedError
+
+    @loop_cached_property
+    def async_structured_client(self) -> Any:
+        """The async structured client for the provider, if it has one."""
+        raise NotImplementedError
+
     @abstractmethod
     def send_conversation(
         self,
@@ -67,8 +191,104 @@ class BaseProvider(ABC):
         """The tool implementation for the provider."""
         raise NotImplementedError
 
+    async def asend_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+    ) -> "Message":
+        """Send a conversation to the provider, asynchronously.
+
+        Providers without a native async client run the call in a thread.
+        """
+        return await asyncio.to_thread(
+            self.send_conversation, conversation, tools=tools
+        )
+
+    async def astructured_response(
+        self, prompt: str, response_model: Type[T], **kwargs
+    ) -> T:
+        """Get a structured response, asynchronously."""
+        return await asyncio.to_thread(
+            self.structured_response,
+            prompt=prompt,
+            response_model=response_model,
+            **kwargs,
+        )
+
+    async def agenerate_text(self, prompt: str, **kwargs) -> str:
+        """Generate text from a prompt, asynchronously."""
+        return await asyncio.to_thread(self.generate_text, prompt=prompt, **kwargs)
+
+    async def agenerate_stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Generate streaming text from a prompt, asynchronously."""
+        chunks = self.generate_stream_text(prompt=prompt, **kwargs)
+        done = object()
+
+        while (chunk := await asyncio.to_thread(next, chunks, done)) is not done:
+            yield chunk
+
+    def ping(self) -> None:
+        """Make one lightweight, authenticated request (e.g. listing models).
+
+        Raises if the provider rejects the credentials or cannot be reached.
+        """
+        raise NotImplementedError(f"{self.NAME} does not support ping")
+
+    async def aping(self) -> None:
+        """Make one lightweight, authenticated request, asynchronously."""
+        await asyncio.to_thread(self.ping)
+
+    def warmup(self, connections: int = 1, *, validate: bool = False) -> None:
+        """Build the provider's client and open `connections` pooled connections
+        to its endpoint, by pinging it concurrently.
+
+        Warm-up is best-effort: errors are ignored unless `validate` is set,
+        in which case the first one (e.g. rejected credentials) is raised.
+        Providers that cannot be pinged only build their client.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        self.client
+
+        def ping() -> Exception | None:
+            try:
+                self.ping()
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            errors = list(pool.map(lambda _: ping(), range(connections)))
+
+        self._raise_warmup_errors(errors, validate)
+
+    async def awarmup(self, connections: int = 1, *, validate: bool = False) -> None:
+        """Build the provider's async client and open `connections` pooled
+        connections on the running event loop. See `warmup()`."""
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        async def ping() -> Exception | None:
+            try:
+                await self.aping()
+            except Exception as e:
+                return e
+
+        errors = await asyncio.gather(*(ping() for _ in range(connections)))
+
+        self._raise_warmup_errors(errors, validate)
+
+    @staticmethod
+    def _raise_warmup_errors(errors: list, validate: bool) -> None:
+        if not validate:
+            return
+        for error in errors:
+            # Providers that cannot be pinged have nothing to validate.
+            if error is not None and not isinstance(error, NotImplementedError):
+                raise error
+
     def make_tools(self, tools: list[Callable | BaseTool] | None):
         if tools is not None:
-            return [self.tool.from_function(func) for func in tools]
+            return [convert_tool(self.tool, func) for func in tools]
         else:
             return []
@@ -1,8 +1,11 @@
 import inspect
+import re
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Callable, ClassVar, Literal, get_origin
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefinedType
 
@@ -22,6 +25,36 @@ def _is_required(field, func_signature, arg_name) -> bool:
     return isinstance(field.default, PydanticUndefinedType)
 
 
+_ARGS_SECTION = re.compile(r"^(Args|Arguments|Parameters|Params):\s*$")
+_OTHER_SECTION = re.compile(
+    r"^(Returns?|Yields?|Raises|Examples?|Notes?|Warnings?|See Also|References"
+    r"|Attributes|Methods|Todo|Keyword Arg(?:ument)?s|Other Parameters):\s*$"
+)
+_GOOGLE_PARAM = re.compile(r"^\s+(\w+)\s*(?:\([^)]*\))?:\s*(.+)$")
+_SPHINX_PARAM = re.compile(r"^:param\s+(?:[^:]*\s)?(\w+):\s*(.+)$")
+
+
+def _parse_docstring(doc: str | None) -> tuple[str, dict[str, str]]:
+    """A docstring's description and its parameter descriptions."""
+    description, params = [], {}
+    section = None
+
+    for line in inspect.cleandoc(doc or "").splitlines():
+        if match := _SPHINX_PARAM.match(line):
+            params[match[1]] = match[2].strip()
+            section = "other"
+        elif _ARGS_SECTION.match(line):
+            section = "args"
+        elif _OTHER_SECTION.match(line) or line.startswith(":"):
+            section = "other"
+        elif section == "args" and (match := _GOOGLE_PARAM.match(line)):
+            params[match[1]] = match[2].strip()
+        elif section is None:
+            description.append(line)
+
+    return "\n".join(description).strip(), params
+
+
 class BaseToolConfig(BaseModel):
     TYPE_CONVERSION: dict[type, str] = {
         str: "string",
@@ -46,6 +79,7 @@ class BaseTool(BaseModel, ABC):
     raw_func: Any | None = None
     tool_id: str | None = None
     function_result: str | None = None
+    _input_schema: Any = PrivateAttr(default=None)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         assert self.raw_func is not None
@@ -76,7 +110,15 @@ class BaseTool(BaseModel, ABC):
         }
 
     @classmethod
-    def from_function(cls, func: Callable | "BaseTool"):
+    def from_function(cls, func: Callable | "BaseTool", *, strict: bool = True):
+        """Build a tool from a function's signature.
+
+        By default every parameter needs a `Field` (via `Annotated` or as its
+        default). With `strict=False`, other parameters are described from
+        the docstring (Google `Args:` or Sphinx `:param:` style) or their
+        name, unannotated ones are strings, and plain defaults make them
+        optional.
+        """
         # Check if the func passed is an instace of BaseTool
         if hasattr(func, "raw_func"):
             return func
@@ -84,52 +126,78 @@ class BaseTool(BaseModel, ABC):
         annotations = getattr(func, "__annotations__", {})
         properties = {}
         required = []
-        enum_values = None
         func_signature = inspect.signature(func)
 
-        for n, (arg_name, arg_type) in enumerate(annotations.items()):
-            if (  # Skipping 'return' annotation (i.e.```-> str```)
-                arg_name != "return"
+        if strict:
+            # Skipping 'return' annotation (i.e.```-> str```)
+            arguments = [(k, v) for k, v in annotations.items() if k != "return"]
+            description = (func.__doc__ or "").strip()
+        else:
+            arguments = [
+                (name, annotations.get(name, str))
+                for name, param in func_signature.parameters.items()
+                if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+            ]
+            description, param_docs = _parse_docstring(func.__doc__)
+
+        for arg_name, arg_type in arguments:
+            sig_param = func_signature.parameters[arg_name]
+            enum_values = None
+
+            # Check if argument has metadata (from Annotated)
+            if hasattr(arg_type, "__metadata__") and (
+                strict or isinstance(arg_type.__metadata__[0], FieldInfo)
+            ):
+                field = arg_type.__metadata__[0]  # Get Field info from metadata
+                field_type = arg_type.__origin__  # Get actual type
+            # Check if argument has a default value in signature
+            elif sig_param.default is not inspect.Parameter.empty and (
+                strict or isinstance(sig_param.default, FieldInfo)
             ):
-                # Check if argument has metadata (from Annotated)
-                if hasattr(arg_type, "__metadata__"):
-                    field = arg_type.__metadata__[
-                        0
-                    ]  # Get Field info from metadata
-                    field_type = arg_type.__origin__  # Get actual type
-                # Check if argument has a default value in signature
-                elif (
-                    sig_param := func_signature.parameters[arg_name]
-                ).default is not inspect.Parameter.empty:
-                    field = sig_param.default  # Use default as Field
-                    field_type = arg_type  # Use plain type annotation
-                else:
-                    # Raise error if no Field annotation found
-                    raise ValueError(
-                        f"Please add a Field annotation to `{func.__name__}.{arg_name}` parameter"
-                    )
-
-                field_type_converted = cls.convert_type(field_type)
-
-                if _is_literal(field_type):
-                    enum_values = [str(x) for x in field_type.__args__]
-
-                properties[arg_name] = BaseToolProperty(
-                    type=field_type_converted,
-                    description=field.description,
-                    enum=enum_values,
+                field = sig_param.default  # Use default as Field
+                field_type = arg_type  # Use plain type annotation
+            elif not strict:
+                field = FieldInfo(
+                    description=param_docs.get(arg_name) or arg_name.replace("_", " ")
+                )
+                # Unwrap `Annotated` metadata that is not a `Field`.
+                field_type = (
+                    arg_type.__origin__ if hasattr(arg_type, "__metadata__") else arg_type
+                )
+            else:
+                # Raise error if no Field annotation found
+                raise ValueError(
+                    f"Please add a Field annotation to `{func.__name__}.{arg_name}` parameter"
                 )
-                if _is_required(field, func_signature, arg_name):
-                    required.append(arg_name)
+
+            field_type_converted = cls.convert_type(field_type)
+
+            if _is_literal(field_type):
+                enum_values = [str(x) for x in field_type.__args__]
+
+            properties[arg_name] = BaseToolProperty(
+                type=field_type_converted,
+                description=field.description,
+                enum=enum_values,
+            )
+            if _is_required(field, func_signature, arg_name):
+                required.append(arg_name)
 
         return cls(
             name=func.__name__,
-            description=(func.__doc__ or "").strip(),
+            description=description,
             properties=properties,
             required=required,
             raw_func=func,
         )
 
+    def input_schema(self) -> Any:
+        """The provider-specific input schema, computed once for tools
+        converted by `convert_tool()` (do not mutate it)."""
+        if self._input_schema is not None:
+            return self._input_schema
+        return self.get_input_schema()
+
     @abstractmethod
     def get_input_schema(self) -> Any: ...
 
@@ -138,3 +206,56 @@ class BaseTool(BaseModel, ABC):
 
     @abstractmethod
     def get_response_schema(self) -> Any: ...
+
+
+# function -> {tool class: (fingerprint, converted tool)}. Entries go away
+# with their function.
+_tool_cache: "weakref.WeakKeyDictionary[Callable, dict]" = weakref.WeakKeyDictionary()
+_tool_cache_lock = threading.Lock()
+
+
+def _fingerprint(func: Callable) -> tuple:
+    """What `from_function` reads from `func`; the cached tool is rebuilt if it changes."""
+    return (
+        getattr(func, "__code__", None),
+        getattr(func, "__name__", None),
+        getattr(func, "__doc__", None),
+        getattr(func, "__defaults__", None),
+        getattr(func, "__kwdefaults__", None),
+        tuple(getattr(func, "__annotations__", {}).items()),
+    )
+
+
+def convert_tool(tool_class: type[BaseTool], func: Callable | BaseTool) -> BaseTool:
+    """`tool_class.from_function(func)`, cached per (tool class, function).
+
+    Returns a fresh copy of the cached tool on every call, since tools keep
+    per-call state (`tool_id`, `function_result`); the input schema is
+    computed once and shared by the copies.
+    """
+    if isinstance(func, BaseTool) or hasattr(func, "raw_func"):
+        return func
+
+    fingerprint = _fingerprint(func)
+
+    try:
+        with _tool_cache_lock:
+            cached = _tool_cache.get(func, {}).get(tool_class)
+    except TypeError:  # Not weak-referenceable (e.g. some callable objects).
+        return tool_class.from_function(func)
+
+    if cached is None or cached[0] != fingerprint:
+        tool = tool_class.from_function(func)
+        tool._input_schema = tool.get_input_schema()
+        # The cached tool must not reference `func`, or it would never be collected.
+        cached = (fingerprint, tool.model_copy(update={"raw_func": None}))
+        with _tool_cache_lock:
+            _tool_cache.setdefault(func, {})[tool_class] = cached
+
+    return cached[1].model_copy(update={"raw_func": func})
+
+
+def clear_tool_cache() -> None:
+    """Forget every converted tool."""
+    with _tool_cache_lock:
+        _tool_cache.clear()
@@ -1,13 +1,14 @@
 from functools import cached_property
 from typing import TYPE_CHECKING, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import BaseProvider, format_chat_message, structured_model
 
 if TYPE_CHECKING:
+    import instructor
+
     from ..models import Conversation, Message
 
 T = TypeVar("T", bound=BaseModel)
@@ -17,6 +18,7 @@ class Amazon(BaseProvider):
     NAME = "amazon"
     DEFAULT_MODEL = "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
     DEFAULT_MAX_TOKENS = 5_000
+    IDENTITY_ATTRS = ("profile_name",)
     supports_streaming = True
 
     def __init__(self, profile_name: str | None = None):
@@ -38,8 +40,9 @@ class Amazon(BaseProvider):
         return anthropic.AnthropicBedrock(aws_profile=self.profile_name)
 
     @cached_property
-    def structured_client(self) -> instructor.Instructor:
+    def structured_client(self) -> "instructor.Instructor":
         """A client patched with Instructor."""
+        import instructor
 
         return instructor.from_anthropic(self.client)
 
@@ -48,9 +51,7 @@ class Amazon(BaseProvider):
 
         from ..models import Message
 
-        messages = [
-            {"role": msg.role, "content": msg.text} for msg in conversation.messages
-        ]
+        messages = conversation.format_messages(format_chat_message)
 
         response = self.client.chat.completions.create(
             model=conversation.llm_model or DEFAULT_MODEL, messages=messages, **kwargs
@@ -60,7 +61,7 @@ class Amazon(BaseProvider):
         assistant_message = response.choices[0].message
 
         # Create and return a properly formatted Message instance
-        return Message(
+        return Message.build(
             role="assistant",
             text=assistant_message.content or "",
             raw=response,
@@ -79,7 +80,7 @@ class Amazon(BaseProvider):
         response = self.structured_client.chat.completions.create(
             messages=messages,
             model=llm_model or self.DEFAULT_MODEL,
-            response_model=response_model,
+            response_model=structured_model(response_model),
             max_tokens=self.DEFAULT_MAX_TOKENS,
             **kwargs,
         )
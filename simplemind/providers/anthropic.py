@@ -1,20 +1,38 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Iterator, Type, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import BaseProvider, loop_cached_property, structured_model
 from ._base_tools import BaseTool
 
 if TYPE_CHECKING:
-    from ..models import Conversation, Message
+    from ..models import Conversation, Message, Usage
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def _system_block(message: "Message") -> dict | None:
+    """A system message as a block of the `system` parameter."""
+    if message.role == "system":
+        return {"type": "text", "text": message.text}
+    return None
+
+
+def _message(message: "Message") -> dict | None:
+    """A non-system message as an item of the `messages` parameter."""
+    if message.role != "system":
+        return {"role": message.role, "content": message.text}
+    return None
+
+
+def _cache_breakpoint(block: dict) -> dict:
+    """A copy of a tool or content block, marked as the end of a cacheable prefix."""
+    return {**block, "cache_control": {"type": "ephemeral"}}
+
+
 class AnthropicTool(BaseTool):
     def get_response_schema(self) -> Any:
         assert self.is_executed, f"Tool {self.name} was not executed."
@@ -72,10 +90,12 @@ class Anthropic(BaseProvider):
     DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
     DEFAULT_MAX_TOKENS = 1_000
     DEFAULT_KWARGS = {"max_tokens": DEFAULT_MAX_TOKENS}
+    IDENTITY_ATTRS = ("api_key", "prompt_caching")
     supports_streaming = True
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, *, prompt_caching: bool = True):
         self.api_key = api_key or settings.get_api_key(self.NAME)
+        self.prompt_caching = prompt_caching
 
     @cached_property
     def client(self):
@@ -94,81 +114,228 @@ class Anthropic(BaseProvider):
     @cached_property
     def structured_client(self):
         """A client patched with Instructor."""
+        import instructor
+
         return instructor.from_anthropic(self.client)
 
-    @logger
-    def send_conversation(
+    @loop_cached_property
+    def async_client(self):
+        """The raw async Anthropic client."""
+        if not self.api_key:
+            raise ValueError("Anthropic API key is required")
+        try:
+            import anthropic
+        except ImportError as exc:
+            raise ImportError(
+                "Please install the `anthropic` package: `pip install anthropic`"
+            ) from exc
+
+        return anthropic.AsyncAnthropic(api_key=self.api_key)
+
+    @loop_cached_property
+    def async_structured_client(self):
+        """An async client patched with Instructor."""
+        import instructor
+
+        return instructor.from_anthropic(self.async_client)
+
+    def _conversation_request(
         self,
         conversation: "Conversation",
-        tools: list[Callable | BaseTool] | None = None,
+        converted_tools: list[BaseTool] | None,
         **kwargs,
-    ) -> "Message":
-        """Send a conversation to the Anthropic API."""
-        from ..models import Message
-
-        # Format messages from conversation
-        formatted_messages = [
-            {"role": msg.role, "content": msg.text}
-            for msg in conversation.messages
-        ]
+    ) -> dict:
+        """The request kwargs for sending a conversation."""
+        # System messages go in the `system` parameter, the rest in `messages`.
+        system = conversation.format_messages(_system_block, context=False)
+        formatted_messages = conversation.format_messages(_message, context=False)
 
         # Set up tools if provided
-        converted_tools = self.make_tools(tools)
-        tools_config = (
-            {"tools": [t.get_input_schema() for t in converted_tools]}
-            if tools is not None
-            else {}
+        tools = (
+            [t.input_schema() for t in converted_tools]
+            if converted_tools is not None
+            else None
         )
 
+        if self.prompt_caching:
+            self._add_cache_breakpoints(tools, system, formatted_messages)
+
+        # Per-turn context goes last, after the breakpoints, to keep the
+        # cached prefix identical between turns.
+        formatted_messages += [_message(msg) for msg in conversation.context]
+
         # Merge all kwargs
-        request_kwargs = {
+        return {
             **self.DEFAULT_KWARGS,
             **kwargs,
-            **tools_config,
+            **({"tools": tools} if tools is not None else {}),
+            **({"system": system} if system else {}),
             "model": conversation.llm_model or self.DEFAULT_MODEL,
             "messages": formatted_messages,
         }
 
+    @staticmethod
+    def _add_cache_breakpoints(
+        tools: list[dict] | None, system: list[dict], messages: list[dict]
+    ) -> None:
+        """Mark the stable prefix of a request for Anthropic's prompt cache.
+
+        Uses the 4 breakpoints Anthropic allows: after the tools, after the
+        system prompt, and after each of the last two user turns. The latest
+        turn writes the conversation so far to the cache; the turn before it
+        reads back what the previous send wrote.
+        """
+        if tools:
+            tools[-1] = _cache_breakpoint(tools[-1])
+        if system:
+            system[-1] = _cache_breakpoint(system[-1])
+
+        user_turns = [i for i, msg in enumerate(messages) if msg["role"] == "user"]
+        for i in user_turns[-2:]:
+            text = {"type": "text", "text": messages[i]["content"]}
+            messages[i] = {"role": "user", "content": [_cache_breakpoint(text)]}
+
+    @staticmethod
+    def _usage(response) -> "Usage":
+        """The token counts of a response, including prompt cache reads and writes."""
+        from ..models import Usage
+
+        return Usage(
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            cache_read_tokens=response.usage.cache_read_input_tokens or 0,
+            cache_write_tokens=response.usage.cache_creation_input_tokens or 0,
+        )
+
+    def _conversation_message(
+        self, conversation: "Conversation", response, usage: "Usage"
+    ) -> "Message":
+        """The assistant message for a conversation response."""
+        from ..models import Message
+
+        final_message = response.content[-1].text
+
+        return Message.build(
+            role="assistant",
+            text=final_message,
+            raw=response,
+            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
+            llm_provider=self.NAME,
+            usage=usage,
+        )
+
+    def ping(self) -> None:
+        """List the provider's models, to check the endpoint and credentials."""
+        self.client.models.list(limit=1)
+
+    async def aping(self) -> None:
+        """List the provider's models, asynchronously."""
+        await self.async_client.models.list(limit=1)
+
+    @staticmethod
+    def _structured_request(prompt: str | None, kwargs: dict) -> list:
+        """The messages for a structured request, popping the prompt from kwargs."""
+        # Extract the prompt from kwargs if it exists
+        prompt = prompt or kwargs.pop("prompt", kwargs.pop("messages", ""))
+
+        # Format the messages properly
+        return [{"role": "user", "content": prompt}]
+
+    @logger
+    def send_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the Anthropic API."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools if tools is not None else None, **kwargs
+        )
+
         # Make initial API call
         response = self.client.messages.create(**request_kwargs)
+        usage = self._usage(response)
 
         # Handle tool responses if needed
         while response.content[-1].type != "text":
             # Continue handling tools if the LLM is doing
             # multiple sub-seqequent/sequential tool calls
             for tool in converted_tools:
-                tool.handle(response, formatted_messages)
+                tool.handle(response, request_kwargs["messages"])
                 if tool.is_executed():
                     response = self.client.messages.create(**request_kwargs)
+                    usage += self._usage(response)
                     # Resetting the tool results in case this tool gets used again
                     tool.reset_result()
 
-        final_message = response.content[-1].text
+        return self._conversation_message(conversation, response, usage)
 
-        return Message(
-            role="assistant",
-            text=final_message,
-            raw=response,
-            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
-            llm_provider=self.NAME,
+    @logger
+    async def asend_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the Anthropic API, asynchronously."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools if tools is not None else None, **kwargs
         )
 
+        # Make initial API call
+        response = await self.async_client.messages.create(**request_kwargs)
+        usage = self._usage(response)
+
+        # Handle tool responses if needed
+        while response.content[-1].type != "text":
+            for tool in converted_tools:
+                tool.handle(response, request_kwargs["messages"])
+                if tool.is_executed():
+                    response = await self.async_client.messages.create(
+                        **request_kwargs
+                    )
+                    usage += self._usage(response)
+                    tool.reset_result()
+
+        return self._conversation_message(conversation, response, usage)
+
     @logger
     def structured_response(
-        self, response_model: Type[T], *, llm_model: str | None = None, **kwargs
+        self,
+        prompt: str | None = None,
+        response_model: Type[T] | None = None,
+        *,
+        llm_model: str | None = None,
+        **kwargs,
     ) -> T:
-        model = llm_model or self.DEFAULT_MODEL
+        messages = self._structured_request(prompt, kwargs)
 
-        # Extract the prompt from kwargs if it exists
-        prompt = kwargs.pop("prompt", kwargs.pop("messages", ""))
+        response = self.structured_client.messages.create(
+            model=llm_model or self.DEFAULT_MODEL,
+            messages=messages,
+            response_model=structured_model(response_model),
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+        return response_model.model_validate(response)
 
-        # Format the messages properly
-        messages = [{"role": "user", "content": prompt}]
+    @logger
+    async def astructured_response(
+        self,
+        prompt: str | None = None,
+        response_model: Type[T] | None = None,
+        *,
+        llm_model: str | None = None,
+        **kwargs,
+    ) -> T:
+        messages = self._structured_request(prompt, kwargs)
 
-        response = self.structured_client.messages.create(
-            model=model,
-            messages=messages,  # Add the messages parameter
-            response_model=response_model,
+        response = await self.async_structured_client.messages.create(
+            model=llm_model or self.DEFAULT_MODEL,
+            messages=messages,
+            response_model=structured_model(response_model),
             **{**self.DEFAULT_KWARGS, **kwargs},
         )
         return response_model.model_validate(response)
@@ -187,6 +354,20 @@ class Anthropic(BaseProvider):
 
         return response.content[0].text
 
+    @logger
+    async def agenerate_text(self, prompt: str, *, llm_model: str, **kwargs):
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_client.messages.create(
+            model=llm_model or self.DEFAULT_MODEL,
+            messages=messages,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        return response.content[0].text
+
     @logger
     def generate_stream_text(
         self, prompt: str, *, llm_model: str, **kwargs
@@ -206,6 +387,25 @@ class Anthropic(BaseProvider):
             for chunk in stream.text_stream:
                 yield chunk
 
+    @logger
+    async def agenerate_stream_text(
+        self, prompt: str, *, llm_model: str, **kwargs
+    ) -> AsyncIterator[str]:
+        # Prepare the messages.
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        # Make the request.
+        async with self.async_client.messages.stream(
+            model=llm_model or self.DEFAULT_MODEL,
+            messages=messages,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        ) as stream:
+            # Yield each chunk of text from the stream.
+            async for chunk in stream.text_stream:
+                yield chunk
+
     @cached_property
     def tool(self) -> Type[BaseTool]:
         """The tool implementation for Antrhopic."""
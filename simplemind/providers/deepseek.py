@@ -1,27 +1,37 @@
 import os
-from functools import cached_property
+from typing import TYPE_CHECKING
 
 from .openai import OpenAI
 
+if TYPE_CHECKING:
+    from ..models import Usage
+
 
 class Deepseek(OpenAI):
     NAME = "deepseek"
     DEFAULT_MODEL = "deepseek-chat"
+    IDENTITY_ATTRS = ("api_key", "endpoint")
 
     def __init__(self, api_key: str | None = None):
         api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
         super().__init__(api_key=api_key)
         self.endpoint = "https://api.deepseek.com/v1"
 
-    @cached_property
-    def client(self):
-        """The raw OpenAI client."""
-        if not self.api_key:
-            raise ValueError("DEEPSEEK API key is required")
-        try:
-            import openai as oa
-        except ImportError as exc:
-            raise ImportError(
-                "Please install the `openai` package: `pip install openai`"
-            ) from exc
-        return oa.OpenAI(api_key=self.api_key, base_url=self.endpoint)
+    @property
+    def client_kwargs(self) -> dict:
+        """The keyword arguments the (sync and async) OpenAI clients are built with."""
+        return {"api_key": self.api_key, "base_url": self.endpoint}
+
+    def _usage(self, usage) -> "Usage":
+        """The `Usage` of a response's `usage`."""
+        from ..models import Usage
+
+        # DeepSeek reports its (automatic) context cache hits and misses
+        # separately; together they make up `prompt_tokens`.
+        cached = getattr(usage, "prompt_cache_hit_tokens", None) or 0
+        missed = getattr(usage, "prompt_cache_miss_tokens", None)
+        return Usage(
+            input_tokens=usage.prompt_tokens - cached if missed is None else missed,
+            output_tokens=usage.completion_tokens,
+            cache_read_tokens=cached,
+        )
@@ -4,12 +4,11 @@
 from functools import cached_property
 from typing import TYPE_CHECKING, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import BaseProvider, structured_model
 
 if TYPE_CHECKING:
     from ..models import Conversation, Message
@@ -46,6 +45,8 @@ class Gemini(BaseProvider):
     @cached_property
     def structured_client(self):
         """A Gemini client patched with Instructor."""
+        import instructor
+
         return instructor.from_gemini(self.client)
 
     @logger
@@ -56,18 +57,20 @@ class Gemini(BaseProvider):
         # Convert messages to Gemini's format
         chat = self.client.start_chat()
 
+        messages = conversation.request_messages()
+
         # Send all previous messages to establish context
-        for msg in conversation.messages[:-1]:  # All messages except the last one
+        for msg in messages[:-1]:  # All messages except the last one
             chat.send_message(msg.text)
 
         # Send the final message and get response
         try:
-            response = chat.send_message(conversation.messages[-1].text)
+            response = chat.send_message(messages[-1].text)
         except Exception as e:
             raise RuntimeError(f"Failed to send conversation to Gemini API: {e}") from e
 
         # Create and return a properly formatted Message instance
-        return Message(
+        return Message.build(
             role="assistant",
             text=response.text,
             raw=response,
@@ -84,7 +87,7 @@ class Gemini(BaseProvider):
         try:
             response = self.structured_client.chat.completions.create(
                 messages=[{"role": "user", "content": prompt}],
-                response_model=response_model,
+                response_model=structured_model(response_model),
                 **kwargs,
             )
         except Exception as e:
@@ -1,12 +1,16 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Callable, Iterator, Type, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import (
+    BaseProvider,
+    format_chat_message,
+    loop_cached_property,
+    structured_model,
+)
 from ._base_tools import BaseTool
 
 if TYPE_CHECKING:
@@ -113,29 +117,42 @@ class Groq(BaseProvider):
     @cached_property
     def structured_client(self):
         """A client patched with Instructor."""
+        import instructor
+
         return instructor.from_groq(self.client)
 
-    @logger
-    def send_conversation(
+    @loop_cached_property
+    def async_client(self):
+        """The raw async Groq client."""
+        if not self.api_key:
+            raise ValueError("Groq API key is required")
+        try:
+            import groq
+        except ImportError as exc:
+            raise ImportError(
+                "Please install the `groq` package: `pip install groq`"
+            ) from exc
+        return groq.AsyncGroq(api_key=self.api_key)
+
+    @loop_cached_property
+    def async_structured_client(self):
+        """An async client patched with Instructor."""
+        import instructor
+
+        return instructor.from_groq(self.async_client)
+
+    def _conversation_request(
         self,
         conversation: "Conversation",
-        tools: list[Callable | BaseTool] | None = None,
+        converted_tools: list[BaseTool],
         **kwargs,
-    ) -> "Message":
-        """Send a conversation to the Groq API."""
-        from ..models import Message
-
+    ) -> dict:
+        """The request kwargs for sending a conversation."""
         # Format messages from conversation
-        formatted_messages = [
-            {"role": msg.role, "content": msg.text}
-            for msg in conversation.messages
-        ]
+        formatted_messages = conversation.format_messages(format_chat_message)
 
         # Set up tools if provided
-        converted_tools = self.make_tools(tools)
-        tools_config = (
-            [t.get_input_schema() for t in converted_tools] if tools else None
-        )
+        tools_config = [t.input_schema() for t in converted_tools]
 
         # Merge all kwargs
         request_kwargs = {
@@ -148,15 +165,51 @@ class Groq(BaseProvider):
         if tools_config:
             request_kwargs["tools"] = tools_config
 
+        return request_kwargs
+
+    def _conversation_message(self, conversation: "Conversation", response) -> "Message":
+        """The assistant message for a conversation response."""
+        from ..models import Message
+
+        final_message = response.choices[0].message.content
+
+        return Message.build(
+            role="assistant",
+            text=final_message or "",
+            raw=response,
+            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
+            llm_provider=self.NAME,
+        )
+
+    def ping(self) -> None:
+        """List the provider's models, to check the endpoint and credentials."""
+        self.client.models.list()
+
+    async def aping(self) -> None:
+        """List the provider's models, asynchronously."""
+        await self.async_client.models.list()
+
+    @logger
+    def send_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the Groq API."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools, **kwargs
+        )
+
         # Make initial API call
         response = self.client.chat.completions.create(**request_kwargs)
 
         # Handle tool responses if needed
         while response.choices[0].message.tool_calls:
-            print(response)
             # Handle each tool call
             for tool in converted_tools:
-                tool.handle(response, formatted_messages)
+                tool.handle(response, request_kwargs["messages"])
                 if tool.is_executed():
                     # Make another API call with the updated messages
                     response = self.client.chat.completions.create(
@@ -164,16 +217,36 @@ class Groq(BaseProvider):
                     )
                     tool.reset_result()
 
-        final_message = response.choices[0].message.content
+        return self._conversation_message(conversation, response)
 
-        return Message(
-            role="assistant",
-            text=final_message or "",
-            raw=response,
-            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
-            llm_provider=self.NAME,
+    @logger
+    async def asend_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the Groq API, asynchronously."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools, **kwargs
         )
 
+        # Make initial API call
+        response = await self.async_client.chat.completions.create(**request_kwargs)
+
+        # Handle tool responses if needed
+        while response.choices[0].message.tool_calls:
+            for tool in converted_tools:
+                tool.handle(response, request_kwargs["messages"])
+                if tool.is_executed():
+                    response = await self.async_client.chat.completions.create(
+                        **request_kwargs
+                    )
+                    tool.reset_result()
+
+        return self._conversation_message(conversation, response)
+
     @logger
     def structured_response(self, prompt: str, response_model: Type[T], **kwargs) -> T:
         # Ensure messages are provided in kwargs
@@ -183,12 +256,28 @@ class Groq(BaseProvider):
 
         response = self.structured_client.chat.completions.create(
             messages=messages,
-            response_model=response_model,
+            response_model=structured_model(response_model),
             model=kwargs.pop("llm_model", self.DEFAULT_MODEL),
             **{**self.DEFAULT_KWARGS, **kwargs},
         )
         return response_model.model_validate(response)
 
+    @logger
+    async def astructured_response(
+        self, prompt: str, response_model: Type[T], **kwargs
+    ) -> T:
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_structured_client.chat.completions.create(
+            messages=messages,
+            response_model=structured_model(response_model),
+            model=kwargs.pop("llm_model", None) or self.DEFAULT_MODEL,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+        return response_model.model_validate(response)
+
     @logger
     def generate_text(
         self,
@@ -209,6 +298,26 @@ class Groq(BaseProvider):
 
         return str(response.choices[0].message.content)
 
+    @logger
+    async def agenerate_text(
+        self,
+        prompt: str,
+        *,
+        llm_model: str,
+        **kwargs,
+    ) -> str:
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        return str(response.choices[0].message.content)
+
     @logger
     def generate_stream_text(
         self,
@@ -238,6 +347,35 @@ class Groq(BaseProvider):
                 f"Failed to generate streaming text with Groq API: {e}"
             ) from e
 
+    @logger
+    async def agenerate_stream_text(
+        self,
+        prompt: str,
+        *,
+        llm_model: str | None = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Generate streaming text using the Groq API, asynchronously."""
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            stream=True,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to generate streaming text with Groq API: {e}"
+            ) from e
+
     @cached_property
     def tool(self) -> Type[BaseTool]:
         """The tool implementation for Groq."""
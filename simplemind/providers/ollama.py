@@ -1,14 +1,20 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Iterator, Type, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import (
+    BaseProvider,
+    format_chat_message,
+    loop_cached_property,
+    structured_model,
+)
 
 if TYPE_CHECKING:
+    import instructor
+
     from ..models import Conversation, Message
 
 T = TypeVar("T", bound=BaseModel)
@@ -19,7 +25,9 @@ class Ollama(BaseProvider):
     DEFAULT_MODEL = "llama3.2"
     DEFAULT_TIMEOUT = 60
     DEFAULT_KWARGS = {}
+    IDENTITY_ATTRS = ("host_url",)
     supports_streaming = True
+    shares_http_pool = True
 
     def __init__(self, host_url: str | None = None):
         self.host_url = host_url or settings.OLLAMA_HOST_URL
@@ -35,37 +43,72 @@ class Ollama(BaseProvider):
             raise ImportError(
                 "Please install the `openai` package: `pip install openai`"
             ) from exc
-        return openai.OpenAI(base_url=f"{self.host_url}/v1", api_key="ollama")
+        from ..transport import get_http_client
+
+        return openai.OpenAI(
+            base_url=f"{self.host_url}/v1",
+            api_key="ollama",
+            http_client=get_http_client(),
+        )
 
     @cached_property
-    def structured_client(self) -> instructor.Instructor:
+    def structured_client(self) -> "instructor.Instructor":
         """A client patched with Instructor."""
+        import instructor
+
         return instructor.from_openai(
             self.client,
             mode=instructor.Mode.JSON,
         )
 
-    @logger
-    def send_conversation(self, conversation: "Conversation", **kwargs) -> "Message":
-        """Send a conversation to the Ollama API."""
-        from ..models import Message
+    @loop_cached_property
+    def async_client(self):
+        """The raw async Ollama client."""
+        if not self.host_url:
+            raise ValueError("No ollama host url provided")
+        try:
+            import openai
+        except ImportError as exc:
+            raise ImportError(
+                "Please install the `openai` package: `pip install openai`"
+            ) from exc
+        from ..transport import get_async_http_client
 
-        messages = [
-            {"role": msg.role, "content": msg.text} for msg in conversation.messages
-        ]
+        return openai.AsyncOpenAI(
+            base_url=f"{self.host_url}/v1",
+            api_key="ollama",
+            http_client=get_async_http_client(),
+        )
+
+    @loop_cached_property
+    def async_structured_client(self) -> "instructor.AsyncInstructor":
+        """An async client patched with Instructor."""
+        import instructor
 
-        request_kwargs = {
+        return instructor.from_openai(
+            self.async_client,
+            mode=instructor.Mode.JSON,
+        )
+
+    def _conversation_request(self, conversation: "Conversation", **kwargs) -> dict:
+        """The request kwargs for sending a conversation."""
+        messages = conversation.format_messages(format_chat_message)
+
+        return {
             **self.DEFAULT_KWARGS,
             **kwargs,
             "model": conversation.llm_model or self.DEFAULT_MODEL,
             "messages": messages,
         }
 
-        response = self.client.chat.completions.create(**request_kwargs)
+    def _conversation_message(self, conversation: "Conversation", response) -> "Message":
+        """The assistant message for a conversation response."""
+        from ..models import Message
+
         assistant_message = response.choices[0].message
 
         # Create and return a properly formatted Message instance
-        return Message(
+        return Message.build(
             role="assistant",
             text=assistant_message.content or "",
             raw=response,
@@ -73,6 +116,30 @@ class Ollama(BaseProvider):
             llm_provider=self.NAME,
         )
 
+    def ping(self) -> None:
+        """List the provider's models, to check the endpoint and credentials."""
+        self.client.models.list()
+
+    async def aping(self) -> None:
+        """List the provider's models, asynchronously."""
+        await self.async_client.models.list()
+
+    @logger
+    def send_conversation(self, conversation: "Conversation", **kwargs) -> "Message":
+        """Send a conversation to the Ollama API."""
+        request_kwargs = self._conversation_request(conversation, **kwargs)
+        response = self.client.chat.completions.create(**request_kwargs)
+        return self._conversation_message(conversation, response)
+
+    @logger
+    async def asend_conversation(
+        self, conversation: "Conversation", **kwargs
+    ) -> "Message":
+        """Send a conversation to the Ollama API, asynchronously."""
+        request_kwargs = self._conversation_request(conversation, **kwargs)
+        response = await self.async_client.chat.completions.create(**request_kwargs)
+        return self._conversation_message(conversation, response)
+
     @logger
     def structured_response(
         self,
@@ -90,7 +157,29 @@ class Ollama(BaseProvider):
         response = self.structured_client.chat.completions.create(
             messages=messages,
             model=llm_model or self.DEFAULT_MODEL,
-            response_model=response_model,
+            response_model=structured_model(response_model),
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+        return response_model.model_validate(response)
+
+    @logger
+    async def astructured_response(
+        self,
+        prompt: str,
+        response_model: Type[T],
+        *,
+        llm_model: str | None = None,
+        **kwargs,
+    ) -> T:
+        """Get a structured response from the Ollama API, asynchronously."""
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_structured_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            response_model=structured_model(response_model),
             **{**self.DEFAULT_KWARGS, **kwargs},
         )
         return response_model.model_validate(response)
@@ -112,6 +201,23 @@ class Ollama(BaseProvider):
 
         return response.choices[0].message.content
 
+    @logger
+    async def agenerate_text(
+        self, prompt: str, *, llm_model: str | None = None, **kwargs
+    ) -> str:
+        """Generate text using the Ollama API, asynchronously."""
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        return response.choices[0].message.content
+
     @logger
     def generate_stream_text(
         self, prompt: str, *, llm_model: str, **kwargs
@@ -132,3 +238,24 @@ class Ollama(BaseProvider):
         for chunk in response:
             if chunk.choices[0].delta.content is not None:
                 yield chunk.choices[0].delta.content
+
+    @logger
+    async def agenerate_stream_text(
+        self, prompt: str, *, llm_model: str, **kwargs
+    ) -> AsyncIterator[str]:
+        # Prepare the messages.
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            stream=True,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        # Iterate over the response and yield the content.
+        async for chunk in response:
+            if chunk.choices[0].delta.content is not None:
+                yield chunk.choices[0].delta.content
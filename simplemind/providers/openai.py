@@ -1,16 +1,20 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Callable, Iterator, Type, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import (
+    BaseProvider,
+    format_chat_message,
+    loop_cached_property,
+    structured_model,
+)
 from ._base_tools import BaseTool
 
 if TYPE_CHECKING:
-    from ..models import Conversation, Message
+    from ..models import Conversation, Message, Usage
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -92,48 +96,95 @@ class OpenAI(BaseProvider):
     DEFAULT_MAX_TOKENS = None
     DEFAULT_KWARGS = {}
     supports_streaming = True
+    shares_http_pool = True
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or settings.get_api_key(self.NAME)
 
+    @property
+    def client_kwargs(self) -> dict:
+        """The keyword arguments the (sync and async) OpenAI clients are built with."""
+        return {"api_key": self.api_key}
+
     @cached_property
     def client(self):
         """The raw OpenAI client."""
         if not self.api_key:
-            raise ValueError("OpenAI API key is required")
+            raise ValueError(f"{self.NAME} API key is required")
         try:
             import openai as oa
         except ImportError as exc:
             raise ImportError(
                 "Please install the `openai` package: `pip install openai`"
             ) from exc
-        return oa.OpenAI(api_key=self.api_key)
+        from ..transport import get_http_client
+
+        return oa.OpenAI(**self.client_kwargs, http_client=get_http_client())
 
     @cached_property
     def structured_client(self):
         """A OpenAI client with Instructor."""
+        import instructor
+
         return instructor.from_openai(self.client)
 
-    @logger
-    def send_conversation(
+    @loop_cached_property
+    def async_client(self):
+        """The raw async OpenAI client."""
+        if not self.api_key:
+            raise ValueError(f"{self.NAME} API key is required")
+        try:
+            import openai as oa
+        except ImportError as exc:
+            raise ImportError(
+                "Please install the `openai` package: `pip install openai`"
+            ) from exc
+        from ..transport import get_async_http_client
+
+        return oa.AsyncOpenAI(
+            **self.client_kwargs, http_client=get_async_http_client()
+        )
+
+    @loop_cached_property
+    def async_structured_client(self):
+        """An async OpenAI client with Instructor."""
+        import instructor
+
+        return instructor.from_openai(self.async_client)
+
+    def ping(self) -> None:
+        """List the provider's models, to check the endpoint and credentials."""
+        self.client.models.list()
+
+    async def aping(self) -> None:
+        """List the provider's models, asynchronously."""
+        await self.async_client.models.list()
+
+    @staticmethod
+    def _prompt_messages(prompt: str, image_url: str | None = None) -> list:
+        """The messages for a single prompt, with an optional image (url or base64-encoded)."""
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": prompt}]},
+        ]
+
+        if image_url:
+            messages[0]["content"].append(
+                {"type": "image_url", "image_url": {"url": image_url}}
+            )
+        return messages
+
+    def _conversation_request(
         self,
         conversation: "Conversation",
-        tools: list[Callable | BaseTool] | None = None,
+        converted_tools: list[BaseTool],
         **kwargs,
-    ) -> "Message":
-        """Send a conversation to the OpenAI API."""
-        from ..models import Message
-
+    ) -> dict:
+        """The request kwargs for sending a conversation."""
         # Format messages from conversation
-        formatted_messages = [
-            {"role": msg.role, "content": msg.text} for msg in conversation.messages
-        ]
+        formatted_messages = conversation.format_messages(format_chat_message)
 
         # Set up tools if provided
-        converted_tools = self.make_tools(tools)
-        tools_config = (
-            [t.get_input_schema() for t in converted_tools] if tools else None
-        )
+        tools_config = [t.input_schema() for t in converted_tools]
 
         # Merge all kwargs
         request_kwargs = {
@@ -146,6 +197,50 @@ class OpenAI(BaseProvider):
         if tools_config:
             request_kwargs["tools"] = tools_config
 
+        return request_kwargs
+
+    def _conversation_message(self, conversation: "Conversation", response) -> "Message":
+        """The assistant message for a conversation response."""
+        from ..models import Message
+
+        final_message = response.choices[0].message.content
+
+        return Message.build(
+            role="assistant",
+            text=final_message or "",
+            raw=response,
+            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
+            llm_provider=self.NAME,
+            usage=self._usage(response.usage) if response.usage is not None else None,
+        )
+
+    def _usage(self, usage) -> "Usage":
+        """The `Usage` of a response's `usage`."""
+        from ..models import Usage
+
+        # OpenAI caches prompt prefixes automatically; cached tokens are
+        # included in `prompt_tokens`.
+        details = usage.prompt_tokens_details
+        cached = (details.cached_tokens or 0) if details is not None else 0
+        return Usage(
+            input_tokens=usage.prompt_tokens - cached,
+            output_tokens=usage.completion_tokens,
+            cache_read_tokens=cached,
+        )
+
+    @logger
+    def send_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the OpenAI API."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools, **kwargs
+        )
+
         # Make initial API call
         response = self.client.chat.completions.create(**request_kwargs)
 
@@ -153,22 +248,42 @@ class OpenAI(BaseProvider):
         while response.choices[0].message.tool_calls:
             # Handle each tool call
             for tool in converted_tools:
-                tool.handle(response, formatted_messages)
+                tool.handle(response, request_kwargs["messages"])
                 if tool.is_executed():
                     # Make another API call with the updated messages
                     response = self.client.chat.completions.create(**request_kwargs)
                     tool.reset_result()
 
-        final_message = response.choices[0].message.content
+        return self._conversation_message(conversation, response)
 
-        return Message(
-            role="assistant",
-            text=final_message or "",
-            raw=response,
-            llm_model=conversation.llm_model or self.DEFAULT_MODEL,
-            llm_provider=self.NAME,
+    @logger
+    async def asend_conversation(
+        self,
+        conversation: "Conversation",
+        tools: list[Callable | BaseTool] | None = None,
+        **kwargs,
+    ) -> "Message":
+        """Send a conversation to the OpenAI API, asynchronously."""
+        converted_tools = self.make_tools(tools)
+        request_kwargs = self._conversation_request(
+            conversation, converted_tools, **kwargs
         )
 
+        # Make initial API call
+        response = await self.async_client.chat.completions.create(**request_kwargs)
+
+        # Handle tool responses if needed
+        while response.choices[0].message.tool_calls:
+            for tool in converted_tools:
+                tool.handle(response, request_kwargs["messages"])
+                if tool.is_executed():
+                    response = await self.async_client.chat.completions.create(
+                        **request_kwargs
+                    )
+                    tool.reset_result()
+
+        return self._conversation_message(conversation, response)
+
     @logger
     def structured_response(
         self,
@@ -180,21 +295,29 @@ class OpenAI(BaseProvider):
         **kwargs,
     ) -> T:
         """Get a structured response from the OpenAI API."""
-        # Ensure messages are provided in kwargs
-        messages = [
-            {"role": "user", "content": [{"type": "text", "text": prompt}]},
-        ]
-
-        """Add an image (url or base64-encoded) to the message if provided."""
-        if image_url:
-            messages[0]["content"].append(
-                {"type": "image_url", "image_url": {"url": image_url}}
-            )
-
         response = self.structured_client.chat.completions.create(
-            messages=messages,
+            messages=self._prompt_messages(prompt, image_url),
+            model=llm_model or self.DEFAULT_MODEL,
+            response_model=structured_model(response_model),
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+        return response_model.model_validate(response)
+
+    @logger
+    async def astructured_response(
+        self,
+        prompt: str,
+        response_model: Type[T],
+        *,
+        llm_model: str | None = None,
+        image_url: str | None = None,
+        **kwargs,
+    ) -> T:
+        """Get a structured response from the OpenAI API, asynchronously."""
+        response = await self.async_structured_client.chat.completions.create(
+            messages=self._prompt_messages(prompt, image_url),
             model=llm_model or self.DEFAULT_MODEL,
-            response_model=response_model,
+            response_model=structured_model(response_model),
             **{**self.DEFAULT_KWARGS, **kwargs},
         )
         return response_model.model_validate(response)
@@ -209,18 +332,25 @@ class OpenAI(BaseProvider):
         **kwargs,
     ):
         """Generate text using the OpenAI API."""
-        messages = [
-            {"role": "user", "content": [{"type": "text", "text": prompt}]},
-        ]
-
-        """Add an image (url or base64-encoded) to the message if provided."""
-        if image_url:
-            messages[0]["content"].append(
-                {"type": "image_url", "image_url": {"url": image_url}}
-            )
-
         response = self.client.chat.completions.create(
-            messages=messages,
+            messages=self._prompt_messages(prompt, image_url),
+            model=llm_model or self.DEFAULT_MODEL,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+        return response.choices[0].message.content
+
+    @logger
+    async def agenerate_text(
+        self,
+        prompt: str,
+        *,
+        llm_model: str | None = None,
+        image_url: str | None = None,
+        **kwargs,
+    ):
+        """Generate text using the OpenAI API, asynchronously."""
+        response = await self.async_client.chat.completions.create(
+            messages=self._prompt_messages(prompt, image_url),
             model=llm_model or self.DEFAULT_MODEL,
             **{**self.DEFAULT_KWARGS, **kwargs},
         )
@@ -239,18 +369,8 @@ class OpenAI(BaseProvider):
 
         Yields chunks of text as they are generated by the model.
         """
-        messages = [
-            {"role": "user", "content": [{"type": "text", "text": prompt}]},
-        ]
-
-        """Add an image (url or base64-encoded) to the message if provided."""
-        if image_url:
-            messages[0]["content"].append(
-                {"type": "image_url", "image_url": {"url": image_url}}
-            )
-
         response = self.client.chat.completions.create(
-            messages=messages,
+            messages=self._prompt_messages(prompt, image_url),
             model=llm_model or self.DEFAULT_MODEL,
             stream=True,  # Enable streaming
             **{**self.DEFAULT_KWARGS, **kwargs},
@@ -260,6 +380,27 @@ class OpenAI(BaseProvider):
             if chunk.choices[0].delta.content is not None:
                 yield chunk.choices[0].delta.content
 
+    @logger
+    async def agenerate_stream_text(
+        self,
+        prompt: str,
+        *,
+        llm_model: str | None = None,
+        image_url: str | None = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Generate streaming text using the OpenAI API, asynchronously."""
+        response = await self.async_client.chat.completions.create(
+            messages=self._prompt_messages(prompt, image_url),
+            model=llm_model or self.DEFAULT_MODEL,
+            stream=True,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        async for chunk in response:
+            if chunk.choices[0].delta.content is not None:
+                yield chunk.choices[0].delta.content
+
     @cached_property
     def tool(self) -> Type[BaseTool]:
         """The tool implementation for OpenAI."""
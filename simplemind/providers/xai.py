@@ -1,12 +1,11 @@
 from functools import cached_property
-from typing import TYPE_CHECKING, Iterator, Type, TypeVar
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Type, TypeVar
 
-import instructor
 from pydantic import BaseModel
 
 from ..logging import logger
 from ..settings import settings
-from ._base import BaseProvider
+from ._base import BaseProvider, format_chat_message, loop_cached_property
 
 if TYPE_CHECKING:
     from ..models import Conversation, Message
@@ -22,6 +21,7 @@ class XAI(BaseProvider):
     BASE_URL = "https://api.x.ai/v1"
     supports_streaming = True
     supports_structured_responses = False
+    shares_http_pool = True
 
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or settings.get_api_key(self.NAME)
@@ -37,36 +37,59 @@ class XAI(BaseProvider):
             raise ImportError(
                 "Please install the `openai` package: `pip install openai`"
             ) from exc
+        from ..transport import get_http_client
+
         return oa.OpenAI(
             api_key=self.api_key,
             base_url=self.BASE_URL,
+            http_client=get_http_client(),
         )
 
     @cached_property
     def structured_client(self):
         """A client patched with Instructor."""
+        import instructor
+
         return instructor.from_openai(self.client)
 
-    @logger
-    def send_conversation(self, conversation: "Conversation", **kwargs) -> "Message":
-        """Send a conversation to the OpenAI API."""
-        from ..models import Message
+    @loop_cached_property
+    def async_client(self):
+        """The raw async OpenAI client."""
+        if not self.api_key:
+            raise ValueError("XAI API key is required")
+        try:
+            import openai as oa
+        except ImportError as exc:
+            raise ImportError(
+                "Please install the `openai` package: `pip install openai`"
+            ) from exc
+        from ..transport import get_async_http_client
 
-        messages = [
-            {"role": msg.role, "content": msg.text} for msg in conversation.messages
-        ]
+        return oa.AsyncOpenAI(
+            api_key=self.api_key,
+            base_url=self.BASE_URL,
+            http_client=get_async_http_client(),
+        )
 
-        response = self.client.chat.completions.create(
-            model=conversation.llm_model or self.DEFAULT_MODEL,
-            messages=messages,
+    def _conversation_request(self, conversation: "Conversation", **kwargs) -> dict:
+        """The request kwargs for sending a conversation."""
+        messages = conversation.format_messages(format_chat_message)
+
+        return {
+            "model": conversation.llm_model or self.DEFAULT_MODEL,
+            "messages": messages,
             **{**self.DEFAULT_KWARGS, **kwargs},
-        )
+        }
+
+    def _conversation_message(self, conversation: "Conversation", response) -> "Message":
+        """The assistant message for a conversation response."""
+        from ..models import Message
 
         # Get the response content from the OpenAI response
         assistant_message = response.choices[0].message
 
         # Create and return a properly formatted Message instance
-        return Message(
+        return Message.build(
             role="assistant",
             text=assistant_message.content,
             raw=response,
@@ -74,6 +97,32 @@ class XAI(BaseProvider):
             llm_provider=self.NAME,
         )
 
+    def ping(self) -> None:
+        """List the provider's models, to check the endpoint and credentials."""
+        self.client.models.list()
+
+    async def aping(self) -> None:
+        """List the provider's models, asynchronously."""
+        await self.async_client.models.list()
+
+    @logger
+    def send_conversation(self, conversation: "Conversation", **kwargs) -> "Message":
+        """Send a conversation to the OpenAI API."""
+        response = self.client.chat.completions.create(
+            **self._conversation_request(conversation, **kwargs)
+        )
+        return self._conversation_message(conversation, response)
+
+    @logger
+    async def asend_conversation(
+        self, conversation: "Conversation", **kwargs
+    ) -> "Message":
+        """Send a conversation to the OpenAI API, asynchronously."""
+        response = await self.async_client.chat.completions.create(
+            **self._conversation_request(conversation, **kwargs)
+        )
+        return self._conversation_message(conversation, response)
+
     @logger
     def structured_response(
         self, prompt: str, response_model: Type[T], *, llm_model: str
@@ -97,6 +146,23 @@ class XAI(BaseProvider):
         # Return the response content.
         return str(response.choices[0].message.content)
 
+    @logger
+    async def agenerate_text(self, prompt: str, *, llm_model: str, **kwargs) -> str:
+        # Prepare the messages.
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        # Make the request.
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        # Return the response content.
+        return str(response.choices[0].message.content)
+
     @logger
     def generate_stream_text(
         self, prompt: str, *, llm_model: str, **kwargs
@@ -116,4 +182,27 @@ class XAI(BaseProvider):
 
         # Iterate over the response and yield the content.
         for chunk in response:
-            yield chunk.choices[0].delta.content
+            if chunk.choices[0].delta.content is not None:
+                yield chunk.choices[0].delta.content
+
+    @logger
+    async def agenerate_stream_text(
+        self, prompt: str, *, llm_model: str, **kwargs
+    ) -> AsyncIterator[str]:
+        # Prepare the messages.
+        messages = [
+            {"role": "user", "content": prompt},
+        ]
+
+        # Make the request.
+        response = await self.async_client.chat.completions.create(
+            messages=messages,
+            model=llm_model or self.DEFAULT_MODEL,
+            stream=True,
+            **{**self.DEFAULT_KWARGS, **kwargs},
+        )
+
+        # Iterate over the response and yield the content.
+        async for chunk in response:
+            if chunk.choices[0].delta.content is not None:
+                yield chunk.choices[0].delta.content
@@ -1,8 +1,12 @@
-from typing import Optional, Union
+import threading
+from typing import TYPE_CHECKING, Optional, Union
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+if TYPE_CHECKING:
+    from .logging import LoggingBackend
+
 
 class LoggingConfig(BaseSettings):
     """The class that holds all the logging settings for the application."""
@@ -11,7 +15,7 @@ class LoggingConfig(BaseSettings):
     model_config = SettingsConfigDict(extra="forbid")
 
     def enable_logfire(self, **kwargs) -> None:
-        """Enable logging for the application."""
+        """Enable logging for the application, to logfire."""
         # adding imports here to avoid forced dependencies
         try:
             from logging import basicConfig
@@ -22,9 +26,7 @@ class LoggingConfig(BaseSettings):
                 "To enable logging, please install logfire: `pip install logfire`"
             ) from e
 
-        self.is_enabled = True
-        logfire.configure(**kwargs)
-        basicConfig(handlers=[logfire.LogfireLoggingHandler()])
+        from .logging import LogfireBackend, set_backend
 
         try:
             logfire.configure(**kwargs)
@@ -33,11 +35,41 @@ class LoggingConfig(BaseSettings):
             self.is_enabled = False  # Reset flag on failure
             raise RuntimeError("Failed to configure logging") from e
 
+        set_backend(LogfireBackend())
+        self.is_enabled = True
+
+    def enable(self, backend: "LoggingBackend") -> None:
+        """Enable logging for the application, to the given backend."""
+        from .logging import set_backend
+
+        set_backend(backend)
+        self.is_enabled = True
+
     def disable_logfire(self) -> None:
         """Disable logging for the application."""
         self.is_enabled = False
 
 
+class HttpConfig(BaseSettings):
+    """The class that holds the connection pool settings shared by the
+    OpenAI-compatible providers."""
+
+    max_connections: int = Field(100, description="Maximum open connections")
+    max_keepalive_connections: int = Field(
+        20, description="Maximum idle connections kept alive"
+    )
+    keepalive_expiry: float = Field(
+        5.0, description="Seconds an idle connection is kept alive"
+    )
+    http2: bool = Field(False, description="Enable HTTP/2 (requires `h2`)")
+    timeout: float = Field(600.0, description="Read/write timeout, in seconds")
+    connect_timeout: float = Field(5.0, description="Connect timeout, in seconds")
+    pool_timeout: float = Field(
+        30.0, description="Seconds to wait for a free pooled connection"
+    )
+    model_config = SettingsConfigDict(env_prefix="SIMPLEMIND_HTTP_", extra="forbid")
+
+
 class Settings(BaseSettings):
     """The class that holds all the API keys for the application."""
 
@@ -59,7 +91,8 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
     )
-    logging: LoggingConfig = LoggingConfig()
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
 
     @field_validator("*", mode="before")
     @classmethod
@@ -78,4 +111,64 @@ class Settings(BaseSettings):
         return key.get_secret_value() if key else None
 
 
-settings = Settings()
+class LazySettings:
+    """Resolves `Settings` (environment variables and `.env`) on first
+    access, caches it, and re-reads it on `reload()`.
+
+    Attribute access and assignment are forwarded to the cached `Settings`.
+    """
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_settings", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Settings:
+        current = self._settings
+        if current is None:
+            with self._lock:
+                current = self._settings
+                if current is None:
+                    current = Settings()
+                    object.__setattr__(self, "_settings", current)
+        return current
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the settings have been resolved yet."""
+        return self._settings is not None
+
+    def reload(self) -> Settings:
+        """Re-read the settings from the environment and `.env`.
+
+        Runtime logging state (e.g. `enable_logfire()`) is kept. Providers
+        built from the old settings keep their credentials; new lookups pick
+        up the new ones. The shared HTTP pool picks up `http` changes once it
+        is closed (`close_providers()`).
+        """
+        with self._lock:
+            previous = self._settings
+            current = Settings()
+            if previous is not None:
+                current.logging = previous.logging
+            object.__setattr__(self, "_settings", current)
+        return current
+
+    def __getattr__(self, name: str):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(dir(self._resolve())))
+
+    def __repr__(self) -> str:
+        if self._settings is None:
+            return "<LazySettings (not loaded)>"
+        return repr(self._settings)
+
+
+settings = LazySettings()
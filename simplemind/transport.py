@@ -0,0 +1,370 @@
+"""The pooled HTTP transports shared by the OpenAI-compatible providers.
+
+The pool is configured once, through `settings.http`, and every
+OpenAI-compatible client (OpenAI, Ollama, xAI, Deepseek) is handed the same
+`httpx.Client` (or, for async calls, the same `httpx.AsyncClient` per event
+loop), so connections are reused across providers and calls.
+
+`settings.http.max_connections` bounds the sync client and each loop's async
+client separately: each has its own connection pool, so a process mixing
+sync and async calls can have more requests in flight than that in total.
+`pool_stats()` counts them all together.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import AsyncIterator, Callable, Iterator
+
+import httpx
+from pydantic import BaseModel
+
+from .settings import settings
+
+
+class PoolStats(BaseModel):
+    """A snapshot of the shared connection pool's usage."""
+
+    max_connections: int
+    in_use: int
+    peak_in_use: int
+    waiting: int
+    requests: int
+    waited: int
+    total_wait_time: float
+    max_wait_time: float
+
+    @property
+    def saturation(self) -> float:
+        """The fraction of the pool currently in use."""
+        return self.in_use / self.max_connections
+
+    @property
+    def mean_wait_time(self) -> float:
+        """The mean time spent waiting for a connection, over requests that waited."""
+        return self.total_wait_time / self.waited if self.waited else 0.0
+
+
+class _PoolMeter:
+    """Bounds concurrent requests to the pool size and records wait times.
+
+    Sync requests share `_slots`; async requests are bounded by the
+    semaphore of their loop's transport instead (see the module docstring).
+    """
+
+    def __init__(self, max_connections: int, pool_timeout: float):
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waiting = 0
+        self.requests = 0
+        self.waited = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def _start_wait(self) -> float:
+        with self._lock:
+            self.waiting += 1
+        return time.perf_counter()
+
+    def _end_wait(self, t1: float, acquired: bool) -> None:
+        wait = time.perf_counter() - t1
+
+        with self._lock:
+            self.waiting -= 1
+            self.waited += 1
+            self.total_wait_time += wait
+            self.max_wait_time = max(self.max_wait_time, wait)
+
+        if not acquired:
+            raise httpx.PoolTimeout(
+                f"No free connection in the pool after {wait:.2f} seconds"
+            )
+
+    def _acquired(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _released(self) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def acquire(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            t1 = self._start_wait()
+            acquired = self._slots.acquire(timeout=self.pool_timeout)
+            self._end_wait(t1, acquired)
+
+        self._acquired()
+
+    def release(self) -> None:
+        self._released()
+        self._slots.release()
+
+    async def acquire_async(self, slots: asyncio.Semaphore) -> None:
+        if slots.locked():
+            t1 = self._start_wait()
+            try:
+                await asyncio.wait_for(slots.acquire(), self.pool_timeout)
+            except asyncio.TimeoutError:
+                self._end_wait(t1, acquired=False)
+            except BaseException:
+                # Cancelled: no longer waiting, and no wait time to record.
+                with self._lock:
+                    self.waiting -= 1
+                raise
+            else:
+                self._end_wait(t1, acquired=True)
+        else:
+            await slots.acquire()
+
+        self._acquired()
+
+    def release_async(self, slots: asyncio.Semaphore) -> None:
+        self._released()
+        slots.release()
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(
+                max_connections=self.max_connections,
+                in_use=self.in_use,
+                peak_in_use=self.peak_in_use,
+                waiting=self.waiting,
+                requests=self.requests,
+                waited=self.waited,
+                total_wait_time=self.total_wait_time,
+                max_wait_time=self.max_wait_time,
+            )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """A response stream that gives its pool slot back once closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """An async response stream that gives its pool slot back once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._stream:
+            yield part
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """An `httpx.HTTPTransport` wrapper that meters pool usage.
+
+    `reset()` detaches the connection pool (to be closed by the caller); the
+    next request opens a new one, so clients built on this transport keep
+    working.
+    """
+
+    def __init__(self) -> None:
+        self._pool: tuple[httpx.BaseTransport, _PoolMeter] | None = None
+        self._open()
+
+    def _open(self) -> tuple[httpx.BaseTransport, _PoolMeter]:
+        with _lock:
+            if self._pool is None:
+                self._pool = (_new_transport(), _get_meter())
+            return self._pool
+
+    def reset(self) -> httpx.BaseTransport | None:
+        pool, self._pool = self._pool, None
+        return pool[0] if pool is not None else None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        transport, meter = self._pool or self._open()
+        meter.acquire()
+        try:
+            response = transport.handle_request(request)
+        except BaseException:
+            meter.release()
+            raise
+
+        response.stream = _ReleasingStream(response.stream, meter.release)
+        return response
+
+    def close(self) -> None:
+        transport = self.reset()
+        if transport is not None:
+            transport.close()
+
+
+class _AsyncMeteredTransport(httpx.AsyncBaseTransport):
+    """An `httpx.AsyncHTTPTransport` wrapper that meters pool usage."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, meter: _PoolMeter):
+        self._transport = transport
+        self._meter = meter
+        self._slots = asyncio.Semaphore(meter.max_connections)
+
+    def _release(self) -> None:
+        self._meter.release_async(self._slots)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await self._meter.acquire_async(self._slots)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        response.stream = _AsyncReleasingStream(response.stream, self._release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+_lock = threading.RLock()
+_meter: _PoolMeter | None = None
+_http_client: httpx.Client | None = None
+_metered_transport: _MeteredTransport | None = None
+
+# Async connections are bound to the event loop they were opened on, so
+# there is one async client per running loop.
+_async_http_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.http.max_connections,
+        max_keepalive_connections=settings.http.max_keepalive_connections,
+        keepalive_expiry=settings.http.keepalive_expiry,
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        settings.http.timeout,
+        connect=settings.http.connect_timeout,
+        pool=settings.http.pool_timeout,
+    )
+
+
+def _get_meter() -> _PoolMeter:
+    global _meter
+
+    if _meter is None:
+        _meter = _PoolMeter(settings.http.max_connections, settings.http.pool_timeout)
+    return _meter
+
+
+def _new_transport() -> httpx.HTTPTransport:
+    try:
+        return httpx.HTTPTransport(limits=_limits(), http2=settings.http.http2)
+    except ImportError as exc:
+        raise ImportError(
+            "Please install the `h2` package to use HTTP/2: `pip install 'httpx[http2]'`"
+        ) from exc
+
+
+def get_http_client() -> httpx.Client:
+    """The shared, pooled HTTP client, built from `settings.http` on first use."""
+    global _http_client, _metered_transport
+
+    with _lock:
+        if _http_client is None:
+            _metered_transport = _MeteredTransport()
+            _http_client = httpx.Client(
+                transport=_metered_transport, timeout=_timeout()
+            )
+        elif _metered_transport._pool is None:
+            # Reopened after `close_http_client()`: pick up the new settings.
+            _metered_transport._open()
+            _http_client.timeout = _timeout()
+
+        return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """The shared, pooled async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+
+    with _lock:
+        client = _async_http_clients.get(loop)
+        if client is None:
+            try:
+                transport = httpx.AsyncHTTPTransport(
+                    limits=_limits(), http2=settings.http.http2
+                )
+            except ImportError as exc:
+                raise ImportError(
+                    "Please install the `h2` package to use HTTP/2: `pip install 'httpx[http2]'`"
+                ) from exc
+
+            client = _async_http_clients[loop] = httpx.AsyncClient(
+                transport=_AsyncMeteredTransport(transport, _get_meter()),
+                timeout=_timeout(),
+            )
+
+        return client
+
+
+def pool_stats() -> PoolStats:
+    """A snapshot of the shared pool's saturation and wait times."""
+    with _lock:
+        return _get_meter().stats()
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client's connections.
+
+    Clients built on it (by any provider, registered or not) stay usable:
+    their next request opens a new pool, picking up any changes made to
+    `settings.http` in the meantime. Async clients are dropped; use
+    `aclose_http_client()` to close them gracefully.
+    """
+    global _meter
+
+    with _lock:
+        transport = _metered_transport.reset() if _metered_transport else None
+        _meter = None
+        _async_http_clients.clear()
+
+    if transport is not None:
+        transport.close()
+
+
+async def aclose_http_client() -> None:
+    """Close the shared async HTTP client of the running event loop."""
+    with _lock:
+        client = _async_http_clients.pop(asyncio.get_running_loop(), None)
+
+    if client is not None:
+        await client.aclose()
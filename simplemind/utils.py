@@ -1,19 +1,24 @@
 import difflib
+import sys
+import threading
+from typing import Dict, Type
 
-from .providers import BaseProvider, providers
+from .providers import PROVIDER_MODULES, BaseProvider, load_provider
 
-_PROVIDER_NAMES = [provider.NAME.lower() for provider in providers]
+# Long-lived provider instances, keyed by `BaseProvider.registry_key`.
+_registry: Dict[tuple, BaseProvider] = {}
+_registry_lock = threading.Lock()
 
 
-def find_provider(provider_name: str | None) -> BaseProvider:
+def find_provider_class(provider_name: str | None) -> Type[BaseProvider]:
     """
-    Find and instantiate a provider by name.
+    Find a provider class by name.
 
     Parameters:
         provider_name (Union[str, None]): The name of the provider to find.
 
     Returns:
-        An instance of the provider class if found.
+        The provider class if found.
 
     Raises:
         ValueError: If the provider is not specified or is not found, with a suggestion for the closest match.
@@ -21,18 +26,67 @@ def find_provider(provider_name: str | None) -> BaseProvider:
     if provider_name is None:
         raise ValueError("No provider specified.")
 
-    # Find the provider by name.
-    for provider_class in providers:
-        if provider_class.NAME.lower() == provider_name.lower():
-            # Instantiate the provider
-            return provider_class()
+    # Find the provider by name; only its module is imported.
+    if provider_name.lower() in PROVIDER_MODULES:
+        return load_provider(provider_name)
 
     # Find the closest match
     provider_found = difflib.get_close_matches(
-        provider_name.lower(), _PROVIDER_NAMES, n=1
+        provider_name.lower(), list(PROVIDER_MODULES), n=1
     )
     if provider_found:
         raise ValueError(
             f"Provider {provider_name!r} not found. Did you mean {provider_found[0]!r}?"
         )
     raise ValueError(f"Provider {provider_name} not found.")
+
+
+def find_provider(provider_name: str | BaseProvider | None, **kwargs) -> BaseProvider:
+    """
+    Find a provider by name, reusing a registered instance when possible.
+
+    Provider instances are kept in a process-wide registry keyed by provider
+    name and credentials/host, so their SDK clients (and connections) survive
+    across calls. Use `close_providers()` to release them.
+
+    Parameters:
+        provider_name (Union[str, BaseProvider, None]): The name of the provider to find.
+            A provider instance (e.g. a `Session`'s own) is returned as is.
+        **kwargs: Passed to the provider constructor (e.g. `api_key`, `host_url`).
+
+    Returns:
+        An instance of the provider class if found.
+
+    Raises:
+        ValueError: If the provider is not specified or is not found, with a suggestion for the closest match.
+    """
+    if isinstance(provider_name, BaseProvider):
+        return provider_name
+
+    provider_class = find_provider_class(provider_name)
+
+    # Instantiating is cheap: clients are only built on first use.
+    provider = provider_class(**kwargs)
+
+    with _registry_lock:
+        return _registry.setdefault(provider.registry_key, provider)
+
+
+def close_providers() -> None:
+    """Close all registered provider instances, empty the registry and close
+    the shared connection pool and the enrichment cache."""
+    with _registry_lock:
+        instances = list(_registry.values())
+        _registry.clear()
+
+    for provider in instances:
+        provider.close()
+
+    # Only close the pool if it was ever imported (and therefore created).
+    transport = sys.modules.get(f"{__package__}.transport")
+    if transport is not None:
+        transport.close_http_client()
+
+    cache = sys.modules.get(f"{__package__}.cache")
+    if cache is not None:
+        cache.close_enrich_cache()
@@ -13,3 +13,12 @@ from simplemind import Session
 def sm():
     """Fixture that provides a simplemind Session instance with default settings."""
     return Session()
+
+
+@pytest.fixture
+def stub_server():
+    """Fixture that runs a local OpenAI/Anthropic compatible stub server."""
+    from benchmarks._stub import StubServer
+
+    with StubServer() as server:
+        yield server
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+import simplemind as sm
+from simplemind.providers import Anthropic
+
+
+class ResponseModel(BaseModel):
+    result: int
+
+
+@pytest.fixture
+def ollama_stub(stub_server, monkeypatch):
+    """Point the Ollama provider at the stub server."""
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    yield stub_server
+    sm.close_providers()
+
+
+def test_agenerate_text(ollama_stub):
+    async def main():
+        return await asyncio.gather(
+            *(sm.agenerate_text(f"Hi {i}", llm_provider="ollama") for i in range(10))
+        )
+
+    assert asyncio.run(main()) == ["Hello from the stub!"] * 10
+    assert len(ollama_stub.requests) == 10
+
+
+def test_agenerate_text_stream(ollama_stub):
+    async def main():
+        chunks = await sm.agenerate_text("Hi", llm_provider="ollama", stream=True)
+        return [chunk async for chunk in chunks]
+
+    chunks = asyncio.run(main())
+    assert len(chunks) > 1
+    assert "".join(chunks) == "Hello from the stub!"
+
+
+def test_agenerate_data(ollama_stub):
+    ollama_stub.reply = '{"result": 4}'
+
+    data = asyncio.run(
+        sm.agenerate_data("What is 2+2?", llm_provider="ollama", response_model=ResponseModel)
+    )
+    assert isinstance(data, ResponseModel)
+    assert data.result == 4
+
+
+def test_conversation_asend(ollama_stub):
+    conv = sm.create_conversation(llm_provider="ollama")
+    conv.add_message(text="Hi")
+
+    response = asyncio.run(conv.asend())
+
+    assert response.text == "Hello from the stub!"
+    assert [m.role for m in conv.messages] == ["user", "assistant"]
+
+
+def test_async_clients_are_per_event_loop(ollama_stub):
+    provider = sm.find_provider("ollama")
+
+    async def client():
+        await provider.agenerate_text("Hi", llm_model="stub")
+        return provider.async_client
+
+    # A second event loop must not reuse connections bound to the first one.
+    assert asyncio.run(client()) is not asyncio.run(client())
+
+
+def test_anthropic_agenerate_text(stub_server, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    provider = Anthropic(api_key="test")
+
+    async def main():
+        text = await provider.agenerate_text("Hi", llm_model="stub")
+        chunks = [c async for c in provider.agenerate_stream_text("Hi", llm_model="stub")]
+        return text, chunks
+
+    text, chunks = asyncio.run(main())
+    assert text == "Hello from the stub!"
+    assert "".join(chunks) == "Hello from the stub!"
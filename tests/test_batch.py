@@ -0,0 +1,101 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+import simplemind as sm
+from simplemind.batch import BatchError
+
+
+class Poem(BaseModel):
+    title: str
+    lines: int
+
+
+def responder(line: dict) -> str:
+    body = line.get("body") or line.get("params")
+    prompt = body["messages"][0]["content"]
+    if "response_format" in body or "tool_choice" in body:
+        return json.dumps({"title": prompt, "lines": 4})
+    return prompt.upper()
+
+
+@pytest.mark.parametrize("llm_provider", ["openai", "anthropic"])
+def test_local_batch_roundtrip(llm_provider, tmp_path):
+    backend = sm.LocalBatchBackend(tmp_path, responder=responder)
+    batch = sm.Batch(llm_provider=llm_provider, backend=backend)
+
+    batch.add_text("hello")
+    batch.add_data("moon", response_model=Poem)
+    batch.add_text("bye", llm_model="another-model")
+
+    job_id = batch.submit()
+    assert (tmp_path / f"{job_id}.input.jsonl").exists()
+
+    result = batch.wait(poll_interval=0)
+
+    assert result.failed == 0
+    assert result.results == ["HELLO", Poem(title="moon", lines=4), "BYE"]
+    assert (tmp_path / f"{job_id}.output.jsonl").exists()
+
+
+def test_openai_batch_lines():
+    batch = sm.Batch(llm_provider="openai", backend=sm.LocalBatchBackend(".", responder))
+    batch.add_data("moon", response_model=Poem, temperature=0)
+
+    (line,) = batch.to_lines()
+
+    assert line["custom_id"] == "request-0"
+    assert line["url"] == "/v1/chat/completions"
+    assert line["body"]["model"] == "gpt-4o-mini"
+    assert line["body"]["temperature"] == 0
+    assert line["body"]["response_format"]["json_schema"]["name"] == "Poem"
+    assert batch.to_jsonl().count("\n") == 1
+
+
+def test_anthropic_batch_lines():
+    batch = sm.Batch(llm_provider="anthropic", backend=sm.LocalBatchBackend(".", responder))
+    batch.add_data("moon", response_model=Poem)
+
+    (line,) = batch.to_lines()
+
+    assert line["params"]["max_tokens"] == 1_000
+    assert line["params"]["tool_choice"] == {"type": "tool", "name": "Poem"}
+
+
+def test_invalid_results_are_per_request_errors(tmp_path):
+    backend = sm.LocalBatchBackend(tmp_path, responder=lambda line: '{"title": 1}')
+    batch = sm.Batch(llm_provider="openai", backend=backend)
+    batch.add_data("moon", response_model=Poem)
+    batch.submit()
+
+    result = batch.wait(poll_interval=0)
+
+    assert result.failed == 1
+    with pytest.raises(ValueError):
+        result.raise_for_errors()
+
+
+def test_unsupported_provider():
+    with pytest.raises(ValueError):
+        sm.Batch(llm_provider="ollama")
+
+    batch = sm.Batch(llm_provider="openai", backend=sm.LocalBatchBackend(".", responder))
+    with pytest.raises(BatchError):
+        batch.submit()
+
+
+@pytest.mark.parametrize("llm_provider", ["openai", "anthropic"])
+def test_simplemind_options_are_not_sent(llm_provider):
+    batch = sm.Batch(llm_provider=llm_provider, backend=sm.LocalBatchBackend(".", responder))
+    batch.add_text("hello", cache=False, coalesce=False, llm_provider=llm_provider)
+    batch.add_text("describe", image_url="https://example.com/moon.png")
+
+    first, second = (line.get("body") or line["params"] for line in batch.to_lines())
+
+    assert not {"cache", "coalesce", "llm_provider"} & set(first)
+    assert "image_url" not in second
+    assert "https://example.com/moon.png" in json.dumps(second["messages"])
+
+    with pytest.raises(BatchError):
+        batch.add_text("hello", stream=True)
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+import simplemind as sm
+from simplemind.bulk import arun_many, run_many
+
+
+class ResponseModel(BaseModel):
+    result: int
+
+
+def shout(prompt: str) -> str:
+    if prompt == "boom":
+        raise RuntimeError("boom")
+    return prompt.upper()
+
+
+def test_run_many_preserves_order_and_collects_errors():
+    prompts = ["a", "b", "boom", "c"]
+
+    result = run_many(shout, prompts, concurrency=3)
+
+    assert result.results == ["A", "B", None, "C"]
+    assert [item.prompt for item in result.items] == prompts
+    assert result.succeeded == 3
+    assert result.failed == 1
+    assert isinstance(result.errors[0].error, RuntimeError)
+    assert result.throughput > 0
+
+    with pytest.raises(RuntimeError):
+        result.raise_for_errors()
+
+
+def test_arun_many_bounds_concurrency():
+    in_flight = peak = 0
+
+    async def work(prompt: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return shout(prompt)
+
+    result = asyncio.run(arun_many(work, ["a", "boom", "c", "d", "e"], concurrency=2))
+
+    assert result.results == ["A", None, "C", "D", "E"]
+    assert peak == 2
+
+
+def test_session_generate_text_many(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    session = sm.Session(llm_provider="ollama")
+
+    result = session.generate_text_many([f"Hi {i}" for i in range(20)], concurrency=5)
+
+    assert result.failed == 0
+    assert result.results == ["Hello from the stub!"] * 20
+    sm.close_providers()
+
+
+def test_session_generate_data_many(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    stub_server.reply = '{"result": 4}'
+    session = sm.Session(llm_provider="ollama")
+
+    result = asyncio.run(
+        session.agenerate_data_many(["2+2?"] * 5, ResponseModel, concurrency=2)
+    )
+
+    assert [r.result for r in result.results] == [4] * 5
+    sm.close_providers()
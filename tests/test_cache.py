@@ -0,0 +1,288 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+from pydantic import BaseModel
+
+import simplemind as sm
+from simplemind.cache import (
+    BaseEmbedder,
+    CacheKey,
+    DiskCache,
+    MemoryCache,
+    SemanticCache,
+)
+
+
+class Answer(BaseModel):
+    result: str
+
+
+@pytest.fixture
+def ollama(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    yield stub_server
+    sm.disable_cache()
+    sm.close_providers()
+
+
+def key(prompt, namespace="ns"):
+    return CacheKey(namespace=namespace, prompt=prompt)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set(key("a"), {"text": "A"})
+    cache.set(key("b"), {"text": "B"})
+    assert cache.get(key("a")) == {"text": "A"}
+
+    cache.set(key("c"), {"text": "C"})
+
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) == {"text": "A"}
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 1, 1, 2)
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache(ttl=0.05)
+    cache.set(key("a"), {"text": "A"})
+    assert cache.get(key("a")) == {"text": "A"}
+
+    time.sleep(0.1)
+
+    assert cache.get(key("a")) is None
+    assert cache.stats().expirations == 1
+
+
+def test_keys_separate_namespaces():
+    cache = MemoryCache()
+    cache.set(key("a", "one"), {"text": "A"})
+
+    assert cache.get(key("a", "two")) is None
+
+
+def test_generate_text_is_cached(ollama):
+    cache = sm.enable_cache(MemoryCache())
+
+    first = sm.generate_text("Hi", llm_provider="ollama", llm_model="stub")
+    second = sm.generate_text("Hi", llm_provider="ollama", llm_model="stub")
+    sm.generate_text("Hi", llm_provider="ollama", llm_model="other")
+    sm.generate_text("Hi", llm_provider="ollama", llm_model="stub", cache=False)
+
+    assert first == second == "Hello from the stub!"
+    assert len(ollama.requests) == 3
+    assert (cache.stats().hits, cache.stats().misses) == (1, 2)
+
+
+def test_generate_data_is_cached_per_response_model(ollama):
+    ollama.reply = '{"result": "42"}'
+    cache = MemoryCache()
+
+    class Other(BaseModel):
+        result: str
+        note: str = ""
+
+    first = sm.generate_data(
+        "Hi", llm_provider="ollama", llm_model="stub", response_model=Answer, cache=cache
+    )
+    second = sm.generate_data(
+        "Hi", llm_provider="ollama", llm_model="stub", response_model=Answer, cache=cache
+    )
+    sm.generate_data(
+        "Hi", llm_provider="ollama", llm_model="stub", response_model=Other, cache=cache
+    )
+
+    assert first.result == second.result == "42"
+    assert isinstance(second, Answer)
+    assert len(ollama.requests) == 2
+
+
+def test_agenerate_text_is_cached(ollama):
+    cache = MemoryCache()
+
+    async def main():
+        for _ in range(3):
+            await sm.agenerate_text(
+                "Hi", llm_provider="ollama", llm_model="stub", cache=cache
+            )
+
+    asyncio.run(main())
+
+    assert len(ollama.requests) == 1
+    assert cache.stats().hits == 2
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.db"
+    DiskCache(path).set(key("a"), {"text": "A"})
+
+    assert DiskCache(path).get(key("a")) == {"text": "A"}
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", max_entries=2)
+    cache.set(key("a"), {"text": "A"})
+    time.sleep(0.01)
+    cache.set(key("b"), {"text": "B"})
+    time.sleep(0.01)
+    cache.get(key("a"))
+    cache.set(key("c"), {"text": "C"})
+
+    assert cache.get(key("b")) is None
+    assert cache.get(key("a")) == {"text": "A"}
+    assert cache.stats().evictions == 1
+
+    cache.prune(max_bytes=len('{"text": "A"}'))
+    assert cache.stats().size == 1
+
+
+def test_disk_cache_expires_entries(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", ttl=0.05)
+    cache.set(key("a"), {"text": "A"})
+    time.sleep(0.1)
+
+    assert cache.get(key("a")) is None
+    assert cache.stats().size == 0
+
+
+def test_disk_cache_is_shared_between_processes(tmp_path):
+    path = tmp_path / "cache.db"
+    code = (
+        "import sys; from simplemind.cache import CacheKey, DiskCache; "
+        "cache = DiskCache(sys.argv[1]); "
+        "[cache.set(CacheKey(namespace=sys.argv[2], prompt=str(i)), {'text': str(i)}) "
+        "for i in range(50)]"
+    )
+    workers = [
+        subprocess.Popen([sys.executable, "-c", code, str(path), f"worker-{n}"])
+        for n in range(4)
+    ]
+    assert all(worker.wait() == 0 for worker in workers)
+
+    cache = DiskCache(path)
+    assert cache.stats().size == 200
+    assert cache.get(key("49", "worker-3")) == {"text": "49"}
+
+
+def test_disk_cache_cli(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = DiskCache(path)
+    for prompt in "abc":
+        cache.set(CacheKey(namespace="ns", prompt=prompt, model="ollama/stub"), {})
+
+    def cli(*args):
+        return subprocess.run(
+            [sys.executable, "-m", "simplemind.cache", "--path", str(path), *args],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    assert "entries  3" in cli("stats")
+    assert "ollama/stub" in cli("list")
+    assert cli("prune", "--max-entries", "1") == "removed 2 entries\n"
+    assert cache.stats().size == 1
+
+
+def test_conversation_send_is_cached(ollama, tmp_path):
+    cache = DiskCache(tmp_path / "cache.db")
+
+    def ask():
+        conversation = sm.create_conversation(llm_provider="ollama", llm_model="stub")
+        conversation.add_message("user", "Hi")
+        return conversation.send(cache=cache)
+
+    assert ask().text == ask().text == "Hello from the stub!"
+    assert len(ollama.requests) == 1
+
+    conversation = sm.create_conversation(llm_provider="ollama", llm_model="stub")
+    conversation.add_message("user", "Something else")
+    conversation.send(cache=cache)
+    assert len(ollama.requests) == 2
+
+
+def test_semantic_cache_matches_near_duplicates():
+    cache = SemanticCache(threshold=0.8)
+    cache.set(key("What is the capital of France?"), {"text": "Paris"})
+
+    assert cache.get(key("what is the  capital of france")) == {"text": "Paris"}
+    assert cache.get(key("What's the capital city of France?")) == {"text": "Paris"}
+    assert cache.get(key("How do I bake sourdough bread?")) is None
+    assert cache.get(key("What is the capital of France?", "other")) is None
+
+    stats = cache.stats()
+    assert (stats.exact_hits, stats.semantic_hits, stats.misses) == (0, 2, 2)
+    assert stats.min_similarity >= 0.8
+    assert stats.recent_hits[0].matched_prompt == "What is the capital of France?"
+
+
+def test_semantic_cache_evicts_from_index():
+    cache = SemanticCache(maxsize=2)
+    for prompt in ["alpha beta", "gamma delta", "epsilon zeta"]:
+        cache.set(key(prompt), {"text": prompt})
+
+    assert cache.get(key("Alpha beta!")) is None
+    assert cache.get(key("Epsilon  zeta")) == {"text": "epsilon zeta"}
+    assert cache.stats().evictions == 1
+
+
+def test_semantic_cache_with_custom_embedder():
+    class LengthEmbedder(BaseEmbedder):
+        def embed(self, texts):
+            return [[1.0, float(len(text))] for text in texts]
+
+    cache = SemanticCache(threshold=0.999, embedder=LengthEmbedder())
+    cache.set(key("abc"), {"text": "short"})
+
+    assert cache.get(key("xyz")) == {"text": "short"}
+
+
+def test_generate_text_with_semantic_cache(ollama):
+    cache = SemanticCache()
+
+    sm.generate_text("Hello there", llm_provider="ollama", llm_model="stub", cache=cache)
+    sm.generate_text("hello, there!", llm_provider="ollama", llm_model="stub", cache=cache)
+
+    assert len(ollama.requests) == 1
+    assert cache.stats().semantic_hits == 1
+
+
+def test_conversations_are_never_answered_by_similar_ones(ollama):
+    cache = sm.enable_cache(SemanticCache())
+    system = "You are a geography tutor who answers in one sentence. " * 20
+
+    def ask(*prompts):
+        conversation = sm.create_conversation(llm_provider="ollama", llm_model="stub")
+        conversation.add_message("system", system)
+        for prompt in prompts:
+            conversation.add_message("user", prompt)
+            conversation.send()
+
+    ask("What is the capital of France?", "And of Spain?")
+    ask("What is the capital of Italy?")
+
+    assert len(ollama.requests) == 3
+    assert cache.stats().semantic_hits == 0
+
+
+def test_keys_with_tools_are_exact():
+    provider = sm.find_provider("ollama")
+
+    assert not sm.make_key("text", provider, None, "Hi", {}).exact
+    assert sm.make_key("text", provider, None, "Hi", {"tools": []}).exact
+    assert sm.make_key("conversation", provider, None, "[]", {}).exact
+
+
+def test_keys_separate_hosts_and_credentials():
+    from simplemind.providers.ollama import Ollama
+    from simplemind.providers.openai import OpenAI
+
+    def digest(provider):
+        return sm.make_key("text", provider, "m", "Hi", {}).digest
+
+    assert digest(Ollama("http://a:11434")) == digest(Ollama("http://a:11434"))
+    assert digest(Ollama("http://a:11434")) != digest(Ollama("http://b:11434"))
+    assert digest(OpenAI(api_key="one")) != digest(OpenAI(api_key="two"))
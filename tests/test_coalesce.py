@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import simplemind as sm
+from simplemind.coalesce import Coalescer
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_threads_share_the_leaders_result():
+    coalescer = Coalescer()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(5) as pool:
+        futures = [pool.submit(coalescer.call, "key", func) for _ in range(5)]
+        wait_for(lambda: coalescer.stats().calls == 5)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+    stats = coalescer.stats()
+    assert (stats.leaders, stats.coalesced, stats.in_flight) == (1, 4, 0)
+
+    # Once done, the next call runs again.
+    coalescer.call("key", func)
+    assert len(calls) == 2
+
+
+def test_threads_share_the_leaders_exception():
+    coalescer = Coalescer()
+    release = threading.Event()
+
+    def func():
+        release.wait()
+        raise RuntimeError("rate limited")
+
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(coalescer.call, "key", func) for _ in range(3)]
+        wait_for(lambda: coalescer.stats().calls == 3)
+        release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError, match="rate limited"):
+                future.result()
+
+
+def test_different_keys_are_not_coalesced():
+    coalescer = Coalescer()
+
+    assert coalescer.call("a", lambda: 1) == 1
+    assert coalescer.call("b", lambda: 2) == 2
+    assert coalescer.stats().coalesced == 0
+
+
+def test_asyncio_tasks_share_one_call():
+    coalescer = Coalescer()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        waiter = asyncio.ensure_future(coalescer.acall("key", func))
+        await asyncio.sleep(0)
+        results = await asyncio.gather(*(coalescer.acall("key", func) for _ in range(4)))
+        # Cancelling one caller does not cancel the shared call.
+        waiter.cancel()
+        return results
+
+    assert asyncio.run(main()) == ["result"] * 4
+    assert len(calls) == 1
+    stats = coalescer.stats()
+    assert (stats.leaders, stats.coalesced, stats.in_flight) == (1, 4, 0)
+
+
+def test_generate_text_coalesces_concurrent_calls(stub_server, monkeypatch):
+    stub_server.latency = 0.2
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    coalescer = Coalescer()
+
+    def generate(prompt):
+        return sm.generate_text(
+            prompt, llm_provider="ollama", llm_model="stub", coalesce=coalescer
+        )
+
+    with ThreadPoolExecutor(6) as pool:
+        results = list(pool.map(generate, ["Hi"] * 5 + ["Bye"]))
+    sm.close_providers()
+
+    assert results == ["Hello from the stub!"] * 6
+    assert len(stub_server.requests) == 2
+    assert coalescer.stats().coalesced == 4
+
+
+def test_agenerate_text_coalesces_with_the_default_coalescer(stub_server, monkeypatch):
+    stub_server.latency = 0.2
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    coalescer = sm.enable_coalescing()
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                sm.agenerate_text("Hi", llm_provider="ollama", llm_model="stub")
+                for _ in range(5)
+            ),
+            sm.agenerate_text(
+                "Hi", llm_provider="ollama", llm_model="stub", coalesce=False
+            ),
+        )
+
+    try:
+        results = asyncio.run(main())
+    finally:
+        sm.disable_coalescing()
+        sm.close_providers()
+
+    assert results == ["Hello from the stub!"] * 6
+    assert len(stub_server.requests) == 2
+    assert coalescer.stats().coalesced == 4
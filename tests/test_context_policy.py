@@ -0,0 +1,114 @@
+import pytest
+
+import simplemind as sm
+from simplemind.providers.anthropic import Anthropic
+
+
+@pytest.fixture
+def ollama_stub(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    yield stub_server
+    sm.close_providers()
+
+
+def make_conversation(policy, turns=3, provider="ollama"):
+    conversation = sm.create_conversation(
+        llm_model="stub", llm_provider=provider, context_policy=policy
+    )
+    conversation.add_message("system", "Be brief.")
+    for i in range(turns):
+        conversation.add_message("user", f"Question {i} " + "x" * 40)
+        conversation.add_message("assistant", f"Answer {i} " + "x" * 40)
+    conversation.add_message("user", "Last question")
+    return conversation
+
+
+def sent(stub):
+    return [m["content"] for m in stub.requests[-1]["body"]["messages"]]
+
+
+def test_oldest_messages_are_dropped_to_fit_the_budget(ollama_stub):
+    conversation = make_conversation(sm.ContextPolicy(max_input_tokens=40))
+    history = list(conversation.messages)
+
+    conversation.send(cache=False)
+
+    assert sent(ollama_stub)[0] == "Be brief."
+    assert sent(ollama_stub)[1].startswith("Question 2")
+    assert sent(ollama_stub)[-1] == "Last question"
+    # The stored history is untouched.
+    assert conversation.messages[:-1] == history
+
+    report = conversation.context_reports[-1]
+    assert report.messages_sent == 4
+    assert report.messages_dropped == 4
+    assert report.tokens_sent <= 40 < report.tokens_sent + report.tokens_dropped
+    assert not report.over_budget
+
+
+def test_pinned_messages_and_context_are_kept(ollama_stub):
+    conversation = make_conversation(sm.ContextPolicy(max_input_tokens=40))
+    conversation.messages[1].meta["pinned"] = True
+    conversation.add_context("Context")
+
+    conversation.send(cache=False)
+
+    assert sent(ollama_stub)[1].startswith("Question 0")
+    assert sent(ollama_stub)[-1] == "Context"
+    assert "Question 1" not in str(sent(ollama_stub))
+
+
+def test_keep_last_window(ollama_stub):
+    conversation = make_conversation(sm.ContextPolicy(keep_last=3))
+
+    conversation.send(cache=False)
+
+    # The window starts with an assistant message, which is left out too.
+    assert sent(ollama_stub)[0] == "Be brief."
+    assert sent(ollama_stub)[1].startswith("Question 2")
+    assert len(sent(ollama_stub)) == 4
+
+
+def test_over_budget_still_sends_what_must_be_kept(ollama_stub):
+    conversation = make_conversation(sm.ContextPolicy(max_input_tokens=1), turns=1)
+
+    conversation.send(cache=False)
+
+    assert sent(ollama_stub) == ["Be brief.", "Last question"]
+    assert conversation.context_reports[-1].over_budget
+
+
+def test_reports_every_turn_and_keeps_history(ollama_stub):
+    conversation = make_conversation(sm.ContextPolicy(max_input_tokens=10_000))
+    conversation.send(cache=False)
+    conversation.add_message("user", "Another")
+    conversation.send(cache=False)
+
+    assert [r.messages_dropped for r in conversation.context_reports] == [0, 0]
+    assert len(sent(ollama_stub)) == len(conversation.messages) - 1
+    assert conversation.request_messages() == conversation.messages
+
+
+def test_anthropic_system_can_be_dropped(stub_server, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    policy = sm.ContextPolicy(max_input_tokens=5, keep_system=False)
+    conversation = make_conversation(policy, provider=Anthropic(api_key="test"))
+
+    conversation.send(cache=False)
+
+    body = stub_server.requests[-1]["body"]
+    assert "system" not in body
+    assert len(body["messages"]) == 1
+
+
+def test_custom_token_counter():
+    policy = sm.ContextPolicy(max_input_tokens=2, token_counter=lambda text: 1)
+    conversation = make_conversation(policy, turns=1)
+
+    messages = [*conversation.system_messages, *conversation.messages]
+    tokens = [policy.count_tokens(m) for m in messages]
+    selection, report = policy.select(messages, tokens)
+
+    assert selection == [0, 3]
+    assert report.tokens_sent == 2
+    assert report.tokens_dropped == 2
@@ -0,0 +1,113 @@
+from simplemind.models import Conversation, Message
+from simplemind.providers._base import format_chat_message
+
+formatted = []
+
+
+def counting_formatter(message):
+    formatted.append(message.text)
+    return format_chat_message(message)
+
+
+def make_conversation(n=3):
+    conversation = Conversation()
+    for i in range(n):
+        conversation.add_message("user", f"Message {i}")
+    formatted.clear()
+    return conversation
+
+
+def texts(payloads):
+    return [p["content"] for p in payloads]
+
+
+def test_only_new_messages_are_formatted():
+    conversation = make_conversation()
+
+    first = conversation.format_messages(counting_formatter)
+    conversation.add_message("assistant", "Reply")
+    second = conversation.format_messages(counting_formatter)
+
+    assert formatted == ["Message 0", "Message 1", "Message 2", "Reply"]
+    assert texts(second) == texts(first) + ["Reply"]
+    assert second[0] is first[0]
+
+
+def test_returned_lists_are_independent():
+    conversation = make_conversation()
+
+    conversation.format_messages(counting_formatter).append({"content": "Tool result"})
+
+    assert texts(conversation.format_messages(counting_formatter))[-1] == "Message 2"
+
+
+def test_context_is_formatted_every_time_and_not_cached():
+    conversation = make_conversation()
+    conversation.add_context("Context")
+
+    assert texts(conversation.format_messages(counting_formatter))[-1] == "Context"
+    assert texts(conversation.format_messages(counting_formatter, context=False)) == [
+        "Message 0",
+        "Message 1",
+        "Message 2",
+    ]
+    assert formatted.count("Context") == 1
+
+
+def test_formatters_can_leave_messages_out():
+    conversation = make_conversation()
+    conversation.add_message("system", "Be brief.")
+
+    def system_only(message):
+        return message.text if message.role == "system" else None
+
+    assert conversation.format_messages(system_only) == ["Be brief."]
+
+
+def test_cache_is_rebuilt_after_changes():
+    conversation = make_conversation()
+    conversation.format_messages(counting_formatter)
+
+    conversation.prepend_system_message("Prepended")
+    assert texts(conversation.format_messages(counting_formatter))[0] == "Prepended"
+
+    conversation.messages[1].text = "Edited"
+    assert texts(conversation.format_messages(counting_formatter))[2] == "Edited"
+
+    conversation.messages.pop()
+    conversation.add_message("user", "Replacement")
+    assert texts(conversation.format_messages(counting_formatter))[-1] == "Replacement"
+
+    conversation.messages = conversation.messages[:1]
+    assert texts(conversation.format_messages(counting_formatter)) == [
+        "Prepended",
+        "Message 0",
+    ]
+
+
+def test_replaced_messages_are_formatted_again():
+    conversation = make_conversation()
+    conversation.format_messages(counting_formatter)
+    formatted.clear()
+
+    conversation.messages[1] = Message(role="user", text="Replaced")
+
+    assert texts(conversation.format_messages(counting_formatter)) == [
+        "Message 0",
+        "Replaced",
+        "Message 2",
+    ]
+    assert formatted == ["Replaced", "Message 2"]
+
+
+def test_edits_elsewhere_keep_the_cache():
+    conversation = make_conversation()
+    other = make_conversation()
+    conversation.format_messages(counting_formatter)
+    formatted.clear()
+
+    other.messages[0].text = "Edited"
+    conversation.add_message("user", "New")
+    conversation.format_messages(counting_formatter)
+
+    assert formatted == ["New"]
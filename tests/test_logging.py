@@ -0,0 +1,81 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+import simplemind as sm
+from simplemind.logging import get_backend, logger, set_backend
+
+
+class RecordingBackend(sm.LoggingBackend):
+    def __init__(self):
+        self.records = []
+
+    def info(self, message):
+        self.records.append(("info", message))
+
+    def error(self, message):
+        self.records.append(("error", message))
+
+
+@pytest.fixture
+def backend():
+    previous = get_backend()
+    backend = RecordingBackend()
+    sm.enable_logging(backend)
+
+    yield backend
+
+    sm.settings.logging.disable_logfire()
+    set_backend(previous)
+
+
+def test_import_does_not_load_logfire():
+    # When installed, logfire also registers a pydantic plugin, which pydantic
+    # itself imports; that is outside simplemind's control.
+    code = "import sys, simplemind; print('logfire' in sys.modules)"
+    env = {**os.environ, "PYDANTIC_DISABLE_PLUGINS": "logfire-plugin"}
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_logger_uses_backend(backend):
+    @logger
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert [level for level, _ in backend.records] == ["info", "info"]
+    assert "add returned: 3" in backend.records[1][1]
+
+
+def test_logger_reports_errors(backend):
+    @logger
+    async def fail():
+        raise KeyError("nope")
+
+    with pytest.raises(KeyError):
+        asyncio.run(fail())
+
+    assert backend.records[-1][0] == "error"
+
+
+def test_logger_is_silent_when_disabled():
+    backend = RecordingBackend()
+    previous = get_backend()
+    set_backend(backend)
+
+    @logger
+    def echo(value):
+        return value
+
+    try:
+        assert echo("hi") == "hi"
+        assert backend.records == []
+    finally:
+        set_backend(previous)
@@ -0,0 +1,81 @@
+import pydantic
+import pytest
+
+import simplemind as sm
+from simplemind.models import Conversation, Message, Usage
+
+
+def test_build_matches_validated_message():
+    usage = Usage(input_tokens=3)
+    built = Message.build("assistant", "Hi", meta={"a": 1}, llm_model="m", usage=usage)
+    validated = Message(
+        role="assistant",
+        text="Hi",
+        meta={"a": 1},
+        llm_model="m",
+        usage=usage,
+        date_created=built.date_created,
+    )
+
+    assert built == validated
+    assert built.model_dump() == validated.model_dump()
+    assert Message.model_validate_json(built.model_dump_json()) == built
+
+    built.text = "Changed"
+    assert built.model_copy(update={"role": "user"}).text == "Changed"
+
+
+def test_build_validates_unexpected_values():
+    with pytest.raises(pydantic.ValidationError):
+        Message.build("narrator", "Hi")
+
+    # Values pydantic would coerce still are.
+    assert Message.build("user", "Hi", usage={"input_tokens": 1}).usage == Usage(
+        input_tokens=1
+    )
+
+
+def test_add_message_shares_one_message_with_hooks():
+    seen = []
+
+    class Plugin(sm.BasePlugin):
+        def add_message_hook(self, conversation, message):
+            seen.append(message)
+
+    conversation = Conversation(plugins=[Plugin()])
+    conversation.add_message("user", "Hi")
+
+    assert seen == conversation.messages
+    assert seen[0] is conversation.messages[0]
+
+
+def test_build_copies_meta():
+    meta = {"a": 1}
+    message = Message.build("user", "Hi", meta=meta)
+    meta["a"] = 2
+
+    assert message.meta == {"a": 1}
+
+
+def test_send_keeps_the_response_without_raw(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    cache = sm.MemoryCache()
+
+    conversation = Conversation(llm_model="stub", llm_provider="ollama")
+    conversation.add_message("user", "Hi")
+    response = conversation.send(cache=cache)
+    sm.close_providers()
+
+    kept = conversation.messages[-1]
+    assert response.raw is not None
+    assert kept.raw is None
+    assert (kept.text, kept.llm_provider, kept.usage) == (
+        response.text,
+        "ollama",
+        response.usage,
+    )
+
+    # The cached entry does not share the message's metadata.
+    response.meta["edited"] = True
+    conversation.messages.pop()
+    assert conversation.send(cache=cache).meta == {}
@@ -0,0 +1,203 @@
+import asyncio
+from typing import Annotated
+
+import pytest
+from pydantic import Field
+
+import simplemind as sm
+from simplemind.providers._base_tools import convert_tool
+from simplemind.providers.anthropic import Anthropic, AnthropicTool
+from simplemind.providers.deepseek import Deepseek
+from simplemind.providers.openai import OpenAI
+
+SYSTEM_PROMPT = "You are a meticulous assistant. " * 200
+
+EPHEMERAL = {"type": "ephemeral"}
+
+
+@pytest.fixture
+def anthropic_stub(stub_server, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    return stub_server
+
+
+def make_conversation(provider):
+    conversation = sm.create_conversation(llm_model="stub", llm_provider=provider)
+    conversation.add_message("system", SYSTEM_PROMPT)
+    return conversation
+
+
+def test_breakpoints_on_system_prompt_and_last_user_turns(anthropic_stub):
+    conversation = make_conversation(Anthropic(api_key="test"))
+    for prompt in ("One", "Two", "Three"):
+        conversation.add_message("user", prompt)
+        conversation.send(cache=False)
+
+    body = anthropic_stub.requests[-1]["body"]
+    assert body["system"] == [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": EPHEMERAL}
+    ]
+    assert all(m["role"] != "system" for m in body["messages"])
+
+    marked = [m for m in body["messages"] if isinstance(m["content"], list)]
+    assert [m["content"][0]["text"] for m in marked] == ["Two", "Three"]
+    assert all(m["content"][0]["cache_control"] == EPHEMERAL for m in marked)
+
+
+def test_breakpoint_on_last_tool(anthropic_stub):
+    def get_weather(city: Annotated[str, Field(description="The city")]) -> str:
+        """Get the weather in a city."""
+        return "Sunny"
+
+    def get_time(city: Annotated[str, Field(description="The city")]) -> str:
+        """Get the time in a city."""
+        return "Noon"
+
+    conversation = make_conversation(Anthropic(api_key="test"))
+    conversation.add_message("user", "Hi")
+    conversation.send(tools=[get_weather, get_time])
+
+    tools = anthropic_stub.requests[-1]["body"]["tools"]
+    assert "cache_control" not in tools[0]
+    assert tools[1]["cache_control"] == EPHEMERAL
+
+    # The cached tool schemas are left unmarked.
+    assert "cache_control" not in convert_tool(AnthropicTool, get_time).input_schema()
+
+
+def test_usage_reports_cache_writes_then_reads(anthropic_stub):
+    conversation = make_conversation(Anthropic(api_key="test"))
+
+    conversation.add_message("user", "One")
+    first = conversation.send(cache=False)
+    conversation.add_message("user", "Two")
+    second = conversation.send(cache=False)
+
+    assert first.usage.cache_read_tokens == 0
+    assert first.usage.cache_write_tokens > len(SYSTEM_PROMPT) // 4
+    assert first.usage.output_tokens == 5
+
+    # The second send reads back everything the first one wrote.
+    assert second.usage.cache_read_tokens == first.usage.cache_write_tokens
+    assert second.usage.cache_write_tokens > 0
+    assert second.usage.input_tokens < second.usage.cache_read_tokens
+
+
+def test_usage_async(anthropic_stub):
+    conversation = make_conversation(Anthropic(api_key="test"))
+
+    async def main():
+        conversation.add_message("user", "One")
+        await conversation.asend(cache=False)
+        conversation.add_message("user", "Two")
+        return await conversation.asend(cache=False)
+
+    response = asyncio.run(main())
+
+    assert response.usage.cache_read_tokens > 0
+
+
+def test_prompt_caching_can_be_disabled(anthropic_stub):
+    conversation = make_conversation(Anthropic(api_key="test", prompt_caching=False))
+    conversation.add_message("user", "One")
+    response = conversation.send(cache=False)
+
+    assert "cache_control" not in str(anthropic_stub.requests[-1]["body"])
+    assert response.usage.cache_write_tokens == 0
+    assert response.usage.input_tokens > 0
+
+
+def test_usage_add():
+    total = sm.Usage(input_tokens=1, cache_read_tokens=2) + sm.Usage(
+        input_tokens=3, output_tokens=4, cache_write_tokens=5
+    )
+
+    assert total == sm.Usage(
+        input_tokens=4, output_tokens=4, cache_read_tokens=2, cache_write_tokens=5
+    )
+
+
+def test_openai_compatible_usage():
+    from openai.types import CompletionUsage
+
+    openai_usage = CompletionUsage.model_validate(
+        {
+            "prompt_tokens": 100,
+            "completion_tokens": 5,
+            "total_tokens": 105,
+            "prompt_tokens_details": {"cached_tokens": 60},
+        }
+    )
+    deepseek_usage = CompletionUsage.model_validate(
+        {
+            "prompt_tokens": 100,
+            "completion_tokens": 5,
+            "total_tokens": 105,
+            "prompt_cache_hit_tokens": 60,
+            "prompt_cache_miss_tokens": 40,
+        }
+    )
+    expected = sm.Usage(input_tokens=40, output_tokens=5, cache_read_tokens=60)
+
+    assert OpenAI(api_key="test")._usage(openai_usage) == expected
+    assert Deepseek(api_key="test")._usage(deepseek_usage) == expected
+
+
+class ContextPlugin(sm.BasePlugin):
+    def pre_send_hook(self, conversation):
+        turn = len(conversation.messages)
+        conversation.add_context(f"Context for message {turn}")
+
+
+def test_context_is_sent_last_and_not_kept(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    conversation = sm.create_conversation(llm_model="stub", llm_provider="ollama")
+    conversation.add_plugin(ContextPlugin())
+    conversation.add_message("system", SYSTEM_PROMPT)
+
+    conversation.add_message("user", "One")
+    conversation.send(cache=False)
+    conversation.add_message("user", "Two")
+    conversation.send(cache=False)
+    sm.close_providers()
+
+    first, second = (r["body"]["messages"] for r in stub_server.requests)
+    assert first[-1] == {"role": "user", "content": "Context for message 2"}
+    assert second[-1] == {"role": "user", "content": "Context for message 4"}
+    # The second request starts with the first, minus its context.
+    assert second[: len(first) - 1] == first[:-1]
+
+    assert conversation.context == []
+    assert all(not m.text.startswith("Context") for m in conversation.messages)
+
+
+def test_context_keeps_anthropic_prefix_cached(anthropic_stub):
+    conversation = make_conversation(Anthropic(api_key="test"))
+    conversation.add_plugin(ContextPlugin())
+
+    for prompt in ("One", "Two", "Three"):
+        conversation.add_message("user", prompt)
+        response = conversation.send(cache=False)
+
+    body = anthropic_stub.requests[-1]["body"]
+    assert body["messages"][-1] == {"role": "user", "content": "Context for message 6"}
+    assert "cache_control" in body["messages"][-2]["content"][0]
+
+    assert response.usage.cache_read_tokens > 0
+    assert conversation.usage.cache_read_tokens > response.usage.cache_read_tokens
+    assert 0 < conversation.usage.cache_hit_rate < 1
+
+
+def test_context_is_part_of_the_cache_key(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    cache = sm.MemoryCache()
+
+    for context in ("A", "B", "B"):
+        conversation = sm.create_conversation(llm_model="stub", llm_provider="ollama")
+        conversation.add_message("user", "Hi")
+        conversation.add_context(context)
+        conversation.send(cache=cache)
+    sm.close_providers()
+
+    assert len(stub_server.requests) == 2
+    assert cache.stats().hits == 1
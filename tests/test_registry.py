@@ -0,0 +1,97 @@
+import subprocess
+import sys
+
+import pytest
+
+import simplemind as sm
+from simplemind.providers import Ollama
+from simplemind.utils import find_provider_class
+
+
+def test_find_provider_reuses_instances():
+    sm.close_providers()
+
+    first = sm.find_provider("ollama", host_url="http://127.0.0.1:1")
+    second = sm.find_provider("ollama", host_url="http://127.0.0.1:1")
+    other = sm.find_provider("ollama", host_url="http://127.0.0.1:2")
+
+    assert first is second
+    assert first is not other
+    assert isinstance(first, Ollama)
+
+    sm.close_providers()
+
+
+def test_find_provider_keeps_prompt_caching_apart():
+    sm.close_providers()
+
+    cached = sm.find_provider("anthropic", api_key="test")
+    uncached = sm.find_provider("anthropic", api_key="test", prompt_caching=False)
+
+    assert cached is not uncached
+    assert cached.prompt_caching and not uncached.prompt_caching
+    assert sm.find_provider("anthropic", api_key="test", prompt_caching=False) is uncached
+
+    sm.close_providers()
+
+
+def test_close_providers_resets_registry():
+    first = sm.find_provider("ollama", host_url="http://127.0.0.1:1")
+    client = first.client
+
+    sm.close_providers()
+
+    assert "client" not in first.__dict__
+    assert sm.find_provider("ollama", host_url="http://127.0.0.1:1") is not first
+    assert client is not None
+
+    sm.close_providers()
+
+
+def test_registered_provider_keeps_its_client(stub_server):
+    provider = sm.find_provider("ollama", host_url=stub_server.url)
+
+    assert provider.generate_text("Hi", llm_model="stub") == "Hello from the stub!"
+    client = provider.client
+
+    again = sm.find_provider("ollama", host_url=stub_server.url)
+    assert again.generate_text("Hi", llm_model="stub") == "Hello from the stub!"
+    assert again.client is client
+
+    sm.close_providers()
+
+
+def test_import_does_not_load_providers():
+    code = (
+        "import sys, simplemind; "
+        "print(sorted(m for m in sys.modules "
+        "if m == 'instructor' or m.startswith('simplemind.providers.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == (
+        "['simplemind.providers._base', 'simplemind.providers._base_tools']"
+    )
+
+
+def test_import_does_not_load_optional_modules():
+    code = (
+        "import sys, simplemind; "
+        "print(sorted(m for m in sys.modules if m in ("
+        "'sqlite3', 'numpy', 'simplemind.batch', 'simplemind.bulk', "
+        "'simplemind.coalesce', 'simplemind.cache.disk', 'simplemind.cache.semantic')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_find_provider_class_loads_on_demand():
+    assert find_provider_class("OLLAMA") is Ollama
+
+    with pytest.raises(ValueError, match="Did you mean 'ollama'"):
+        find_provider_class("olama")
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+import simplemind as sm
+
+
+@pytest.fixture
+def anthropic_stub(stub_server, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    return stub_server
+
+
+def test_session_owns_its_provider(stub_server):
+    session = sm.Session(
+        llm_provider="ollama",
+        llm_model="stub",
+        provider_kwargs={"host_url": stub_server.url},
+    )
+
+    assert session.generate_text("Hi") == "Hello from the stub!"
+    client = session.provider.client
+    assert session.generate_text("Hi again") == "Hello from the stub!"
+
+    assert session.provider.client is client
+    assert session.provider is not sm.find_provider("ollama", host_url=stub_server.url)
+
+    session.close()
+    sm.close_providers()
+
+
+def test_session_survives_close_providers(stub_server):
+    session = sm.Session(
+        llm_provider="ollama",
+        llm_model="stub",
+        provider_kwargs={"host_url": stub_server.url},
+    )
+    assert session.generate_text("Hi") == "Hello from the stub!"
+
+    sm.close_providers()
+
+    # The shared pool reopens under the session's existing client.
+    assert session.generate_text("Hi again") == "Hello from the stub!"
+    assert len(stub_server.requests) == 2
+
+    session.close()
+    sm.close_providers()
+
+
+def test_session_context_manager_closes_clients(anthropic_stub):
+    with sm.Session(
+        llm_provider="anthropic",
+        llm_model="stub",
+        provider_kwargs={"api_key": "test"},
+    ) as session:
+        assert session.generate_text("Hi") == "Hello from the stub!"
+        provider = session.provider
+        client = provider.client
+
+    assert client.is_closed()
+    assert "client" not in provider.__dict__
+    assert "provider" not in session.__dict__
+
+
+def test_session_async_context_manager_closes_clients(anthropic_stub):
+    async def main():
+        async with sm.Session(
+            llm_provider="anthropic",
+            llm_model="stub",
+            provider_kwargs={"api_key": "test"},
+        ) as session:
+            assert await session.agenerate_text("Hi") == "Hello from the stub!"
+            return session.provider.async_client
+
+    client = asyncio.run(main())
+
+    assert client.is_closed()
+
+
+def test_session_conversations_use_its_provider(stub_server):
+    with sm.Session(
+        llm_provider="ollama",
+        llm_model="stub",
+        provider_kwargs={"host_url": stub_server.url},
+    ) as session:
+        conversation = session.create_conversation()
+        conversation.add_message("user", "Hi")
+
+        assert conversation.provider is session.provider
+        assert conversation.send().text == "Hello from the stub!"
+        assert "provider" not in conversation.model_dump()
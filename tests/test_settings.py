@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+from simplemind.settings import LazySettings
+
+
+def test_import_does_not_resolve_settings():
+    code = "import simplemind; print(simplemind.settings.is_loaded)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "False"
+
+
+def test_settings_resolve_once(monkeypatch):
+    monkeypatch.setenv("DEFAULT_LLM_PROVIDER", "ollama")
+    settings = LazySettings()
+
+    assert not settings.is_loaded
+    assert settings.DEFAULT_LLM_PROVIDER == "ollama"
+    assert settings.is_loaded
+
+    monkeypatch.setenv("DEFAULT_LLM_PROVIDER", "groq")
+    assert settings.DEFAULT_LLM_PROVIDER == "ollama"
+
+
+def test_reload_rotates_keys(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "old-key")
+    settings = LazySettings()
+    settings.logging.is_enabled = True
+
+    assert settings.get_api_key("openai") == "old-key"
+
+    monkeypatch.setenv("OPENAI_API_KEY", "new-key")
+    settings.reload()
+
+    assert settings.get_api_key("openai") == "new-key"
+    assert settings.logging.is_enabled
+
+
+def test_assignment_is_forwarded():
+    settings = LazySettings()
+    settings.OLLAMA_HOST_URL = "http://127.0.0.1:1"
+
+    assert settings.OLLAMA_HOST_URL == "http://127.0.0.1:1"
+    assert settings.reload().OLLAMA_HOST_URL != "http://127.0.0.1:1"
@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import pytest
+
+import simplemind as sm
+from simplemind.cache import StreamReplay, arecord_stream, record_stream
+from simplemind.providers import XAI
+
+TEXT = "Hello from the stub!"
+
+
+@pytest.fixture
+def ollama_stub(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    yield stub_server
+    sm.close_providers()
+
+
+def stream(cache, llm_provider="ollama", **kwargs):
+    chunks = sm.generate_text(
+        "Hi",
+        llm_provider=llm_provider,
+        llm_model="stub",
+        stream=True,
+        cache=cache,
+        **kwargs,
+    )
+    return list(chunks)
+
+
+def test_streamed_calls_are_recorded_and_replayed(ollama_stub):
+    cache = sm.MemoryCache()
+
+    first = stream(cache)
+    second = stream(cache)
+
+    assert len(ollama_stub.requests) == 1
+    assert "".join(first) == TEXT
+    assert second == first
+
+    # Non-streamed calls share the entry.
+    text = sm.generate_text("Hi", llm_provider="ollama", llm_model="stub", cache=cache)
+    assert text == TEXT
+    assert len(ollama_stub.requests) == 1
+
+
+def test_non_streamed_entries_replay_in_chunks(ollama_stub):
+    cache = sm.MemoryCache()
+    sm.generate_text("Hi", llm_provider="ollama", llm_model="stub", cache=cache)
+
+    assert stream(cache) == [TEXT]
+    assert stream(cache, replay=StreamReplay(chunk_size=8)) == [
+        "Hello fr",
+        "om the s",
+        "tub!",
+    ]
+    assert len(ollama_stub.requests) == 1
+
+
+def test_partially_consumed_streams_are_not_cached(ollama_stub):
+    cache = sm.MemoryCache()
+
+    chunks = sm.generate_text(
+        "Hi", llm_provider="ollama", llm_model="stub", stream=True, cache=cache
+    )
+    next(chunks)
+    chunks.close()
+
+    assert cache.stats().size == 0
+
+
+def test_async_streams_are_recorded_and_replayed(ollama_stub):
+    cache = sm.MemoryCache()
+
+    async def main():
+        results = []
+        for _ in range(2):
+            chunks = await sm.agenerate_text(
+                "Hi", llm_provider="ollama", llm_model="stub", stream=True, cache=cache
+            )
+            results.append([chunk async for chunk in chunks])
+        return results
+
+    first, second = asyncio.run(main())
+
+    assert "".join(first) == TEXT
+    assert second == first
+    assert len(ollama_stub.requests) == 1
+
+
+def test_plan_reproduces_recorded_timing():
+    entry = {"text": "abcdef", "chunks": ["ab", "cd", "ef"], "offsets": [0.5, 0.6, 1.0]}
+
+    assert StreamReplay().plan(entry) == [(0.0, "ab"), (0.0, "cd"), (0.0, "ef")]
+
+    plan = StreamReplay(timing=True).plan(entry)
+    assert [chunk for _, chunk in plan] == ["ab", "cd", "ef"]
+    assert [round(delay, 3) for delay, _ in plan] == [0.5, 0.1, 0.4]
+
+    # Re-split chunks are due when their last character was recorded.
+    plan = StreamReplay(chunk_size=3, timing=True).plan(entry)
+    assert [chunk for _, chunk in plan] == ["abc", "def"]
+    assert [round(delay, 3) for delay, _ in plan] == [0.6, 0.4]
+
+
+def test_replay_sleeps_with_timing():
+    entry = {"text": "ab", "chunks": ["a", "b"], "offsets": [0.05, 0.1]}
+
+    t1 = time.perf_counter()
+    assert list(StreamReplay(timing=True).replay(entry)) == ["a", "b"]
+    assert time.perf_counter() - t1 >= 0.1
+
+
+def test_record_stream():
+    stored = []
+
+    assert list(record_stream(iter(["a", "b"]), stored.append)) == ["a", "b"]
+
+    (entry,) = stored
+    assert entry["text"] == "ab"
+    assert entry["chunks"] == ["a", "b"]
+    assert len(entry["offsets"]) == 2
+
+
+def test_empty_chunks_are_not_recorded():
+    stored = []
+
+    async def achunks():
+        for chunk in ["a", "b", None]:
+            yield chunk
+
+    async def main():
+        return [chunk async for chunk in arecord_stream(achunks(), stored.append)]
+
+    assert list(record_stream(iter(["a", "", "b", None]), stored.append))[-1] is None
+    assert asyncio.run(main()) == ["a", "b", None]
+
+    for entry in stored:
+        assert entry["text"] == "ab"
+        assert entry["chunks"] == ["a", "b"]
+        assert len(entry["offsets"]) == 2
+
+
+def test_xai_streams_are_recorded(stub_server, monkeypatch):
+    monkeypatch.setattr(XAI, "BASE_URL", stub_server.url + "/v1")
+    provider = XAI(api_key="test")
+    cache = sm.MemoryCache()
+
+    async def astream():
+        chunks = await sm.agenerate_text(
+            "Hi", llm_provider=provider, llm_model="stub", stream=True, cache=cache
+        )
+        return [chunk async for chunk in chunks]
+
+    try:
+        first = stream(cache, llm_provider=provider)
+        assert "".join(first) == TEXT
+        assert asyncio.run(astream()) == first
+        assert len(stub_server.requests) == 1
+
+        cache.clear()
+        assert "".join(asyncio.run(astream())) == TEXT
+        assert stream(cache, llm_provider=provider) == first
+        assert len(stub_server.requests) == 2
+    finally:
+        provider.close()
@@ -0,0 +1,87 @@
+from typing import List
+
+import instructor
+import pytest
+from pydantic import BaseModel
+
+import simplemind as sm
+from simplemind.providers._base import clear_structured_model_cache, structured_model
+
+
+class Item(BaseModel):
+    name: str
+    quantity: int
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_structured_model_cache()
+    yield
+    clear_structured_model_cache()
+
+
+def test_structured_model_is_built_once_per_class():
+    wrapped = structured_model(Item)
+
+    assert structured_model(Item) is wrapped
+    assert issubclass(wrapped, Item)
+    assert issubclass(wrapped, instructor.OpenAISchema)
+
+
+def test_structured_model_passes_other_types_through():
+    assert structured_model(List[Item]) == List[Item]
+    assert structured_model(int) is int
+
+
+def test_structured_model_caches_its_json_schema():
+    wrapped = structured_model(Item)
+    schema = wrapped.model_json_schema()
+    schema["properties"].clear()
+
+    assert wrapped.model_json_schema() == Item.model_json_schema()
+    assert wrapped.model_json_schema(mode="serialization") == Item.model_json_schema(
+        mode="serialization"
+    )
+
+
+def test_generate_data_wraps_the_model_once(stub_server, monkeypatch):
+    stub_server.reply = '{"name": "tea", "quantity": 2}'
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+
+    # What Instructor does with the response model on each call: it prepares
+    # (wraps) models that are not already prepared.
+    patch = pytest.importorskip("instructor.v2.core.patch")
+    function_calls = pytest.importorskip("instructor.v2.core.function_calls")
+    wrapped, prepared = [], []
+    response_schema = function_calls.response_schema
+    prepare_response_model = patch.prepare_response_model
+
+    def spy_response_schema(model):
+        wrapped.append(model)
+        return response_schema(model)
+
+    def spy_prepare_response_model(model):
+        prepared.append((model, prepare_response_model(model)))
+        return prepared[-1][1]
+
+    # `instructor.openai_schema` (used by simplemind) is the same function.
+    monkeypatch.setattr(instructor, "openai_schema", spy_response_schema)
+    monkeypatch.setattr(function_calls, "response_schema", spy_response_schema)
+    monkeypatch.setattr(patch, "prepare_response_model", spy_prepare_response_model)
+
+    clients = set()
+    for _ in range(3):
+        item = sm.generate_data(
+            "Tea", llm_provider="ollama", llm_model="stub", response_model=Item
+        )
+        assert (item.name, item.quantity) == ("tea", 2)
+        clients.add(id(sm.find_provider("ollama").__dict__["structured_client"]))
+
+    # Only simplemind wraps the model, once; Instructor gets the same
+    # prepared class every call and uses it as is.
+    assert wrapped == [Item]
+    assert len(prepared) == 3
+    assert all(given is result is structured_model(Item) for given, result in prepared)
+    # The Instructor client is built once per provider instance too.
+    assert len(clients) == 1
+    sm.close_providers()
@@ -0,0 +1,86 @@
+import simplemind as sm
+from simplemind.models import Conversation
+
+
+def make_conversation():
+    conversation = Conversation(llm_model="stub", llm_provider="ollama")
+    conversation.add_message("system", "Be brief.")
+    conversation.add_message("user", "Hi")
+    conversation.prepend_system_message("First prepended")
+    conversation.prepend_system_message("Second prepended")
+    return conversation
+
+
+def test_prepend_does_not_copy_messages():
+    conversation = Conversation()
+    conversation.add_message("user", "Hi")
+    messages = conversation.messages
+
+    for i in range(1_000):
+        conversation.prepend_system_message(f"Memory {i}")
+
+    assert conversation.messages is messages
+    assert len(conversation.messages) == 1
+    assert len(conversation.system_messages) == 1_000
+
+
+def test_request_order():
+    conversation = make_conversation()
+
+    assert [m.text for m in conversation.request_messages()] == [
+        "Second prepended",
+        "First prepended",
+        "Be brief.",
+        "Hi",
+    ]
+
+
+def test_get_last_message_includes_prepended_system_messages():
+    conversation = Conversation()
+    conversation.add_message("user", "Hi")
+    conversation.prepend_system_message("Prepended")
+
+    assert conversation.get_last_message("system").text == "Prepended"
+
+    conversation.add_message("system", "Added")
+    assert conversation.get_last_message("system").text == "Added"
+
+
+def test_save_and_load_keep_system_messages(tmp_path):
+    conversation = make_conversation()
+    conversation.save(tmp_path / "conversation.json")
+
+    loaded = Conversation.load(tmp_path / "conversation.json")
+
+    assert [m.text for m in loaded.request_messages()] == [
+        m.text for m in conversation.request_messages()
+    ]
+
+
+def test_providers_receive_prepended_messages_first(stub_server, monkeypatch):
+    monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub_server.url)
+    conversation = make_conversation()
+    conversation.send(cache=False)
+    sm.close_providers()
+
+    assert [m["content"] for m in stub_server.requests[-1]["body"]["messages"]] == [
+        "Second prepended",
+        "First prepended",
+        "Be brief.",
+        "Hi",
+    ]
+
+
+def test_anthropic_sends_system_messages_in_order(stub_server, monkeypatch):
+    from simplemind.providers.anthropic import Anthropic
+
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    conversation = make_conversation()
+    conversation.send(llm_provider=Anthropic(api_key="test"), cache=False)
+
+    body = stub_server.requests[-1]["body"]
+    assert [block["text"] for block in body["system"]] == [
+        "Second prepended",
+        "First prepended",
+        "Be brief.",
+    ]
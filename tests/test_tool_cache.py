@@ -0,0 +1,83 @@
+import gc
+from typing import Annotated, ClassVar
+
+from pydantic import Field
+
+from simplemind.providers._base_tools import _tool_cache, clear_tool_cache, convert_tool
+from simplemind.providers.openai import OpenAITool
+
+
+class CountingTool(OpenAITool):
+    conversions: ClassVar[int] = 0
+    schemas: ClassVar[int] = 0
+
+    @classmethod
+    def from_function(cls, func):
+        CountingTool.conversions += 1
+        return super().from_function(func)
+
+    def get_input_schema(self):
+        CountingTool.schemas += 1
+        return super().get_input_schema()
+
+
+def get_weather(
+    location: Annotated[str, Field(description="The city, e.g. Paris")],
+):
+    """Get the current weather in a given location"""
+    return "sunny"
+
+
+def setup_function():
+    clear_tool_cache()
+    CountingTool.conversions = CountingTool.schemas = 0
+
+
+def test_tools_are_converted_once():
+    first = convert_tool(CountingTool, get_weather)
+    second = convert_tool(CountingTool, get_weather)
+
+    assert first is not second
+    assert first.input_schema() is second.input_schema()
+    assert first.input_schema()["function"]["name"] == "get_weather"
+    assert (CountingTool.conversions, CountingTool.schemas) == (1, 1)
+
+
+def test_converted_tools_do_not_share_state():
+    first = convert_tool(CountingTool, get_weather)
+    first.tool_id = "call_1"
+    first.function_result = "sunny"
+
+    second = convert_tool(CountingTool, get_weather)
+
+    assert second.tool_id is None and not second.is_executed()
+
+
+def test_changed_functions_are_reconverted():
+    def tool(city: Annotated[str, Field(description="A city")]):
+        """Old description"""
+
+    assert convert_tool(CountingTool, tool).description == "Old description"
+
+    tool.__doc__ = "New description"
+    assert convert_tool(CountingTool, tool).description == "New description"
+    assert CountingTool.conversions == 2
+
+
+def test_cache_entries_follow_their_function():
+    def tool(city: Annotated[str, Field(description="A city")]):
+        """A temporary tool"""
+
+    convert_tool(CountingTool, tool)
+    assert tool in _tool_cache
+
+    del tool
+    gc.collect()
+
+    assert len(_tool_cache) == 0
+
+
+def test_tool_instances_are_passed_through():
+    tool = OpenAITool.from_function(get_weather)
+
+    assert convert_tool(CountingTool, tool) is tool
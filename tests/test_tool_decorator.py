@@ -0,0 +1,127 @@
+import json
+import socket
+from typing import Literal
+
+import pytest
+from pydantic import SecretStr
+
+import simplemind as sm
+from simplemind.cache import MemoryCache, disk, get_enrich_cache
+from simplemind.providers.anthropic import AnthropicTool
+from simplemind.providers.openai import OpenAITool
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    return 0.0
+
+
+def forecast(city: str, unit: Literal["celsius", "fahrenheit"] = "celsius", days=1):
+    """Get the weather forecast.
+
+    Args:
+        city: The city, e.g. Paris.
+        unit: The temperature unit.
+    """
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise AssertionError("tool() must not touch the network")
+
+    monkeypatch.setattr(socket, "create_connection", refuse)
+
+
+def test_tool_schema_is_derived_locally(no_network):
+    tool = sm.tool(llm_provider="openai")(haversine)
+
+    assert isinstance(tool, OpenAITool)
+    assert tool.required == ["lat1", "lon1", "lat2", "lon2"]
+    assert {prop.type for prop in tool.properties.values()} == {"number"}
+    assert tool(1, 2, 3, 4) == 0.0
+
+
+def test_tool_schema_uses_docstring(no_network):
+    tool = sm.tool(llm_provider="anthropic")(forecast)
+    schema = tool.get_input_schema()
+
+    assert tool.description == "Get the weather forecast."
+    assert schema["input_schema"]["required"] == ["city"]
+    properties = schema["input_schema"]["properties"]
+    assert properties["city"] == {"type": "string", "description": "The city, e.g. Paris."}
+    assert properties["unit"]["enum"] == ["celsius", "fahrenheit"]
+    assert properties["days"]["description"] == "days"
+
+
+def test_docstring_lines_ending_in_a_colon_stay_in_the_description():
+    def convert(amount: float, unit: str) -> float:
+        """Convert an amount between units.
+
+        Supported units:
+            meters, feet
+
+        Args:
+            amount: The amount to convert.
+            unit: The target unit.
+
+        Returns:
+            The converted amount.
+        """
+        return amount
+
+    tool = sm.tool(llm_provider="anthropic")(convert)
+    properties = tool.get_input_schema()["input_schema"]["properties"]
+
+    assert tool.description.endswith("Supported units:\n    meters, feet")
+    assert properties["unit"]["description"] == "The target unit."
+
+
+def test_strict_from_function_still_requires_fields():
+    with pytest.raises(ValueError, match="Field annotation"):
+        OpenAITool.from_function(haversine)
+
+
+def test_tool_enrichment_is_cached(stub_server, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_server.url)
+    monkeypatch.setattr(sm.settings, "ANTHROPIC_API_KEY", SecretStr("test"))
+    stub_server.reply = json.dumps(
+        {
+            "name": "haversine",
+            "description": "Great-circle distance between two points",
+            "properties": {
+                name: {"type": "number", "description": f"The {name} coordinate"}
+                for name in ("lat1", "lon1", "lat2", "lon2")
+            },
+            "required": [],
+        }
+    )
+    cache = MemoryCache()
+
+    for _ in range(2):
+        tool = sm.tool(llm_provider="anthropic", enrich=True, cache=cache)(haversine)
+
+    assert isinstance(tool, AnthropicTool)
+    assert len(stub_server.requests) == 1
+    assert tool.description == "Great-circle distance between two points"
+    assert tool.properties["lat1"].description == "The lat1 coordinate"
+    # The structure is still derived locally.
+    assert tool.required == ["lat1", "lon1", "lat2", "lon2"]
+
+    sm.close_providers()
+
+
+def test_default_enrichment_cache_is_shared(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk, "TOOL_CACHE_PATH", str(tmp_path / "tools.db"))
+    sm.close_providers()
+
+    cache = get_enrich_cache()
+    assert isinstance(cache, disk.DiskCache)
+    assert get_enrich_cache() is cache
+    assert cache.path == str(tmp_path / "tools.db")
+
+    sm.close_providers()
+
+    assert cache._local.db is None
+    assert get_enrich_cache() is not cache
+
+    sm.close_providers()
@@ -0,0 +1,65 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import simplemind as sm
+from simplemind import transport
+from simplemind.providers import Ollama, XAI
+
+
+def test_openai_compatible_providers_share_the_pool():
+    sm.close_providers()
+
+    ollama = Ollama(host_url="http://127.0.0.1:1")
+    xai = XAI(api_key="test")
+
+    assert ollama.client._client is transport.get_http_client()
+    assert xai.client._client is transport.get_http_client()
+
+    # Closing a provider must leave the shared pool usable.
+    ollama.close()
+    assert not transport.get_http_client().is_closed
+
+    sm.close_providers()
+
+
+def test_pool_stats_report_saturation(stub_server, monkeypatch):
+    sm.close_providers()
+    monkeypatch.setattr(sm.settings.http, "max_connections", 2)
+    stub_server.latency = 0.05
+
+    provider = Ollama(host_url=stub_server.url)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(lambda _: provider.generate_text("Hi", llm_model="stub"), range(6)))
+
+    stats = transport.pool_stats()
+    assert stats.max_connections == 2
+    assert stats.requests == 6
+    assert stats.peak_in_use == 2
+    assert stats.in_use == 0
+    assert stats.waited > 0
+    assert stats.mean_wait_time > 0
+
+    sm.close_providers()
+
+
+def test_cancelled_waits_are_not_counted_as_waiting():
+    meter = transport._PoolMeter(max_connections=1, pool_timeout=5)
+
+    async def main():
+        slots = asyncio.Semaphore(1)
+        await meter.acquire_async(slots)
+        waiter = asyncio.create_task(meter.acquire_async(slots))
+        await asyncio.sleep(0.01)
+        assert meter.stats().waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        meter.release_async(slots)
+
+    asyncio.run(main())
+
+    stats = meter.stats()
+    assert (stats.waiting, stats.in_use, stats.requests) == (0, 0, 1)
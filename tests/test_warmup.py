@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+import simplemind as sm
+from benchmarks._stub import StubServer
+from simplemind.providers import Anthropic, BaseProvider
+
+
+@pytest.fixture
+def slow_stub(monkeypatch):
+    # Slow enough that concurrent pings cannot share a connection.
+    with StubServer(latency=0.2) as stub:
+        monkeypatch.setattr(sm.settings, "OLLAMA_HOST_URL", stub.url)
+        yield stub
+
+    sm.close_providers()
+
+
+def test_warmup_opens_connections(slow_stub):
+    session = sm.Session(llm_provider="ollama", llm_model="stub")
+    session.warmup(connections=3)
+
+    warm_ports = {request["client_port"] for request in slow_stub.requests}
+    assert len(warm_ports) == 3
+    assert all(request["path"].endswith("/models") for request in slow_stub.requests)
+
+    session.generate_text("Hi")
+    assert slow_stub.requests[-1]["client_port"] in warm_ports
+
+
+def test_awarmup_opens_connections(slow_stub):
+    async def main():
+        session = sm.Session(llm_provider="ollama", llm_model="stub")
+        await session.awarmup(connections=3)
+
+    asyncio.run(main())
+
+    assert len({request["client_port"] for request in slow_stub.requests}) == 3
+
+
+def test_warmup_validates_credentials(monkeypatch):
+    import anthropic
+
+    with StubServer(api_key="good") as stub:
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+
+        Anthropic(api_key="good").warmup(validate=True)
+        Anthropic(api_key="bad").warmup()
+
+        with pytest.raises(anthropic.AuthenticationError):
+            Anthropic(api_key="bad").warmup(validate=True)
+
+
+def test_warmup_without_ping():
+    class Pingless(Anthropic):
+        # The defaults of providers that cannot be pinged.
+        ping = BaseProvider.ping
+        aping = BaseProvider.aping
+
+    provider = Pingless(api_key="unused")
+    provider.warmup(connections=2)
+    provider.warmup(validate=True)
+    asyncio.run(provider.awarmup(validate=True))
+
+    assert "client" in provider.__dict__